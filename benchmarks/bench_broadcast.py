@@ -0,0 +1,54 @@
+"""Benchmark: adding a bias row to a batch, expanded vs broadcast.
+
+Usage:
+    python benchmarks/bench_broadcast.py [--batch 512] [--features 256]
+
+"expanded" builds the full batch x features bias matrix and calls
+Matrix.add, as was needed before operators supported broadcasting.
+"broadcast" is X + b, which reuses the single bias row for every row, and
+"in place" is H += b on an existing activation buffer. Reported: best time
+and tracemalloc peak above the starting point.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import peak_memory, time_call
+from src.math.matrix import Matrix
+from src.random import Sampler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=512)
+    parser.add_argument("--features", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    X = sampler.normal_(Matrix(args.batch, args.features))
+    b = sampler.normal_(Matrix(1, args.features))
+    H = X.copy()
+
+    def expanded():
+        return Matrix.add(X, Matrix.from_rows([b.to_rows()[0]] * args.batch))
+
+    def broadcast():
+        return X + b
+
+    def in_place():
+        H.__iadd__(b)
+
+    assert expanded().to_rows() == broadcast().to_rows()
+    matrix_bytes = args.batch * args.features * 8
+    print(f"one {args.batch}x{args.features} matrix: {matrix_bytes / 1024:.1f} KiB")
+    for name, fn in (("expanded", expanded), ("broadcast", broadcast), ("in place", in_place)):
+        seconds, peak = time_call(fn, args.repeat), peak_memory(fn)
+        print(f"{name:<10} {seconds:8.4f}s  peak {peak / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
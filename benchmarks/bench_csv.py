@@ -0,0 +1,74 @@
+"""Benchmark: CSV ingestion throughput in MB/s.
+
+Usage:
+    python benchmarks/bench_csv.py [--rows 200000] [--cols 20] [--workers 1 2 4]
+
+Writes a temporary CSV of random numbers and reads it back with
+- the csv module + ``Matrix.set_val_at`` per cell (the old way; limited to
+  --legacy-rows rows, reported as MB/s over the part it read),
+- ``Matrix.from_csv`` for each worker count,
+- ``Matrix.from_csv`` keeping a quarter of the columns,
+- ``Matrix.iter_csv_batches`` streaming 4096-row batches.
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math import parallel
+from src.math.matrix import Matrix
+
+
+def legacy_read(path: str, rows: int, cols: int) -> Matrix:
+    m = Matrix(rows, cols)
+    with open(path, newline="") as fh:
+        for i, row in enumerate(csv.reader(fh)):
+            if i == rows:
+                break
+            for j, field in enumerate(row):
+                m.set_val_at(i, j, float(field))
+    return m
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--legacy-rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        with open(path, "w") as fh:
+            for _ in range(args.rows):
+                fh.write(",".join(f"{rng.uniform(-100, 100):.6f}" for _ in range(args.cols)) + "\n")
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{args.rows} rows x {args.cols} cols, {size_mb:.1f} MB")
+
+        legacy_rows = min(args.legacy_rows, args.rows)
+        t = time_call(lambda: legacy_read(path, legacy_rows, args.cols), 1)
+        print(f"{'csv + set_val_at':<28} {size_mb * legacy_rows / args.rows / t:8.1f} MB/s")
+
+        for workers in args.workers:
+            t = time_call(lambda: Matrix.from_csv(path, workers=workers), 1)
+            print(f"{f'from_csv workers={workers}':<28} {size_mb / t:8.1f} MB/s")
+        parallel.shutdown()
+
+        keep = list(range(0, args.cols, 4))
+        t = time_call(lambda: Matrix.from_csv(path, columns=keep), 1)
+        print(f"{f'from_csv {len(keep)} columns':<28} {size_mb / t:8.1f} MB/s")
+
+        t = time_call(lambda: sum(1 for _ in Matrix.iter_csv_batches(path, 4096)), 1)
+        print(f"{'iter_csv_batches 4096':<28} {size_mb / t:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
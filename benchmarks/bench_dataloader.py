@@ -0,0 +1,72 @@
+"""Benchmark: mini-batch assembly and prefetching with DataLoader.
+
+Usage:
+    python benchmarks/bench_dataloader.py [--rows 20000] [--cols 64] [--batch-size 128]
+
+Reports the time to assemble one epoch of shuffled batches with a
+per-element ``set_val_at`` loop versus ``DataLoader`` (row slices), then the
+time of an epoch of train-like steps (batch @ W) with and without prefetching.
+Prefetching overlaps batch assembly with the step only where the step
+releases the GIL (I/O, native code) or spare cores exist; with pure-Python
+math on one core the two figures are expected to be close.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.data import DataLoader, MatrixDataset
+from src.math.matrix import Matrix
+from src.random import Sampler
+
+
+def loop_batches(X: Matrix, loader: DataLoader):
+    for indices in loader.batch_indices():
+        batch = Matrix(len(indices), X.cols)
+        for r, i in enumerate(indices):
+            for j in range(X.cols):
+                batch.set_val_at(r, j, X.get_val_at(i, j))
+        yield batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--prefetch", type=int, default=4)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    X = sampler.normal_(Matrix(args.rows, args.cols))
+    W = sampler.normal_(Matrix(args.cols, 16))
+    dataset = MatrixDataset(X)
+
+    def drain(batches) -> None:
+        for _ in batches:
+            pass
+
+    def train(batches) -> None:
+        for batch in batches:
+            Matrix.multiply(batch, W)
+
+    loader = DataLoader(dataset, args.batch_size, shuffle=True, prefetch=0, seed=0)
+    t_loop = time_call(lambda: drain(loop_batches(X, loader)), 1)
+    t_gather = time_call(lambda: drain(loader), 1)
+    print(f"Assembly, one epoch of {len(loader)} batches:")
+    print(f"  set_val_at loop  {t_loop:8.3f}s")
+    print(f"  DataLoader       {t_gather:8.3f}s  ({t_loop / t_gather:.1f}x)")
+
+    prefetching = DataLoader(dataset, args.batch_size, shuffle=True, prefetch=args.prefetch, seed=0)
+    t_sync = time_call(lambda: train(loader), 1)
+    t_prefetch = time_call(lambda: train(prefetching), 1)
+    print("Training-style epoch (batch @ W):")
+    print(f"  prefetch=0       {t_sync:8.3f}s")
+    print(f"  prefetch={args.prefetch:<8}{t_prefetch:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
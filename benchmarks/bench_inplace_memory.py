@@ -0,0 +1,75 @@
+"""Memory benchmark: allocating vs in-place Matrix updates in an SGD-style loop.
+
+Usage:
+    python benchmarks/bench_inplace_memory.py [--size 256] [--steps 50]
+
+Each step applies ``W <- W - lr * G``. The allocating variant uses
+``Matrix.add(W, Matrix.scalar_multiply(G, -lr))``; the in-place variants reuse
+W's buffer. Reported per step: tracemalloc peak above the starting point and
+the net change in live memory blocks (``sys.getallocatedblocks``).
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import peak_memory
+from src.math.matrix import Matrix
+
+
+def measure(step, steps: int):
+    step()  # warm up caches and interned objects
+
+    # Live block counts are taken without tracemalloc running, since its own
+    # traceback tables grow while tracing.
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(steps):
+        step()
+    gc.collect()
+    blocks_per_step = (sys.getallocatedblocks() - blocks_before) / steps
+
+    peak_above = max(peak_memory(step) for _ in range(steps))
+    return peak_above, blocks_per_step
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    n = args.size
+    lr = 0.01
+    grad = Matrix.from_buffer([random.random() for _ in range(n * n)], n, n)
+    state = {"w": Matrix.full(n, n, 1.0)}
+    scratch = Matrix(n, n)
+
+    def allocating():
+        state["w"] = Matrix.add(state["w"], Matrix.scalar_multiply(grad, -lr))
+
+    def add_alpha():
+        state["w"].add_(grad, alpha=-lr)
+
+    def out_buffers():
+        w = state["w"]
+        Matrix.scalar_multiply(grad, lr, out=scratch)
+        w -= scratch
+
+    matrix_bytes = n * n * 8
+    print(f"{n}x{n} matrix = {matrix_bytes / 1024:.0f} KiB")
+    print(f"{'variant':>24} {'peak KiB/step':>14} {'net blocks/step':>16}")
+    for name, step in (("Matrix.add(scalar_mul)", allocating),
+                       ("W.add_(G, alpha)", add_alpha),
+                       ("scalar_mul(out=) + -=", out_buffers)):
+        peak, blocks = measure(step, args.steps)
+        print(f"{name:>24} {peak / 1024:14.1f} {blocks:16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark: eager vs lazy (fused) evaluation of a dense layer's forward pass.
+
+Usage:
+    python benchmarks/bench_lazy.py [--batch 256] [--inputs 64] [--outputs 256]
+
+Computes relu(0.5 * (X @ W + b)). The eager version materializes the
+product, the biased sum, the scaled sum and the activation, and needs b
+expanded to a full matrix; the lazy version runs one matmul and one fused
+pass that writes in place into the product's buffer. The element-wise chain
+alone, relu(0.5 * (H + b)) for a precomputed H, is reported separately since
+the matmul dominates the full layer. Reported: best time and tracemalloc
+peak above the starting point.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import peak_memory, time_call
+from src.math.activation_functions import ActivationFunctions
+from src.math.lazy import lazy
+from src.math.matrix import Matrix
+from src.random import Sampler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--inputs", type=int, default=64)
+    parser.add_argument("--outputs", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    X = sampler.normal_(Matrix(args.batch, args.inputs))
+    W = sampler.normal_(Matrix(args.inputs, args.outputs))
+    b = sampler.normal_(Matrix(1, args.outputs))
+    B = Matrix.from_rows([b.to_rows()[0]] * args.batch)
+
+    def eager():
+        h = Matrix.add(Matrix.multiply(X, W), B)
+        return ActivationFunctions.relu(Matrix.scalar_multiply(h, 0.5))
+
+    def fused():
+        return ((lazy(X) @ W + b) * 0.5).relu().eval()
+
+    H = Matrix.multiply(X, W)
+
+    def eager_chain():
+        return ActivationFunctions.relu(Matrix.scalar_multiply(Matrix.add(H, B), 0.5))
+
+    def fused_chain():
+        return ((lazy(H) + b) * 0.5).relu().eval()
+
+    assert eager().to_rows() == fused().to_rows()
+    assert eager_chain().to_rows() == fused_chain().to_rows()
+    print(f"plan: {((lazy(X) @ W + b) * 0.5).relu().plan()}")
+    cases = (("layer, eager", eager), ("layer, lazy", fused),
+             ("chain, eager", eager_chain), ("chain, lazy", fused_chain))
+    for name, fn in cases:
+        seconds, peak = time_call(fn, args.repeat), peak_memory(fn)
+        print(f"{name:<13} {seconds:8.4f}s  peak {peak / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
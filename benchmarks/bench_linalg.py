@@ -0,0 +1,65 @@
+"""Benchmark: factorization and solve times for src.math.linalg.
+
+Usage:
+    python benchmarks/bench_linalg.py [--sizes 64 128 256] [--repeat 1]
+
+For each n x n size: blocked LU against the same elimination done as one
+panel (linalg.BLOCK = n, i.e. unblocked), Cholesky and QR factorization, and
+a single-column solve with a cold cache (factor + solve) against a warm one
+(contents check + triangular solves only).
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math import linalg
+from src.math.matrix import Matrix
+from src.random import Sampler
+
+
+def unblocked_lu(a: Matrix) -> None:
+    saved = linalg.BLOCK
+    linalg.BLOCK = max(a.rows, 1)
+    try:
+        linalg.LU(a)
+    finally:
+        linalg.BLOCK = saved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    print(f"{'size':>6} {'LU':>8} {'LU 1-panel':>11} {'Cholesky':>9} {'QR':>8}"
+          f" {'solve cold':>11} {'solve warm':>11}")
+    for n in args.sizes:
+        a = sampler.normal_(Matrix(n, n))
+        spd = a @ a.T
+        for i in range(n):
+            spd.set_val_at(i, i, spd.get_val_at(i, i) + n)
+        b = sampler.normal_(Matrix(n, 1))
+
+        lu_s = time_call(lambda: linalg.LU(a), args.repeat)
+        unblocked_s = time_call(lambda: unblocked_lu(a), args.repeat)
+        cholesky_s = time_call(lambda: linalg.Cholesky(spd), args.repeat)
+        qr_s = time_call(lambda: linalg.QR(a), args.repeat)
+
+        def cold():
+            linalg.clear_cache()
+            linalg.solve(a, b)
+        cold_s = time_call(cold, args.repeat)
+        linalg.solve(a, b)
+        warm_s = time_call(lambda: linalg.solve(a, b), max(args.repeat, 3))
+        print(f"{n:>6} {lu_s:>8.3f} {unblocked_s:>11.3f} {cholesky_s:>9.3f} {qr_s:>8.3f}"
+              f" {cold_s:>11.4f} {warm_s:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark the Matrix.multiply kernels against the original triple loop.
+
+Usage:
+    python benchmarks/bench_matmul.py [--sizes 64 256 512] [--repeat 3]
+
+The "legacy" column is the original implementation (i-j-k loop with
+bounds-checked ``get_val_at``/``set_val_at`` per element), reproduced here so
+the comparison stays meaningful after Matrix.multiply was rewritten.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math import kernels
+from src.math.matrix import Matrix
+
+
+def legacy_multiply(m1: Matrix, m2: Matrix) -> Matrix:
+    """The pre-kernel Matrix.multiply, kept verbatim for comparison."""
+    result = Matrix(m1.get_rows(), m2.get_cols())
+    for i in range(m1.get_rows()):
+        for j in range(m2.get_cols()):
+            res = 0
+            for k in range(m2.get_rows()):
+                res += m1.get_val_at(i, k) * m2.get_val_at(k, j)
+            result.set_val_at(i, j, res)
+    return result
+
+
+def random_matrix(n: int, m: int) -> Matrix:
+    return Matrix.from_buffer([random.random() for _ in range(n * m)], n, m)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 512])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-max", type=int, default=512,
+                        help="skip the (slow) legacy loop above this size")
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"{'size':>6} {'kernel':>8} {'legacy s':>10} {'kernel s':>10} {'speedup':>8}")
+    for n in args.sizes:
+        a = random_matrix(n, n)
+        b = random_matrix(n, n)
+        legacy = None
+        if n <= args.legacy_max:
+            legacy = time_call(lambda: legacy_multiply(a, b), 1)
+        name = kernels.select_kernel(n, n, n)
+        fast = time_call(lambda: Matrix.multiply(a, b), args.repeat)
+        legacy_col = f"{legacy:10.4f}" if legacy is not None else f"{'-':>10}"
+        speedup_col = f"{legacy / fast:7.1f}x" if legacy is not None else f"{'-':>8}"
+        print(f"{n:>6} {name:>8} {legacy_col} {fast:10.4f} {speedup_col}")
+
+    # Shape dispatch on a tall-skinny product
+    a = random_matrix(4096, 128)
+    b = random_matrix(128, 8)
+    name = kernels.select_kernel(4096, 128, 8)
+    for kernel in ("blocked", name):
+        elapsed = time_call(lambda: Matrix.multiply(a, b, kernel=kernel), args.repeat)
+        print(f"4096x128 @ 128x8 {kernel:>8}: {elapsed:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: optimizer update throughput in parameters per second.
+
+Usage:
+    python benchmarks/bench_optim.py [--params 1000000] [--layers 4]
+
+The baseline is the update the old API allowed, one
+``Matrix.add(W, Matrix.scalar_multiply(grad, -lr))`` per parameter matrix,
+over ``--layers`` square matrices holding ``--params`` values in total. Each
+optimizer updates the same number of values in one flat buffer; "+clip"
+adds clipping by global norm. Reported: best time per step, parameters per
+second and tracemalloc peak above the starting point.
+"""
+
+import argparse
+import math
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import peak_memory, time_call
+from src.math.matrix import Matrix
+from src.optim import SGD, Adam, AdamW, RMSProp
+from src.random import Sampler
+
+LR = 1e-3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--params", type=int, default=1_000_000)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    side = int(math.sqrt(args.params / args.layers))
+    count = side * side * args.layers
+    weights = [sampler.normal_(Matrix(side, side)) for _ in range(args.layers)]
+    grads = [sampler.normal_(Matrix(side, side)) for _ in range(args.layers)]
+
+    def baseline():
+        for i, (w, g) in enumerate(zip(weights, grads)):
+            weights[i] = Matrix.add(w, Matrix.scalar_multiply(g, -LR))
+
+    params = sampler.normal_(Matrix(1, count))
+    flat_grads = sampler.normal_(Matrix(1, count))
+    cases = [("matrix ops", baseline)]
+    for name, optimizer in (("SGD", SGD(params, flat_grads, lr=LR)),
+                            ("SGD+momentum", SGD(params, flat_grads, lr=LR, momentum=0.9)),
+                            ("SGD+nesterov", SGD(params, flat_grads, lr=LR, momentum=0.9, nesterov=True)),
+                            ("Adam", Adam(params, flat_grads, lr=LR)),
+                            ("Adam+clip", Adam(params, flat_grads, lr=LR, max_grad_norm=1.0)),
+                            ("AdamW", AdamW(params, flat_grads, lr=LR)),
+                            ("RMSProp", RMSProp(params, flat_grads, lr=LR))):
+        cases.append((name, optimizer.step))
+
+    print(f"{count} parameters")
+    for name, fn in cases:
+        seconds, peak = time_call(fn, args.repeat), peak_memory(fn)
+        print(f"{name:<13} {seconds * 1000:9.1f} ms  {count / seconds / 1e6:7.2f} M params/s  "
+              f"peak {peak / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
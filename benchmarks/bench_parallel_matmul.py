@@ -0,0 +1,49 @@
+"""Scaling benchmark for process-parallel Matrix.multiply.
+
+Usage:
+    python benchmarks/bench_parallel_matmul.py [--sizes 256 512] [--workers 1 2 4 8]
+
+Speedups are relative to the serial (1 worker) run of the same size. Each
+worker count is warmed up once first so pool start-up isn't measured.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math import parallel
+from src.math.matrix import Matrix
+
+
+def random_matrix(n: int, m: int) -> Matrix:
+    return Matrix.from_buffer([random.random() for _ in range(n * m)], n, m)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 512])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"cpu count: {os.cpu_count()}")
+    print(f"{'size':>6} {'workers':>8} {'seconds':>10} {'speedup':>8}")
+    for n in args.sizes:
+        a = random_matrix(n, n)
+        b = random_matrix(n, n)
+        serial = None
+        for workers in args.workers:
+            best = time_call(lambda: Matrix.multiply(a, b, workers=workers), args.repeat)
+            if serial is None:
+                serial = best
+            print(f"{n:>6} {workers:>8} {best:10.4f} {serial / best:7.2f}x")
+    parallel.shutdown()
+
+
+if __name__ == "__main__":
+    main()
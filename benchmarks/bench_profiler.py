@@ -0,0 +1,65 @@
+"""Benchmark: cost of the profiler when disabled, enabled, and tracking memory.
+
+Usage:
+    python benchmarks/bench_profiler.py [--size 4] [--calls 20000]
+
+Times a loop of small operations (where per-call overhead shows the most):
+a matrix add, a matrix multiply and a short Value graph backward. "never
+enabled" runs before any profiler exists; "disabled" runs after a profiler
+has been enabled and disabled again, and should match it, since disabling
+restores the original functions. Reported: ns per loop iteration and the
+ratio to the never-enabled run.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.autograd import Value
+from src.bench.runner import time_call
+from src.math.matrix import Matrix
+from src.profiler import HOT_PATHS, Profiler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    a = Matrix.full(args.size, args.size, 1.0)
+    x = Value(0.5)
+    graph = (x * x + x).tanh().backward()
+
+    def loop():
+        for _ in range(args.calls):
+            Matrix.add(a, a)
+            Matrix.multiply(a, a)
+            graph.backward()
+
+    originals = [vars(owner)[attribute] for owner, attribute, _ in HOT_PATHS]
+    never = time_call(loop, args.repeat)
+    with Profiler():
+        loop()
+    assert [vars(owner)[attribute] for owner, attribute, _ in HOT_PATHS] == originals
+    disabled = time_call(loop, args.repeat)
+
+    def profiled(**options):
+        def run():
+            with Profiler(**options):
+                loop()
+        return run
+
+    cases = (("never enabled", never), ("disabled", disabled),
+             ("enabled", time_call(profiled(), args.repeat)),
+             ("enabled, no trace", time_call(profiled(trace=False), args.repeat)),
+             ("enabled, memory", time_call(profiled(memory=True), max(1, args.repeat // 2))))
+    for name, seconds in cases:
+        print(f"{name:<18} {seconds * 1e9 / args.calls:10.0f} ns/iteration  {seconds / never:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: inference memory, time and error for float64, float32 and int8 weights.
+
+Usage:
+    python benchmarks/bench_quantize.py [--inputs 512] [--hidden 256] [--outputs 10] [--batch 32]
+
+The model is a two-layer ReLU MLP, ``relu(x @ W1) @ W2``, with Gaussian
+weights. Each variant stores the same weights as float64 matrices, float32
+matrices, or int8 QuantizedMatrix values with one scale per output column.
+Reported: bytes held by the weights and the ratio to float64, best time
+per batch, the largest output error relative to the largest float64 output,
+and how often the argmax of each output row agrees with float64.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math import ActivationFunctions, Matrix, QuantizedMatrix
+from src.random.sampler import Sampler
+
+
+def weight_bytes(w) -> int:
+    if isinstance(w, QuantizedMatrix):
+        return w.nbytes
+    return len(w.data) * w.data.itemsize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inputs", type=int, default=512)
+    parser.add_argument("--hidden", type=int, default=256)
+    parser.add_argument("--outputs", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sampler = Sampler(0)
+    w1 = sampler.normal_(Matrix(args.inputs, args.hidden), std=args.inputs ** -0.5)
+    w2 = sampler.normal_(Matrix(args.hidden, args.outputs), std=args.hidden ** -0.5)
+    x = sampler.normal_(Matrix(args.batch, args.inputs))
+
+    variants = (("float64", (w1, w2), x),
+                ("float32", (w1.astype("float32"), w2.astype("float32")), x.astype("float32")),
+                ("int8", (QuantizedMatrix.quantize(w1), QuantizedMatrix.quantize(w2)), x))
+
+    def forward(weights, inputs):
+        hidden = ActivationFunctions.relu(inputs @ weights[0], inplace=True)
+        return hidden @ weights[1]
+
+    reference = forward(*variants[0][1:]).to_rows()
+    top = max(abs(v) for row in reference for v in row)
+    base_bytes = sum(map(weight_bytes, variants[0][1]))
+    for name, weights, inputs in variants:
+        rows = forward(weights, inputs).to_rows()
+        error = max(abs(a - b) for r, s in zip(rows, reference) for a, b in zip(r, s)) / top
+        agree = sum(r.index(max(r)) == s.index(max(s)) for r, s in zip(rows, reference)) / len(rows)
+        nbytes = sum(map(weight_bytes, weights))
+        seconds = time_call(lambda: forward(weights, inputs), args.repeat)
+        print(f"{name:<8} {nbytes / 1024:9.1f} KiB  {base_bytes / nbytes:5.2f}x smaller  "
+              f"{seconds * 1000:8.2f} ms/batch  max rel error {error:.1e}  argmax agree {agree:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: bulk Sampler fills vs per-element loops on the global random state.
+
+Usage:
+    python benchmarks/bench_sampler.py [--sizes 64 256 512] [--repeat 3]
+
+The per-element baseline is how weights were initialized before the Sampler
+existed: ``m.set_val_at(i, j, random.uniform(...))`` (or ``random.gauss``)
+for every element.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math.matrix import Matrix
+from src.random import Sampler
+
+
+def loop_fill(m: Matrix, draw) -> None:
+    for i in range(m.rows):
+        for j in range(m.cols):
+            m.set_val_at(i, j, draw())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 512])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    print(f"{'size':>6} {'dist':>9} {'loop (s)':>10} {'bulk (s)':>10} {'speedup':>8}")
+    for n in args.sizes:
+        m = Matrix(n, n)
+        cases = [
+            ("uniform", lambda: loop_fill(m, lambda: random.uniform(-1.0, 1.0)),
+             lambda: sampler.uniform_(m, -1.0, 1.0)),
+            ("normal", lambda: loop_fill(m, lambda: random.gauss(0.0, 1.0)),
+             lambda: sampler.normal_(m)),
+            ("bernoulli", lambda: loop_fill(m, lambda: 1.0 if random.random() < 0.5 else 0.0),
+             lambda: sampler.bernoulli_(m, 0.5)),
+        ]
+        for name, loop, bulk in cases:
+            t_loop = time_call(loop, args.repeat)
+            t_bulk = time_call(bulk, args.repeat)
+            print(f"{n:>6} {name:>9} {t_loop:>10.4f} {t_bulk:>10.4f} {t_loop / t_bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
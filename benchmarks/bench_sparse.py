@@ -0,0 +1,49 @@
+"""Benchmark: SparseMatrix vs dense Matrix for mostly-zero feature matrices.
+
+Usage:
+    python benchmarks/bench_sparse.py [--rows 400] [--features 2000] [--hidden 16]
+                                      [--density 0.01 0.05]
+
+Features are random with the given fraction of non-zeros (one-hot /
+bag-of-words style). Reported: storage size, the forward product X @ W and
+the weight-gradient product X.T @ dY, dense vs sparse.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math.matrix import Matrix
+from src.math.sparse import SparseMatrix
+from src.random import Sampler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--features", type=int, default=2000)
+    parser.add_argument("--hidden", type=int, default=16)
+    parser.add_argument("--density", type=float, nargs="+", default=[0.01, 0.05])
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    W = sampler.normal_(Matrix(args.features, args.hidden))
+    dY = sampler.normal_(Matrix(args.rows, args.hidden))
+    print(f"{'density':>8} {'dense KiB':>10} {'sparse KiB':>11} {'X@W dense':>10} {'X@W sparse':>11} "
+          f"{'X.T@dY dense':>13} {'X.T@dY sparse':>14}")
+    for density in args.density:
+        X = sampler.bernoulli_(Matrix(args.rows, args.features), density)
+        X_sparse = SparseMatrix.from_dense(X)
+        t_dense = time_call(lambda: Matrix.multiply(X, W), 1)
+        t_sparse = time_call(lambda: SparseMatrix.multiply(X_sparse, W), 1)
+        t_dense_t = time_call(lambda: Matrix.multiply(X.T, dY), 1)
+        t_sparse_t = time_call(lambda: SparseMatrix.transpose_multiply(X_sparse, dY), 1)
+        print(f"{density:>8.3f} {len(X.data) * 8 / 1024:>10.1f} {X_sparse.nbytes() / 1024:>11.1f} "
+              f"{t_dense:>9.3f}s {t_sparse:>10.3f}s {t_dense_t:>12.3f}s {t_sparse_t:>13.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark: Strassen vs the blocked kernel, to find the crossover size.
+
+Usage:
+    python benchmarks/bench_strassen.py [--sizes 128 192 256 384 512] [--repeat 1]
+
+For each square size n the blocked kernel is timed against one level of
+Strassen (7 half-size blocked products plus the block additions) and against
+the full recursive kernel at the current kernels.STRASSEN_CUTOFF. The
+crossover is the smallest size from which one level of Strassen wins at
+every larger measured size; the largest size below it is the suggested
+STRASSEN_CUTOFF, since splitting anything bigger pays off.
+
+Numerical error of the one-level result is measured against the naive
+triple loop on a sample of output rows (the naive kernel on all rows would dominate the run): the
+largest absolute difference, and that difference relative to the largest
+reference value.
+"""
+
+import argparse
+import os
+import random
+import sys
+from array import array
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench.runner import time_call
+from src.math import kernels
+
+
+def strassen(a, b, out, n: int, cutoff: int) -> None:
+    saved = kernels.STRASSEN_CUTOFF
+    kernels.STRASSEN_CUTOFF = cutoff
+    try:
+        kernels.matmul_strassen(a, b, out, n, n, n)
+    finally:
+        kernels.STRASSEN_CUTOFF = saved
+
+
+def error_vs_naive(a, b, result, n: int, sample_rows: int):
+    """Max absolute and relative error of result against naive, on sampled rows."""
+    rows = sorted(random.sample(range(n), min(sample_rows, n)))
+    worst = scale = 0.0
+    for i in rows:
+        ref = array('d', [0.0]) * n
+        kernels.matmul_naive(a[i * n:(i + 1) * n], b, ref, 1, n, n)
+        worst = max(worst, max(abs(x - y) for x, y in zip(ref, result[i * n:(i + 1) * n])))
+        scale = max(scale, max(map(abs, ref)))
+    return worst, worst / scale if scale else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 192, 256, 384, 512])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--sample-rows", type=int, default=8,
+                        help="output rows checked against the naive kernel")
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"STRASSEN_CUTOFF = {kernels.STRASSEN_CUTOFF}")
+    print(f"{'size':>6} {'blocked s':>10} {'1-level s':>10} {'speedup':>8} {'recursive s':>12}"
+          f" {'max abs err':>12} {'rel err':>9}")
+    wins = []
+    for n in args.sizes:
+        a = array('d', [random.uniform(-1, 1) for _ in range(n * n)])
+        b = array('d', [random.uniform(-1, 1) for _ in range(n * n)])
+        out = array('d', [0.0]) * (n * n)
+        blocked_s = time_call(lambda: kernels.matmul_blocked(a, b, out, n, n, n), args.repeat)
+        recursive_s = time_call(lambda: kernels.matmul_strassen(a, b, out, n, n, n), args.repeat)
+        one_level_s = time_call(lambda: strassen(a, b, out, n, (n + 1) // 2), args.repeat)
+        abs_err, rel_err = error_vs_naive(a, b, out, n, args.sample_rows)
+        wins.append((n, one_level_s < blocked_s))
+        print(f"{n:>6} {blocked_s:>10.3f} {one_level_s:>10.3f} {blocked_s / one_level_s:>7.2f}x"
+              f" {recursive_s:>12.3f} {abs_err:>12.2e} {rel_err:>9.1e}")
+
+    losing = [n for n, won in wins if not won]
+    crossover = next((n for n, _ in wins if all(won for m, won in wins if m >= n)), None)
+    if crossover is None:
+        print(f"no crossover: one level of Strassen is still slower at n = {wins[-1][0]}")
+    else:
+        print(f"crossover: one level of Strassen wins from n = {crossover}")
+        below = max((n for n in losing if n < crossover), default=None)
+        if below is not None:
+            print(f"suggested kernels.STRASSEN_CUTOFF = {below}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: nearest-neighbour scan with VectorBatch vs one Vector at a time.
+
+Usage:
+    python benchmarks/bench_vector_batch.py [--count 100000] [--dim 64] [--k 10]
+
+"legacy" is the original per-vector scan: a list of Vectors, cosine
+similarity from the get()-based dot_product and l2_norm loops (reproduced
+here so the comparison survives the rewrite of Vector), then a full sort.
+It is run on --legacy-count vectors and its rate extrapolated to --count.
+"batch" is VectorBatch.top_k: the first query computes and caches the norms,
+later queries only pay for the dot products and the k-element heap.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.math.matrix import Matrix
+from src.math.vector import Vector
+from src.math.vector_batch import VectorBatch
+from src.random import Sampler
+
+
+def legacy_dot(v1: Vector, v2: Vector) -> float:
+    result = 0.0
+    for i in range(v1.size()):
+        result += v1.get(i) * v2.get(i)
+    return result
+
+
+def legacy_norm(v: Vector) -> float:
+    sum_squares = 0.0
+    for i in range(v.size()):
+        sum_squares += v.get(i) ** 2
+    return math.sqrt(sum_squares)
+
+
+def legacy_top_k(vectors, query: Vector, k: int):
+    query_norm = legacy_norm(query)
+    scores = [(legacy_dot(v, query) / (legacy_norm(v) * query_norm), i) for i, v in enumerate(vectors)]
+    scores.sort(reverse=True)
+    return [i for _, i in scores[:k]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--legacy-count", type=int, default=5_000)
+    args = parser.parse_args()
+
+    sampler = Sampler(seed=0)
+    batch = VectorBatch.from_matrix(sampler.normal_(Matrix(args.count, args.dim)))
+    query = batch.get(0)
+
+    legacy_n = min(args.legacy_count, args.count)
+    vectors = [batch.get(i) for i in range(legacy_n)]
+    start = time.perf_counter()
+    expected = legacy_top_k(vectors, query, args.k)
+    legacy_s = (time.perf_counter() - start) * args.count / legacy_n
+
+    start = time.perf_counter()
+    batch.top_k(query, args.k)
+    first_s = time.perf_counter() - start
+    start = time.perf_counter()
+    batch.top_k(query, args.k)
+    cached_s = time.perf_counter() - start
+
+    small = VectorBatch.from_vectors(vectors)
+    assert [i for i, _ in small.top_k(query, args.k)] == expected
+
+    print(f"{args.count} vectors x {args.dim}, top {args.k}")
+    print(f"legacy (extrapolated)  {legacy_s:8.3f}s")
+    print(f"batch, first query     {first_s:8.3f}s  {legacy_s / first_s:6.1f}x")
+    print(f"batch, cached norms    {cached_s:8.3f}s  {legacy_s / cached_s:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,10 @@ setup(
     description="A from-scratch machine learning library for educational purposes",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    # Installed as the ``src`` package, matching the ``src.*`` imports used
+    # throughout (and the console script below)
+    packages=find_packages(include=["src", "src.*"]),
+    package_data={"src.bench": ["baseline.json"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Education",
@@ -29,6 +31,11 @@ setup(
     install_requires=[
         # No external dependencies - built from scratch!
     ],
+    entry_points={
+        "console_scripts": [
+            "ml-wheel-bench=src.bench.cli:main",
+        ],
+    },
     extras_require={
         "dev": [
             "pytest>=6.0",
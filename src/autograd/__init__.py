@@ -1,5 +1,7 @@
 """Automatic differentiation components."""
 
-from .computation_graph import ComputationGraph
+from .codegen import CompiledGraph, TracedFunction, trace
+from .computation_graph import ComputationGraph, Value
+from .tensor import Tensor
 
-__all__ = ["ComputationGraph"]
\ No newline at end of file
+__all__ = ["ComputationGraph", "Value", "Tensor", "CompiledGraph", "TracedFunction", "trace"]
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""Trace-and-compile for Value graphs.
+
+A Value graph is captured once and turned into straight-line Python
+source: one assignment per node for the forward pass, then one gradient
+expression per edge in reverse topological order. The source is compiled
+with ``compile``/``exec``, so replaying it builds no Value nodes, calls no
+closures and sorts nothing; every intermediate is a local float.
+
+Tracing records the ops of one run, so the graph must not depend on the
+input values: a branch taken on ``x.data`` during tracing is baked in, as
+are the values of any leaf that isn't an input.
+
+Example:
+    @trace
+    def loss(w, x, y):
+        pred = sum((wi * xi for wi, xi in zip(w, x)), Value(0.0))
+        return (pred - y) ** 2
+
+    value, (dw, dx, dy) = loss.value_and_grad([0.5, -1.0], [1.0, 2.0], 3.0)
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .computation_graph import Value, topological_order
+
+Nested = Union[float, Sequence[Any]]
+# Nesting of a traced argument: None for a number, otherwise one entry per item
+Structure = Optional[Tuple[Any, ...]]
+
+
+def _literal(x: float) -> str:
+    """Python source for a constant, including inf and nan.
+
+    Negative values are parenthesized so ``-2.0 ** x`` can't bind as
+    ``-(2.0 ** x)``.
+    """
+    if isinstance(x, float) and not math.isfinite(x):
+        return f"float('{x}')"
+    return f"({x!r})" if x < 0 else repr(x)
+
+
+# Forward expression for each op, over the source names of its inputs
+_FORWARD_SOURCE: Dict[str, Callable[..., str]] = {
+    '+': lambda a, b: f"{a} + {b}",
+    '*': lambda a, b: f"{a} * {b}",
+    '**': lambda a, b: f"{a} ** {b}",
+    'ReLU': lambda a: f"0.0 if {a} < 0 else {a}",
+    'tanh': lambda a: f"tanh({a})",
+    'exp': lambda a: f"exp({a})",
+    'log': lambda a: f"log({a})",
+}
+
+
+def _gradient_terms(op: str, out: str, g: str, args: List[str]) -> List[str]:
+    """Contribution of out's gradient g to each input, matching Value's backward rules."""
+    if op == '+':
+        return [g, g]
+    if op == '*':
+        a, b = args
+        return [f"{b} * {g}", f"{a} * {g}"]
+    if op == '**':
+        a, b = args
+        # d(a**b)/db is only defined for a positive base
+        return [f"{b} * {a} ** ({b} - 1) * {g}", f"({out} * log({a}) * {g} if {a} > 0 else 0.0)"]
+    a = args[0]
+    if op == 'ReLU':
+        return [f"({g} if {a} > 0 else 0.0)"]
+    if op == 'tanh':
+        return [f"(1.0 - {out} * {out}) * {g}"]
+    if op == 'exp':
+        return [f"{out} * {g}"]
+    if op == 'log':
+        return [f"{g} / {a}"]
+    raise ValueError(f"Cannot compile op '{op}'")
+
+
+class CompiledGraph:
+    """Generated forward and backward code for the graph behind one Value.
+
+    ``forward(values)`` and ``value_and_grad(values)`` take one number per
+    input leaf, in the order given at construction. The generated source is
+    kept in ``source`` for inspection.
+    """
+
+    def __init__(self, root: Value, inputs: Sequence[Value]) -> None:
+        """Generate and compile code for root as a function of inputs.
+
+        Args:
+            root: Output node
+            inputs: Leaves whose values are passed on every call; every
+                other leaf is compiled in as a constant
+
+        Raises:
+            ValueError: If an input is repeated or isn't a leaf, or the graph
+                uses an op that can't be compiled
+        """
+        position = {id(leaf): i for i, leaf in enumerate(inputs)}
+        if len(position) != len(inputs):
+            raise ValueError("Compiled graph inputs must be distinct Values")
+        if any(leaf._prev for leaf in inputs):
+            raise ValueError("Compiled graph inputs must be leaves")
+        order = topological_order(root)
+        self.num_inputs = len(inputs)
+        self.num_nodes = len(order)
+
+        names: Dict[int, str] = {}
+        forward: List[str] = []
+        # Nodes downstream of an input: the only ones that need a gradient
+        needs_grad = set()
+        for k, node in enumerate(order):
+            key = id(node)
+            if key in position:
+                names[key] = f"v{k}"
+                forward.append(f"v{k} = x[{position[key]}]")
+                needs_grad.add(key)
+            elif not node._prev:
+                names[key] = _literal(node.data)
+            else:
+                if node._op not in _FORWARD_SOURCE:
+                    raise ValueError(f"Cannot compile op '{node._op}'")
+                names[key] = f"v{k}"
+                args = [names[id(child)] for child in node._prev]
+                forward.append(f"v{k} = {_FORWARD_SOURCE[node._op](*args)}")
+                if any(id(child) in needs_grad for child in node._prev):
+                    needs_grad.add(key)
+
+        backward: List[str] = []
+        grads: Dict[int, str] = {}
+        if id(root) in needs_grad:
+            grads[id(root)] = "g"
+            for node in reversed(order):
+                key = id(node)
+                if not node._prev or key not in needs_grad or key not in grads:
+                    continue
+                args = [names[id(child)] for child in node._prev]
+                terms = _gradient_terms(node._op, names[key], grads[key], args)
+                for child, term in zip(node._prev, terms):
+                    child_key = id(child)
+                    if child_key not in needs_grad:
+                        continue
+                    if child_key in grads:
+                        backward.append(f"{grads[child_key]} += {term}")
+                    else:
+                        grads[child_key] = f"g{names[child_key][1:]}"
+                        backward.append(f"{grads[child_key]} = {term}")
+        input_grads = ", ".join(grads.get(id(leaf), "0.0") for leaf in inputs)
+        result = names[id(root)]
+
+        lines = ["def forward(x):"]
+        lines += [f"    {line}" for line in forward]
+        lines += [f"    return {result}", "", "def value_and_grad(x, g=1.0):"]
+        lines += [f"    {line}" for line in forward + backward]
+        lines.append(f"    return {result}, [{input_grads}]")
+        self.source = "\n".join(lines) + "\n"
+        namespace: Dict[str, Any] = {"tanh": math.tanh, "exp": math.exp, "log": math.log}
+        exec(compile(self.source, f"<compiled graph of {len(order)} nodes>", "exec"), namespace)
+        self._forward = namespace["forward"]
+        self._value_and_grad = namespace["value_and_grad"]
+
+    def _check(self, values: Sequence[float]) -> None:
+        if len(values) != self.num_inputs:
+            raise ValueError(f"Compiled graph takes {self.num_inputs} inputs, got {len(values)}")
+
+    def forward(self, values: Sequence[float]) -> float:
+        """The root's value for the given input values.
+
+        Raises:
+            ValueError: If the number of values doesn't match the inputs
+        """
+        self._check(values)
+        return self._forward(values)
+
+    def value_and_grad(self, values: Sequence[float], grad: float = 1.0) -> Tuple[float, List[float]]:
+        """The root's value and its gradient with respect to every input.
+
+        Args:
+            values: One number per input
+            grad: Gradient of the final objective with respect to the root
+
+        Raises:
+            ValueError: If the number of values doesn't match the inputs
+        """
+        self._check(values)
+        return self._value_and_grad(values, grad)
+
+
+def _flatten(arg: Nested, out: List[float]) -> Structure:
+    """Append the numbers in arg to out and return its nesting."""
+    if isinstance(arg, (int, float)):
+        out.append(arg)
+        return None
+    return tuple(_flatten(item, out) for item in arg)
+
+
+def _unflatten(structure: Structure, values: Iterable[Any]) -> Any:
+    """Rebuild a nested argument from its structure and a flat iterator."""
+    if structure is None:
+        return next(values)
+    return [_unflatten(item, values) for item in structure]
+
+
+class TracedFunction:
+    """A function of Values, compiled once per argument structure.
+
+    Call it with numbers or (nested) lists of numbers in place of Values.
+    The first call with a given structure (for example, lists of the same
+    lengths) traces the function on fresh leaves and compiles the graph;
+    later calls with that structure replay the compiled code.
+    """
+
+    def __init__(self, fn: Callable[..., Value]) -> None:
+        self.fn = fn
+        self._cache: Dict[Tuple[Structure, ...], CompiledGraph] = {}
+
+    def compiled(self, *args: Nested) -> CompiledGraph:
+        """The compiled graph for arguments shaped like args (traced if needed)."""
+        return self._lookup(args)[0]
+
+    def _lookup(self, args: Sequence[Nested]) -> Tuple[CompiledGraph, Tuple[Structure, ...], List[float]]:
+        flat: List[float] = []
+        structure = tuple(_flatten(arg, flat) for arg in args)
+        graph = self._cache.get(structure)
+        if graph is None:
+            leaves = [Value(v) for v in flat]
+            remaining = iter(leaves)
+            root = self.fn(*[_unflatten(s, remaining) for s in structure])
+            if not isinstance(root, Value):
+                raise TypeError(f"Traced function must return a Value, not {type(root).__name__}")
+            graph = self._cache[structure] = CompiledGraph(root, leaves)
+        return graph, structure, flat
+
+    def __call__(self, *args: Nested) -> float:
+        graph, _, flat = self._lookup(args)
+        return graph.forward(flat)
+
+    def value_and_grad(self, *args: Nested) -> Tuple[float, List[Any]]:
+        """The function's value and its gradient for every argument.
+
+        Returns:
+            (value, grads), with one entry in grads per argument, nested
+            like that argument
+        """
+        graph, structure, flat = self._lookup(args)
+        value, grads = graph.value_and_grad(flat)
+        flat_grads = iter(grads)
+        return value, [_unflatten(s, flat_grads) for s in structure]
+
+
+def trace(fn: Callable[..., Value]) -> TracedFunction:
+    """Wrap fn so it is traced and compiled per argument structure (usable as a decorator)."""
+    return TracedFunction(fn)
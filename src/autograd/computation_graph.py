@@ -1,59 +1,225 @@
 """Computation graph for automatic differentiation."""
 
+import math
+import operator
+from typing import Callable, Dict, List, Tuple, Union
+
+Number = Union[int, float]
+
+
+def _no_backward(out: 'Value') -> None:
+    pass
+
+
 class Value:
-    def __init__(self, data, _children=(), _op=''):
+    """A scalar node in a computation graph.
+
+    Every arithmetic operation on Values creates a new Value that remembers
+    its inputs (``_prev``), the operation name (``_op``) and a closure that
+    adds its contribution to the inputs' gradients. The closure is called with
+    the output node as its argument rather than capturing it, so there are no
+    reference cycles (graphs are freed by reference counting alone) and it
+    always sees the node's current data. ``__slots__`` keeps each node to a
+    few machine words instead of a per-instance dict.
+    """
+
+    __slots__ = ("data", "grad", "_backward", "_prev", "_op")
+
+    def __init__(self, data: Number, _children: Tuple['Value', ...] = (), _op: str = '') -> None:
         self.data = data
-        self.grad = 0
-        self._backward = lambda: None
-        self._prev = set(_children)
+        self.grad = 0.0
+        self._backward: Callable[[Value], None] = _no_backward
+        self._prev = tuple(_children)
         self._op = _op
 
-    def __add__(self, other):
+    def __repr__(self) -> str:
+        return f"Value(data={self.data}, grad={self.grad})"
+
+    def __add__(self, other: Union['Value', Number]) -> 'Value':
         other = other if isinstance(other, Value) else Value(other)
         out = Value(self.data + other.data, (self, other), '+')
-        def _backward():
+
+        def _backward(out: Value) -> None:
             self.grad += out.grad
             other.grad += out.grad
         out._backward = _backward
         return out
 
-    def __mul__(self, other):
+    def __mul__(self, other: Union['Value', Number]) -> 'Value':
         other = other if isinstance(other, Value) else Value(other)
         out = Value(self.data * other.data, (self, other), '*')
 
-        def _backward():
-            self.grad += other.grad * out.grad
-            other.grad += self.grad * out.grad
+        def _backward(out: Value) -> None:
+            self.grad += other.data * out.grad
+            other.grad += self.data * out.grad
         out._backward = _backward
         return out
 
-    def __pow__(self, other):
-        out = Value(self.data ** other.data, (self, other), '**{other}')
-        def _backward():
-            self.grad += (other * self.data**(other-1)) * out.grad
-            # other ??
+    def __pow__(self, other: Union['Value', Number]) -> 'Value':
+        other = other if isinstance(other, Value) else Value(other)
+        out = Value(self.data ** other.data, (self, other), '**')
+
+        def _backward(out: Value) -> None:
+            self.grad += other.data * self.data ** (other.data - 1) * out.grad
+            # d(a**b)/db = a**b * log(a), only defined for a positive base
+            if self.data > 0:
+                other.grad += out.data * math.log(self.data) * out.grad
         out._backward = _backward
+        return out
 
-    def relu(self):
-        out = Value(0 if self.data < 0 else self.data, (self,) 'ReLU')
-        
-        def _backward():
-            self.grad += (out.data > 0) * out.grad
+    def relu(self) -> 'Value':
+        out = Value(0.0 if self.data < 0 else self.data, (self,), 'ReLU')
+
+        def _backward(out: Value) -> None:
+            if self.data > 0:
+                self.grad += out.grad
+        out._backward = _backward
+        return out
+
+    def tanh(self) -> 'Value':
+        out = Value(math.tanh(self.data), (self,), 'tanh')
+
+        def _backward(out: Value) -> None:
+            self.grad += (1.0 - out.data * out.data) * out.grad
+        out._backward = _backward
+        return out
+
+    def exp(self) -> 'Value':
+        out = Value(math.exp(self.data), (self,), 'exp')
+
+        def _backward(out: Value) -> None:
+            self.grad += out.data * out.grad
         out._backward = _backward
+        return out
+
+    def log(self) -> 'Value':
+        out = Value(math.log(self.data), (self,), 'log')
 
+        def _backward(out: Value) -> None:
+            self.grad += out.grad / self.data
+        out._backward = _backward
         return out
 
-    def backward(self):
-        top = []
-        visited = set()
-        def build_topo(v):
-            if v not in visited:
-                visited.add(v)
-                for child in v._prev:
-                    build_topo(child)
-                top.append(v)
-        build_topo(self)
-        self.grad = 1
-        for v in reversed(top):
-            v._backward()
+    def __neg__(self) -> 'Value':
+        return self * -1
+
+    def __radd__(self, other: Number) -> 'Value':
+        return self + other
+
+    def __sub__(self, other: Union['Value', Number]) -> 'Value':
+        return self + (-other)
+
+    def __rsub__(self, other: Number) -> 'Value':
+        return other + (-self)
+
+    def __rmul__(self, other: Number) -> 'Value':
+        return self * other
+
+    def __truediv__(self, other: Union['Value', Number]) -> 'Value':
+        other = other if isinstance(other, Value) else Value(other)
+        return self * other ** -1
+
+    def __rtruediv__(self, other: Number) -> 'Value':
+        return other * self ** -1
+
+    def backward(self) -> 'ComputationGraph':
+        """Backpropagate from this node, accumulating into every node's grad.
+
+        Returns:
+            The ComputationGraph used, whose cached order can be reused for
+            further backward passes (see ComputationGraph)
+        """
+        graph = ComputationGraph(self)
+        graph.backward()
+        return graph
+
+
+# Forward rule for every op, used to re-evaluate a graph in place with new
+# leaf values (ComputationGraph.forward)
+_FORWARD: Dict[str, Callable[..., float]] = {
+    '+': operator.add,
+    '*': operator.mul,
+    '**': operator.pow,
+    'ReLU': lambda x: 0.0 if x < 0 else x,
+    'tanh': math.tanh,
+    'exp': math.exp,
+    'log': math.log,
+}
+
+
+def topological_order(root: Value) -> List[Value]:
+    """Return every node reachable from root, inputs before the nodes using them.
+
+    Uses an explicit stack instead of recursion, so graph depth is limited by
+    memory rather than by the interpreter's recursion limit.
+    """
+    order: List[Value] = []
+    visited = set()
+    # (node, True) means all of node's inputs have already been emitted
+    stack: List[Tuple[Value, bool]] = [(root, False)]
+    while stack:
+        node, inputs_done = stack.pop()
+        if inputs_done:
+            order.append(node)
+            continue
+        if node in visited:
+            continue
+        visited.add(node)
+        stack.append((node, True))
+        for child in node._prev:
+            if child not in visited:
+                stack.append((child, False))
+    return order
+
+
+class ComputationGraph:
+    """The graph behind one output Value, with its topological order cached.
+
+    Sorting is the only part of backpropagation that walks the graph
+    structure, so it is done once here and reused: a training loop that keeps
+    the same graph can set new leaf values, call ``forward()``, ``zero_grad()``
+    and ``backward()`` every step without sorting again.
+
+    Example:
+        x = Value(2.0)
+        loss = (x * x + 1).relu()
+        graph = ComputationGraph(loss)
+        graph.backward()          # x.grad == 4.0
+        x.data = 3.0
+        graph.forward()           # loss.data == 10.0
+        graph.zero_grad()
+        graph.backward()          # x.grad == 6.0
+    """
+
+    def __init__(self, root: Value) -> None:
+        self.root = root
+        self.order = topological_order(root)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def forward(self) -> float:
+        """Recompute every node's data from the current leaf values.
+
+        Returns:
+            The new value of the root
+        """
+        forward_rules = _FORWARD
+        for node in self.order:
+            if node._prev:
+                node.data = forward_rules[node._op](*[child.data for child in node._prev])
+        return self.root.data
+
+    def zero_grad(self) -> None:
+        """Reset the gradient of every node in the graph to zero."""
+        for node in self.order:
+            node.grad = 0.0
+
+    def backward(self, grad: float = 1.0) -> None:
+        """Backpropagate grad from the root through the cached order.
 
+        Gradients accumulate, so call zero_grad() between passes.
+        """
+        self.root.grad = grad
+        for node in reversed(self.order):
+            node._backward(node)
@@ -0,0 +1,227 @@
+"""Matrix-valued nodes for automatic differentiation."""
+
+from array import array
+import math
+import operator
+from typing import Callable, List, Optional, Tuple
+
+from ..math.matrix import Matrix
+from ..math.activation_functions import ActivationFunctions
+from ..loss.loss import Loss
+from .computation_graph import topological_order
+
+
+def _no_backward(out: 'Tensor') -> None:
+    pass
+
+
+def _zip_map(fn: Callable[[float, float], float], m1: Matrix, m2: Matrix) -> Matrix:
+    """Element-wise fn over two same-shaped matrices into a new matrix."""
+    return Matrix._from_storage(m1.rows, m1.cols, array('d', map(fn, m1.flat(), m2.flat())))
+
+
+def _accumulate(node: 'Tensor', grad: Matrix) -> None:
+    """Add grad into node.grad, allocating it on first use.
+
+    grad must be a fresh matrix that nothing else holds on to, since the
+    first contribution is stored as is.
+    """
+    if node.grad is None:
+        node.grad = grad
+    else:
+        node.grad.add_(grad)
+
+
+def _row_sums(m: Matrix) -> Matrix:
+    """Sum the rows of m into a 1 x cols matrix."""
+    total = Matrix(1, m.cols)
+    for i in range(m.rows):
+        total.add_(m.row(i))
+    return total
+
+
+class Tensor:
+    """A Matrix-valued node in a computation graph.
+
+    Where a ``Value`` graph records one node per scalar operation, a Tensor
+    graph records one node per matrix operation, with backward rules written
+    for whole matrices (for ``C = A @ B``: ``dA = dC @ B.T`` and
+    ``dB = A.T @ dC``). A 256x256 product is then one node instead of
+    millions.
+
+    Only tensors created with ``requires_grad=True`` (and results computed
+    from them) get gradients. After ``backward()`` gradients are kept on
+    leaf tensors only; intermediate gradients are released as soon as they
+    have been propagated.
+    """
+
+    __slots__ = ("data", "grad", "requires_grad", "_backward", "_prev", "_op")
+
+    def __init__(self, data: Matrix, requires_grad: bool = False,
+                 _children: Tuple['Tensor', ...] = (), _op: str = '') -> None:
+        self.data = data
+        self.grad: Optional[Matrix] = None
+        self.requires_grad = requires_grad
+        self._backward: Callable[[Tensor], None] = _no_backward
+        self._prev = _children
+        self._op = _op
+
+    def __repr__(self) -> str:
+        return f"Tensor(shape=({self.data.rows}, {self.data.cols}), op='{self._op}')"
+
+    @staticmethod
+    def _result(data: Matrix, children: Tuple['Tensor', ...], op: str,
+                backward: Callable[['Tensor'], None]) -> 'Tensor':
+        """Create an op's output node; inputs are only recorded if a gradient is needed."""
+        if not any(child.requires_grad for child in children):
+            return Tensor(data)
+        out = Tensor(data, True, children, op)
+        out._backward = backward
+        return out
+
+    def matmul(self, other: 'Tensor') -> 'Tensor':
+        """Matrix product self @ other."""
+        a, b = self, other
+
+        def _backward(out: Tensor) -> None:
+            if a.requires_grad:
+                _accumulate(a, Matrix.multiply(out.grad, b.data.T))
+            if b.requires_grad:
+                _accumulate(b, Matrix.multiply(a.data.T, out.grad))
+        return Tensor._result(Matrix.multiply(a.data, b.data), (a, b), 'matmul', _backward)
+
+    def __matmul__(self, other: 'Tensor') -> 'Tensor':
+        return self.matmul(other)
+
+    def add(self, other: 'Tensor', subtract: bool = False) -> 'Tensor':
+        """Element-wise self + other (or self - other).
+
+        other may also be a single row (1 x cols), which is added to every
+        row of self, as for a bias; its gradient is then the column sums of
+        the output gradient.
+        """
+        a, b = self, other
+        broadcast = b.data.rows == 1 and a.data.rows != 1 and b.data.cols == a.data.cols
+        sign = -1.0 if subtract else 1.0
+        if broadcast:
+            result = Matrix.elementwise(a.data, b.data, operator.sub if subtract else operator.add)
+        else:
+            result = Matrix.add(a.data, b.data, subtract)
+
+        def _backward(out: Tensor) -> None:
+            if a.requires_grad:
+                _accumulate(a, out.grad.copy())
+            if b.requires_grad:
+                grad = _row_sums(out.grad) if broadcast else out.grad.copy()
+                _accumulate(b, grad.scale_(sign) if subtract else grad)
+        return Tensor._result(result, (a, b), 'sub' if subtract else 'add', _backward)
+
+    def __add__(self, other: 'Tensor') -> 'Tensor':
+        return self.add(other)
+
+    def __sub__(self, other: 'Tensor') -> 'Tensor':
+        return self.add(other, subtract=True)
+
+    def scale(self, scalar: float) -> 'Tensor':
+        """Multiply every element by a constant scalar."""
+        a = self
+
+        def _backward(out: Tensor) -> None:
+            _accumulate(a, Matrix.scalar_multiply(out.grad, scalar))
+        return Tensor._result(Matrix.scalar_multiply(a.data, scalar), (a,), 'scale', _backward)
+
+    def __mul__(self, scalar: float) -> 'Tensor':
+        return self.scale(scalar)
+
+    def __rmul__(self, scalar: float) -> 'Tensor':
+        return self.scale(scalar)
+
+    def transpose(self) -> 'Tensor':
+        """Transpose (a view of this tensor's data)."""
+        a = self
+
+        def _backward(out: Tensor) -> None:
+            _accumulate(a, out.grad.T.copy())
+        return Tensor._result(a.data.T, (a,), 'transpose', _backward)
+
+    @property
+    def T(self) -> 'Tensor':
+        return self.transpose()
+
+    def relu(self) -> 'Tensor':
+        a = self
+
+        def _backward(out: Tensor) -> None:
+            _accumulate(a, _zip_map(lambda g, y: g if y > 0.0 else 0.0, out.grad, out.data))
+        return Tensor._result(ActivationFunctions.relu(a.data), (a,), 'relu', _backward)
+
+    def sigmoid(self) -> 'Tensor':
+        a = self
+
+        def _backward(out: Tensor) -> None:
+            _accumulate(a, _zip_map(lambda g, y: g * y * (1.0 - y), out.grad, out.data))
+        return Tensor._result(ActivationFunctions.sigmoid(a.data), (a,), 'sigmoid', _backward)
+
+    def tanh(self) -> 'Tensor':
+        a = self
+
+        def _backward(out: Tensor) -> None:
+            _accumulate(a, _zip_map(lambda g, y: g * (1.0 - y * y), out.grad, out.data))
+        return Tensor._result(ActivationFunctions.tanh(a.data), (a,), 'tanh', _backward)
+
+    def mse_loss(self, target: 'Tensor') -> 'Tensor':
+        """Mean squared error against target, as a 1 x 1 tensor."""
+        pred = self
+        count = pred.data.rows * pred.data.cols
+
+        def _backward(out: Tensor) -> None:
+            scale = 2.0 * out.grad.get_val_at(0, 0) / count
+            diff = Matrix.add(pred.data, target.data, subtract=True).scale_(scale)
+            if target.requires_grad:
+                _accumulate(target, Matrix.scalar_multiply(diff, -1.0))
+            if pred.requires_grad:
+                _accumulate(pred, diff)
+        loss = Matrix.full(1, 1, Loss.mse_loss(pred.data, target.data))
+        return Tensor._result(loss, (pred, target), 'mse_loss', _backward)
+
+    def cross_entropy_with_logits(self, target: 'Tensor') -> 'Tensor':
+        """Softmax cross-entropy of these logits against target rows, as a 1 x 1 tensor.
+
+        Only the logits receive a gradient: (sum(y) * softmax(z) - y) / rows.
+        """
+        logits = self
+
+        def _backward(out: Tensor) -> None:
+            scale = out.grad.get_val_at(0, 0) / logits.data.rows
+            probs = ActivationFunctions.softmax(logits.data)
+            grad = Matrix(probs.rows, probs.cols)
+            for i in range(probs.rows):
+                y = target.data.row(i).flat()
+                total = math.fsum(y)
+                grad.data[i * grad.cols:(i + 1) * grad.cols] = array(
+                    'd', [(total * p - t) * scale for p, t in zip(probs.row(i).flat(), y)])
+            _accumulate(logits, grad)
+        loss = Matrix.full(1, 1, Loss.cross_entropy_with_logits(logits.data, target.data))
+        return Tensor._result(loss, (logits,), 'cross_entropy_with_logits', _backward)
+
+    def zero_grad(self) -> None:
+        """Drop this tensor's gradient."""
+        self.grad = None
+
+    def backward(self, grad: Optional[Matrix] = None) -> List['Tensor']:
+        """Backpropagate from this tensor.
+
+        Args:
+            grad: Gradient of the final objective with respect to this tensor;
+                defaults to all ones (for a 1 x 1 loss, d loss / d loss = 1)
+
+        Returns:
+            The nodes in topological order
+        """
+        order = topological_order(self)
+        self.grad = grad.copy() if grad is not None else Matrix.full(self.data.rows, self.data.cols, 1.0)
+        for node in reversed(order):
+            if node._prev and node.grad is not None:
+                node._backward(node)
+                node.grad = None
+        return order
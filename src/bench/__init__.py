@@ -0,0 +1,6 @@
+"""Benchmark suite and regression harness for core operations."""
+
+from .cases import CASES, BenchCase
+from .runner import compare, load_report, run_case, run_suite, save_report
+
+__all__ = ["CASES", "BenchCase", "compare", "load_report", "run_case", "run_suite", "save_report"]
\ No newline at end of file
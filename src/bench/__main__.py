@@ -0,0 +1,7 @@
+"""Allow ``python -m src.bench``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
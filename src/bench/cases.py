@@ -0,0 +1,136 @@
+"""Benchmark cases for the core math, loss and autograd operations."""
+
+import random
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from ..math.matrix import Matrix
+from ..math.vector import Vector
+from ..math.activation_functions import ActivationFunctions
+from ..loss.loss import Loss
+from ..autograd.computation_graph import Value
+from ..autograd.tensor import Tensor
+from ..random.sampler import Sampler
+
+# A setup function takes a size and returns (function to time, number of
+# elements it processes per call). Everything the timed function needs is
+# built in setup so only the operation itself is measured.
+Setup = Callable[[int], Tuple[Callable[[], object], int]]
+
+
+class BenchCase:
+    """A named operation benchmarked at several problem sizes."""
+
+    def __init__(self, name: str, sizes: Sequence[int], setup: Setup, description: str) -> None:
+        self.name = name
+        self.sizes = list(sizes)
+        self.setup = setup
+        self.description = description
+
+
+def _random_matrix(n: int, m: int, seed: int) -> Matrix:
+    rng = random.Random(seed)
+    return Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(n * m)], n, m)
+
+
+def _random_vector(n: int, seed: int) -> Vector:
+    rng = random.Random(seed)
+    v = Vector(n)
+    for i in range(n):
+        v.set(i, rng.uniform(-1, 1))
+    return v
+
+
+def _multiply(n: int):
+    a, b = _random_matrix(n, n, 1), _random_matrix(n, n, 2)
+    return lambda: Matrix.multiply(a, b), n * n * n
+
+
+def _add(n: int):
+    a, b = _random_matrix(n, n, 1), _random_matrix(n, n, 2)
+    return lambda: Matrix.add(a, b), n * n
+
+
+def _transpose(n: int):
+    a = _random_matrix(n, n, 1)
+    out = Matrix(n, n)
+    # Materialize into a buffer: the view alone is O(1)
+    return lambda: Matrix.transpose(a, out=out), n * n
+
+
+def _dot_product(n: int):
+    v1, v2 = _random_vector(n, 1), _random_vector(n, 2)
+    return lambda: Vector.dot_product(v1, v2), n
+
+
+def _l2_norm(n: int):
+    v = _random_vector(n, 1)
+    return v.l2_norm, n
+
+
+def _activation(name: str) -> Setup:
+    fn = getattr(ActivationFunctions, name)
+
+    def setup(n: int):
+        a = _random_matrix(n, n, 1)
+        return lambda: fn(a), n * n
+    return setup
+
+
+def _mse_loss(n: int):
+    a, b = _random_matrix(n, n, 1), _random_matrix(n, n, 2)
+    return lambda: Loss.mse_loss(a, b), n * n
+
+
+def _sampler(method: str) -> Setup:
+    def setup(n: int):
+        sampler = Sampler(seed=0)
+        fill = getattr(sampler, method)
+        m = Matrix(n, n)
+        return lambda: fill(m), n * n
+    return setup
+
+
+def _value_backward(n: int):
+    rng = random.Random(1)
+    xs = [Value(rng.uniform(-1, 1)) for _ in range(n)]
+    out = Value(0.0)
+    for x in xs:
+        out = out + (x * x).tanh()
+
+    def run():
+        for node in xs:
+            node.grad = 0.0
+        out.backward()
+    return run, n
+
+
+def _tensor_backward(n: int):
+    x = Tensor(_random_matrix(n, n, 1))
+    w = Tensor(_random_matrix(n, n, 2), requires_grad=True)
+    y = Tensor(_random_matrix(n, n, 3))
+
+    def run():
+        w.zero_grad()
+        (x @ w).relu().mse_loss(y).backward()
+    return run, n * n
+
+
+CASES: List[BenchCase] = [
+    BenchCase("matrix.multiply", [32, 64, 128], _multiply, "square n x n product"),
+    BenchCase("matrix.add", [64, 256, 512], _add, "n x n element-wise add"),
+    BenchCase("matrix.transpose", [64, 256, 512], _transpose, "n x n transpose into a buffer"),
+    BenchCase("vector.dot_product", [1_000, 100_000], _dot_product, "length-n dot product"),
+    BenchCase("vector.l2_norm", [1_000, 100_000], _l2_norm, "length-n L2 norm"),
+    BenchCase("activation.relu", [64, 256], _activation("relu"), "n x n relu"),
+    BenchCase("activation.sigmoid", [64, 256], _activation("sigmoid"), "n x n sigmoid"),
+    BenchCase("activation.tanh", [64, 256], _activation("tanh"), "n x n tanh"),
+    BenchCase("loss.mse", [64, 256, 512], _mse_loss, "n x n mean squared error"),
+    BenchCase("random.uniform", [64, 256], _sampler("uniform_"), "fill n x n with U(0, 1)"),
+    BenchCase("random.normal", [64, 256], _sampler("normal_"), "fill n x n with N(0, 1)"),
+    BenchCase("autograd.value_backward", [1_000, 10_000], _value_backward,
+              "backward through n scalar tanh(x*x) terms"),
+    BenchCase("autograd.tensor_backward", [32, 64], _tensor_backward,
+              "forward + backward of relu(x @ w) MSE, n x n"),
+]
+
+CASES_BY_NAME: Dict[str, BenchCase] = {case.name: case for case in CASES}
@@ -0,0 +1,80 @@
+"""Command line entry point: ``ml-wheel-bench`` or ``python -m src.bench``."""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .cases import CASES, CASES_BY_NAME
+from .runner import Result, compare, load_report, run_suite, save_report
+
+# Reference results shipped with the package, compared against by default.
+# Regenerate on the machine that gates upgrades:
+#   python -m src.bench --no-baseline --output src/bench/baseline.json
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _print_result(result: Result) -> None:
+    peak = result["peak_bytes"]
+    peak_col = f"{peak / 1024:10.1f}" if peak is not None else f"{'-':>10}"
+    print(f"{result['case']:<26} {result['size']:>8} {result['ops_per_sec']:>12.1f} "
+          f"{result['ns_per_element']:>12.2f} {peak_col}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite; returns 1 if any case regressed against the baseline."""
+    parser = argparse.ArgumentParser(prog="ml-wheel-bench",
+                                     description="Benchmark ml_wheel core operations.")
+    parser.add_argument("--cases", nargs="+", metavar="NAME",
+                        help="case names or prefixes to run (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, help="override every case's sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats, best is kept")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum seconds per timing repeat")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory measurement")
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", default=BASELINE,
+                        help="JSON results to compare against (default: the bundled baseline.json)")
+    parser.add_argument("--no-baseline", action="store_true", help="skip the baseline comparison")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown vs baseline as a fraction (default 0.10)")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for case in CASES:
+            print(f"{case.name:<26} sizes={case.sizes}  {case.description}")
+        return 0
+
+    cases = CASES
+    if args.cases:
+        cases = [case for case in CASES
+                 if any(case.name == name or case.name.startswith(name) for name in args.cases)]
+        if not cases:
+            parser.error(f"no cases match {args.cases}; choose from {sorted(CASES_BY_NAME)}")
+
+    print(f"{'case':<26} {'size':>8} {'ops/sec':>12} {'ns/element':>12} {'peak KiB':>10}")
+    report = run_suite(cases, args.sizes, args.repeat, args.min_time,
+                       not args.no_memory, progress=_print_result)
+    if args.output:
+        save_report(report, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.no_baseline:
+        return 0
+    comparisons = compare(report, load_report(args.baseline), args.threshold)
+    print(f"\n{'case':<26} {'size':>8} {'baseline s':>12} {'current s':>12} {'ratio':>7}")
+    for c in comparisons:
+        flag = "  REGRESSION" if c["regression"] else ""
+        print(f"{c['case']:<26} {c['size']:>8} {c['baseline_seconds']:>12.6f} "
+              f"{c['seconds']:>12.6f} {c['ratio']:>7.2f}{flag}")
+    regressions = [c for c in comparisons if c["regression"]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} threshold")
+        return 1
+    print(f"\nNo regressions over {args.threshold:.0%} threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Timing, memory measurement and baseline comparison for benchmark cases."""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cases import BenchCase
+
+Result = Dict[str, Any]
+
+
+def time_call(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.05) -> float:
+    """Best-of-`repeat` seconds per call.
+
+    Each repeat runs fn enough times to take at least min_time, so very fast
+    operations are still timed over many calls.
+    """
+    fn()  # warm-up
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or calls >= 1 << 20:
+            break
+        calls *= 2
+    best = elapsed / calls
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    """Peak bytes allocated (per tracemalloc) during one call of fn."""
+    # A fresh start also starts a fresh peak, so this needs no
+    # tracemalloc.reset_peak (which Python 3.8 lacks)
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base)
+
+
+def run_case(case: BenchCase, size: int, repeat: int = 5, min_time: float = 0.05,
+             measure_memory: bool = True) -> Result:
+    """Benchmark one case at one size and return its result record."""
+    fn, elements = case.setup(size)
+    seconds = time_call(fn, repeat, min_time)
+    return {
+        "case": case.name,
+        "size": size,
+        "seconds": seconds,
+        "ops_per_sec": 1.0 / seconds if seconds > 0 else float("inf"),
+        "ns_per_element": seconds * 1e9 / elements if elements else 0.0,
+        "peak_bytes": peak_memory(fn) if measure_memory else None,
+    }
+
+
+def run_suite(cases: Iterable[BenchCase], sizes: Optional[List[int]] = None, repeat: int = 5,
+              min_time: float = 0.05, measure_memory: bool = True,
+              progress: Optional[Callable[[Result], None]] = None) -> Dict[str, Any]:
+    """Run every case at its sizes (or the given sizes) and collect a report."""
+    results = []
+    for case in cases:
+        for size in sizes or case.sizes:
+            result = run_case(case, size, repeat, min_time, measure_memory)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> List[Result]:
+    """Compare a report against a baseline report.
+
+    Args:
+        report: Current results from run_suite
+        baseline: Earlier results from run_suite (e.g. loaded with load_report)
+        threshold: Allowed slowdown as a fraction, 0.10 = 10% slower
+
+    Returns:
+        One record per (case, size) present in both, with the time ratio
+        (current / baseline) and whether it counts as a regression
+    """
+    previous = {(r["case"], r["size"]): r for r in baseline["results"]}
+    comparisons = []
+    for result in report["results"]:
+        old = previous.get((result["case"], result["size"]))
+        if old is None:
+            continue
+        ratio = result["seconds"] / old["seconds"] if old["seconds"] > 0 else float("inf")
+        comparisons.append({
+            "case": result["case"],
+            "size": result["size"],
+            "baseline_seconds": old["seconds"],
+            "seconds": result["seconds"],
+            "ratio": ratio,
+            "regression": ratio > 1.0 + threshold,
+        })
+    return comparisons
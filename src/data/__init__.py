@@ -0,0 +1,5 @@
+"""Datasets and mini-batch loading."""
+
+from .loader import DataLoader, Dataset, MatrixDataset
+
+__all__ = ["DataLoader", "Dataset", "MatrixDataset"]
\ No newline at end of file
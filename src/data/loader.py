@@ -0,0 +1,196 @@
+"""Mini-batch loading with shuffled sampling and background prefetching."""
+
+from array import array
+import queue
+import threading
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..math.matrix import Matrix, _typecode
+from ..random.sampler import Sampler
+
+Batch = Union[Matrix, Tuple[Matrix, ...]]
+
+# Queue item marking the end of an epoch
+_END = object()
+
+
+class _Failure:
+    """Wraps an exception raised in the prefetch thread so it can be re-raised."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _gather_rows(m: Matrix, indices: Sequence[int]) -> Matrix:
+    """Copy the given rows of a contiguous matrix into a new matrix.
+
+    Rows are copied as raw byte ranges of the storage, so assembling a batch
+    costs one slice per row instead of one call per element. A run of
+    consecutive indices (a ``range`` with step 1) is a single slice. The
+    batch keeps the dtype of m.
+    """
+    itemsize = m.data.itemsize
+    width = m.cols * itemsize
+    base = m.offset * itemsize
+    view = memoryview(m.data).cast('B')
+    out = array(_typecode(m.data))
+    if isinstance(indices, range) and indices.step == 1:
+        start = base + indices.start * width
+        out.frombytes(view[start:start + len(indices) * width])
+    else:
+        for i in indices:
+            start = base + i * width
+            out.frombytes(view[start:start + width])
+    return Matrix._from_storage(len(indices), m.cols, out)
+
+
+class Dataset:
+    """Base class for datasets a DataLoader can batch.
+
+    Subclasses implement ``__len__`` and ``gather(indices)``, which returns
+    the batch holding exactly those examples, in that order. A dataset
+    backed by a file can read just the requested rows in ``gather``.
+    """
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def gather(self, indices: Sequence[int]) -> Batch:
+        raise NotImplementedError
+
+
+class MatrixDataset(Dataset):
+    """Dataset whose examples are the rows of one or more matrices.
+
+    Example:
+        data = MatrixDataset(features, targets)   # same number of rows
+        for x, y in DataLoader(data, batch_size=32, shuffle=True):
+            ...
+    """
+
+    def __init__(self, *matrices: Matrix) -> None:
+        """Wrap matrices that share a row count.
+
+        Non-contiguous matrices (e.g. views) are copied once here so every
+        batch can be assembled from whole-row slices.
+
+        Raises:
+            ValueError: If no matrices are given or their row counts differ
+        """
+        if not matrices:
+            raise ValueError("MatrixDataset needs at least one matrix")
+        rows = matrices[0].rows
+        for m in matrices:
+            if m.rows != rows:
+                raise ValueError(f"All matrices must have the same number of rows, got {m.rows} and {rows}")
+        self.matrices = [m.contiguous() for m in matrices]
+
+    def __len__(self) -> int:
+        return self.matrices[0].rows
+
+    def gather(self, indices: Sequence[int]) -> Batch:
+        batch = tuple(_gather_rows(m, indices) for m in self.matrices)
+        return batch[0] if len(batch) == 1 else batch
+
+
+class DataLoader:
+    """Iterates over a dataset in mini-batches.
+
+    With ``shuffle=True`` every epoch visits the examples in a new order
+    drawn from a ``Sampler``, so a seeded loader produces the same batches on
+    every run. With ``prefetch > 0`` a background thread assembles the next
+    batches while the caller works on the current one; the queue between
+    them holds at most ``prefetch`` batches, which bounds the extra memory.
+
+    Example:
+        loader = DataLoader(MatrixDataset(X, Y), batch_size=64, shuffle=True, seed=0)
+        for epoch in range(10):
+            for x, y in loader:
+                ...
+    """
+
+    def __init__(self, dataset: Dataset, batch_size: int, shuffle: bool = False,
+                 drop_last: bool = False, prefetch: int = 2, sampler: Optional[Sampler] = None,
+                 seed: Optional[int] = None) -> None:
+        """Create a loader.
+
+        Args:
+            dataset: Dataset (or anything with ``__len__`` and ``gather``)
+            batch_size: Examples per batch
+            shuffle: Visit examples in a new random order every epoch
+            drop_last: Skip the final batch if it has fewer than batch_size examples
+            prefetch: Batches to assemble ahead in a background thread; 0
+                assembles each batch on demand in the calling thread
+            sampler: Sampler used for shuffling; defaults to Sampler(seed)
+            seed: Seed for the default sampler
+
+        Raises:
+            ValueError: If batch_size < 1 or prefetch < 0
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be non-negative, got {prefetch}")
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.prefetch = prefetch
+        self.sampler = sampler if sampler is not None else Sampler(seed)
+
+    def __len__(self) -> int:
+        """Number of batches per epoch."""
+        n = len(self.dataset)
+        return n // self.batch_size if self.drop_last else -(-n // self.batch_size)
+
+    def batch_indices(self) -> List[Sequence[int]]:
+        """Indices of every batch of the next epoch (advances the shuffle)."""
+        n = len(self.dataset)
+        order: Sequence[int] = self.sampler.permutation(n) if self.shuffle else range(n)
+        stop = len(self) * self.batch_size
+        return [order[start:min(start + self.batch_size, n)]
+                for start in range(0, stop, self.batch_size)]
+
+    def __iter__(self) -> Iterator[Batch]:
+        batches = self.batch_indices()
+        if self.prefetch == 0:
+            return (self.dataset.gather(indices) for indices in batches)
+        return self._prefetching(batches)
+
+    def _prefetching(self, batches: List[Sequence[int]]) -> Iterator[Batch]:
+        ready: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item: object) -> bool:
+            # Wait for space, but give up if the consumer has gone away
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            try:
+                for indices in batches:
+                    if not put(self.dataset.gather(indices)):
+                        return
+                put(_END)
+            except BaseException as error:  # re-raised in the consuming thread
+                put(_Failure(error))
+
+        worker = threading.Thread(target=produce, name="DataLoader-prefetch", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            # Also runs when the caller stops iterating early
+            stop.set()
+            worker.join()
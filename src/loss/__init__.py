@@ -1,5 +1,5 @@
 """Loss functions for machine learning."""
 
-from .loss import Loss
+from .loss import Loss, StreamingLoss
 
-__all__ = ["Loss"]
\ No newline at end of file
+__all__ = ["Loss", "StreamingLoss"]
\ No newline at end of file
@@ -1,35 +1,276 @@
 """Loss functions for training machine learning models."""
 
+import math
+from itertools import repeat
+from operator import sub
+from typing import Callable, Dict, Iterable, Tuple, Union
+
 from ..math.matrix import Matrix
+from ..math.sparse import SparseMatrix
+
+# Targets may be sparse (e.g. one-hot labels); losses that only need the
+# non-zero targets visit just those, the others densify them.
+Targets = Union[Matrix, SparseMatrix]
+
+# Probabilities are clipped to [EPSILON, 1 - EPSILON] before taking logs
+EPSILON = 1e-12
+
+
+def _check_shapes(predictions: Matrix, actual: Targets) -> None:
+    if predictions.get_cols() != actual.get_cols():
+        raise ValueError("Matrices don't have the same col size")
+    if predictions.get_rows() != actual.get_rows():
+        raise ValueError("Matrices don't have the same row size")
+
+
+# Each kernel makes one pass over the flat storage of both matrices and returns
+# (sum of per-term losses, number of terms the loss is averaged over). Sums use
+# math.fsum, which is exact for the batch, so splitting a dataset into batches
+# doesn't change the result beyond the final division.
+
+def _mse_terms(predictions: Matrix, actual: Matrix) -> Tuple[float, int]:
+    diffs = map(sub, predictions.flat(), actual.flat())
+    return math.fsum(map(pow, diffs, repeat(2))), predictions.rows * predictions.cols
+
+
+def _mae_terms(predictions: Matrix, actual: Matrix) -> Tuple[float, int]:
+    diffs = map(sub, predictions.flat(), actual.flat())
+    return math.fsum(map(abs, diffs)), predictions.rows * predictions.cols
+
+
+def _bce_terms(predictions: Matrix, actual: Matrix) -> Tuple[float, int]:
+    log = math.log
+    lo, hi = EPSILON, 1.0 - EPSILON
+    total = -math.fsum(
+        y * log(min(max(p, lo), hi)) + (1.0 - y) * log(1.0 - min(max(p, lo), hi))
+        for p, y in zip(predictions.flat(), actual.flat()))
+    return total, predictions.rows * predictions.cols
+
+
+def _cce_terms(predictions: Matrix, actual: Targets) -> Tuple[float, int]:
+    log = math.log
+    if isinstance(actual, SparseMatrix):
+        p = predictions.flat()
+        cols = predictions.cols
+        total = -math.fsum(y * log(max(p[i * cols + j], EPSILON)) for i, j, y in actual.items() if y)
+        return total, predictions.rows
+    # Zero targets contribute nothing, which makes one-hot targets cheap
+    total = -math.fsum(y * log(max(p, EPSILON))
+                       for p, y in zip(predictions.flat(), actual.flat()) if y)
+    return total, predictions.rows
+
+
+def _logits_ce_terms(logits: Matrix, actual: Targets) -> Tuple[float, int]:
+    cols = logits.cols
+    z_all = logits.flat()
+    sparse = isinstance(actual, SparseMatrix)
+    y_all = None if sparse else actual.flat()
+    terms = []
+    for i, start in enumerate(range(0, logits.rows * cols, cols)):
+        z = z_all[start:start + cols]
+        if sparse:
+            # Only the stored targets matter: y_z pairs each with its logit
+            columns, y = actual.row_entries(i)
+            y_z = [z[j] for j in columns]
+        else:
+            y = y_all[start:start + cols]
+            y_z = z
+        if not any(y):
+            terms.append(0.0)
+            continue
+        top = max(z)
+        log_sum_exp = top + math.log(math.fsum(math.exp(v - top) for v in z))
+        # -sum(y * log_softmax(z)) = sum(y) * logsumexp(z) - sum(y * z)
+        terms.append(math.fsum(y) * log_sum_exp - math.fsum(map(float.__mul__, y, y_z)))
+    return math.fsum(terms), logits.rows
+
+
+_KERNELS: Dict[str, Callable[[Matrix, Targets], Tuple[float, int]]] = {
+    "mse": _mse_terms,
+    "mae": _mae_terms,
+    "binary_cross_entropy": _bce_terms,
+    "categorical_cross_entropy": _cce_terms,
+    "cross_entropy_with_logits": _logits_ce_terms,
+}
+
+
+def _mean(kernel: Callable[[Matrix, Targets], Tuple[float, int]],
+          predictions: Matrix, actual: Targets) -> float:
+    _check_shapes(predictions, actual)
+    total, count = kernel(predictions, actual)
+    return total / count
+
+
+class StreamingLoss:
+    """Accumulates a loss over batches without holding them all in memory.
+
+    Batch sums are exact (math.fsum) and are combined with Neumaier's
+    compensated summation, so the running total doesn't drift over many
+    batches.
+
+    Example:
+        acc = StreamingLoss("mse")
+        for predictions, actual in batches:
+            acc.update(predictions, actual)
+        loss = acc.result()
+    """
+
+    def __init__(self, kind: str) -> None:
+        """Create an accumulator for one of Loss.KINDS.
+
+        Raises:
+            ValueError: If kind is not a known loss
+        """
+        if kind not in _KERNELS:
+            raise ValueError(f"Unknown loss '{kind}', expected one of {sorted(_KERNELS)}")
+        self.kind = kind
+        self._kernel = _KERNELS[kind]
+        self._total = 0.0
+        self._compensation = 0.0
+        self.count = 0
+
+    def update(self, predictions: Matrix, actual: Targets) -> None:
+        """Add one batch of predictions and targets.
+
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        _check_shapes(predictions, actual)
+        batch_total, batch_count = self._kernel(predictions, actual)
+        total = self._total + batch_total
+        if abs(self._total) >= abs(batch_total):
+            self._compensation += (self._total - total) + batch_total
+        else:
+            self._compensation += (batch_total - total) + self._total
+        self._total = total
+        self.count += batch_count
+
+    def result(self) -> float:
+        """Mean loss over everything seen so far.
+
+        Raises:
+            ValueError: If no batches have been added
+        """
+        if self.count == 0:
+            raise ValueError("No batches have been added")
+        return (self._total + self._compensation) / self.count
 
 
 class Loss:
-    """Collection of loss functions for training and evaluation."""
+    """Collection of loss functions for training and evaluation.
+
+    Element-wise losses (MSE, MAE, binary cross-entropy) are averaged over all
+    elements; categorical cross-entropy losses are summed across each row and
+    averaged over rows. Targets may also be a SparseMatrix.
+    """
+
+    KINDS = tuple(_KERNELS)
 
     @staticmethod
     def mse_loss(predictions: Matrix, actual: Matrix) -> float:
         """Compute Mean Squared Error between predictions and actual values.
-        
+
         Args:
             predictions: Matrix of predicted values
             actual: Matrix of actual/target values
-            
+
         Returns:
             Mean squared error as float
-            
+
         Raises:
             ValueError: If matrix dimensions don't match
         """
-        num_cols = predictions.get_cols()
-        num_rows = predictions.get_rows()
-        if num_cols != actual.get_cols():
-            raise ValueError("Matrices don't have the same col size")
-        if num_rows != actual.get_rows():
-            raise ValueError("Matrices don't have the same row size")
-        squared_sum_diff = 0
-        for i in range(0, num_rows):
-            for j in range(0, num_cols):
-                squared_sum_diff += (predictions.get_val_at(i, j) - actual.get_val_at(i, j))**2
-        return squared_sum_diff / (num_rows * num_cols)
+        return _mean(_mse_terms, predictions, actual)
 
+    @staticmethod
+    def mae_loss(predictions: Matrix, actual: Matrix) -> float:
+        """Compute Mean Absolute Error between predictions and actual values.
+
+        Args:
+            predictions: Matrix of predicted values
+            actual: Matrix of actual/target values
 
+        Returns:
+            Mean absolute error as float
+
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        return _mean(_mae_terms, predictions, actual)
+
+    @staticmethod
+    def binary_cross_entropy(predictions: Matrix, actual: Matrix) -> float:
+        """Compute binary cross-entropy of predicted probabilities.
+
+        Args:
+            predictions: Matrix of probabilities in [0, 1] (clipped to EPSILON)
+            actual: Matrix of 0/1 (or soft) targets
+
+        Returns:
+            Mean of -(y log p + (1 - y) log(1 - p)) over all elements
+
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        return _mean(_bce_terms, predictions, actual)
+
+    @staticmethod
+    def categorical_cross_entropy(predictions: Matrix, actual: Targets) -> float:
+        """Compute categorical cross-entropy of per-row class probabilities.
+
+        Args:
+            predictions: Matrix whose rows are probability distributions
+            actual: Matrix or SparseMatrix of one-hot (or soft) target rows;
+                a SparseMatrix is read without densifying it
+
+        Returns:
+            Mean over rows of -sum(y log p)
+
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        return _mean(_cce_terms, predictions, actual)
+
+    @staticmethod
+    def cross_entropy_with_logits(logits: Matrix, actual: Targets) -> float:
+        """Compute softmax + categorical cross-entropy in a single fused pass.
+
+        The softmax is never materialized: each row's loss is
+        sum(y) * logsumexp(z) - sum(y * z), with logsumexp shifted by the row
+        max so large logits don't overflow.
+
+        Args:
+            logits: Matrix of unnormalized scores, one row per example
+            actual: Matrix or SparseMatrix of one-hot (or soft) target rows;
+                a SparseMatrix is read without densifying it
+
+        Returns:
+            Mean over rows of the cross-entropy
+
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        return _mean(_logits_ce_terms, logits, actual)
+
+    @staticmethod
+    def streaming(kind: str, batches: Iterable[Tuple[Matrix, Matrix]]) -> float:
+        """Evaluate a loss over an iterator of (predictions, actual) batches.
+
+        Only one batch needs to be in memory at a time, so this works for
+        validation sets larger than memory.
+
+        Args:
+            kind: One of Loss.KINDS, e.g. "mse"
+            batches: Iterable of (predictions, actual) matrix pairs
+
+        Returns:
+            The same value the loss would have over all batches stacked together
+
+        Raises:
+            ValueError: If kind is unknown, no batches are given, or a batch's
+                dimensions don't match
+        """
+        acc = StreamingLoss(kind)
+        for predictions, actual in batches:
+            acc.update(predictions, actual)
+        return acc.result()
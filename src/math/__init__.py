@@ -2,6 +2,11 @@
 
 from .matrix import Matrix
 from .vector import Vector
+from .vector_batch import VectorBatch
 from .activation_functions import ActivationFunctions
+from .sparse import SparseMatrix
+from .lazy import Expr, lazy
+from .quantize import QuantizedMatrix
 
-__all__ = ["Matrix", "Vector", "ActivationFunctions"]
\ No newline at end of file
+__all__ = ["Matrix", "Vector", "VectorBatch", "ActivationFunctions", "SparseMatrix", "Expr", "lazy",
+           "QuantizedMatrix"]
\ No newline at end of file
@@ -1,44 +1,151 @@
 """Activation functions for neural networks."""
 
+from array import array
 import math
-from typing import Union
+from typing import Callable, Iterable, List, Sequence, Union
+
+from .matrix import Matrix, _typecode
+from .vector import Vector
+
+Batch = Union[Matrix, Vector]
+
+
+def _relu_values(xs: Iterable[float]) -> List[float]:
+    return [x if x > 0.0 else 0.0 for x in xs]
+
+
+def _sigmoid_values(xs: Iterable[float]) -> List[float]:
+    # exp is only ever called on a non-positive argument, so it can't overflow
+    exp = math.exp
+    return [1.0 / (1.0 + exp(-x)) if x >= 0.0 else exp(x) / (1.0 + exp(x)) for x in xs]
+
+
+def _tanh_values(xs: Iterable[float]) -> Iterable[float]:
+    return map(math.tanh, xs)
+
+
+def _apply(x: Batch, fn: Callable[[Sequence[float]], Iterable[float]], inplace: bool) -> Batch:
+    """Run a vectorized function over a whole Matrix or Vector in one pass."""
+    if isinstance(x, Matrix):
+        return Matrix.apply(x, fn, out=x if inplace else None)
+    values = array(x.vector.typecode, fn(x.vector))
+    if inplace:
+        x.vector[:] = values
+        return x
+    result = Vector(0)
+    result.vector = values
+    return result
+
+
+def _softmax_row(row: List[float], log: bool) -> List[float]:
+    """Softmax (or log-softmax) of one row, shifted by its max for stability."""
+    if not row:
+        return row
+    top = max(row)
+    shifted = [v - top for v in row]
+    exps = list(map(math.exp, shifted))
+    total = math.fsum(exps)
+    if log:
+        log_total = math.log(total)
+        return [v - log_total for v in shifted]
+    inv = 1.0 / total
+    return [e * inv for e in exps]
 
 
 class ActivationFunctions:
-    """Collection of common activation functions used in neural networks."""
-    
+    """Collection of common activation functions used in neural networks.
+
+    ``relu``, ``sigmoid`` and ``tanh`` accept a single float, or a whole
+    Matrix or Vector which is processed in one pass over its storage. Pass
+    ``inplace=True`` to overwrite a Matrix/Vector instead of allocating a result.
+    """
+
     @staticmethod
-    def relu(x: float) -> float:
+    def relu(x: Union[float, Batch], inplace: bool = False) -> Union[float, Batch]:
         """Rectified Linear Unit activation function.
-        
+
         Args:
-            x: Input value
-            
+            x: Input value, Matrix or Vector
+            inplace: For Matrix/Vector input, overwrite x with the result
+
         Returns:
-            max(0, x)
+            max(0, x), element-wise for Matrix/Vector input
         """
+        if isinstance(x, (Matrix, Vector)):
+            return _apply(x, _relu_values, inplace)
         return max(0.0, x)
-    
+
     @staticmethod
-    def sigmoid(x: float) -> float:
+    def sigmoid(x: Union[float, Batch], inplace: bool = False) -> Union[float, Batch]:
         """Sigmoid activation function.
-        
+
+        Negative inputs are evaluated as exp(x) / (1 + exp(x)) so large
+        negative values don't overflow.
+
         Args:
-            x: Input value
-            
+            x: Input value, Matrix or Vector
+            inplace: For Matrix/Vector input, overwrite x with the result
+
         Returns:
-            1 / (1 + exp(-x))
+            1 / (1 + exp(-x)), element-wise for Matrix/Vector input
         """
-        return 1.0 / (1.0 + math.exp(-x))
-    
+        if isinstance(x, (Matrix, Vector)):
+            return _apply(x, _sigmoid_values, inplace)
+        if x >= 0:
+            return 1.0 / (1.0 + math.exp(-x))
+        e = math.exp(x)
+        return e / (1.0 + e)
+
     @staticmethod
-    def tanh(x: float) -> float:
+    def tanh(x: Union[float, Batch], inplace: bool = False) -> Union[float, Batch]:
         """Hyperbolic tangent activation function.
-        
+
         Args:
-            x: Input value
-            
+            x: Input value, Matrix or Vector
+            inplace: For Matrix/Vector input, overwrite x with the result
+
         Returns:
-            tanh(x)
+            tanh(x), element-wise for Matrix/Vector input
         """
+        if isinstance(x, (Matrix, Vector)):
+            return _apply(x, _tanh_values, inplace)
         return math.tanh(x)
+
+    @staticmethod
+    def softmax(x: Batch, inplace: bool = False) -> Batch:
+        """Numerically stable softmax.
+
+        Each row of a Matrix (or the whole Vector) is shifted by its maximum
+        before exponentiating, so large inputs don't overflow.
+
+        Args:
+            x: Matrix (normalized row by row) or Vector
+            inplace: Overwrite x with the result
+
+        Returns:
+            Probabilities that sum to 1 along each row
+        """
+        return ActivationFunctions._row_wise(x, False, inplace)
+
+    @staticmethod
+    def log_softmax(x: Batch, inplace: bool = False) -> Batch:
+        """Numerically stable log-softmax: x - max - log(sum(exp(x - max))).
+
+        Args:
+            x: Matrix (normalized row by row) or Vector
+            inplace: Overwrite x with the result
+
+        Returns:
+            Log-probabilities along each row
+        """
+        return ActivationFunctions._row_wise(x, True, inplace)
+
+    @staticmethod
+    def _row_wise(x: Batch, log: bool, inplace: bool) -> Batch:
+        if isinstance(x, Vector):
+            return _apply(x, lambda values: _softmax_row(values.tolist(), log), inplace)
+        out = x if inplace else Matrix(x.rows, x.cols, x.dtype)
+        code = _typecode(out.data)
+        for i in range(x.rows):
+            out.data[out._row_slice(i)] = array(code, _softmax_row(x.data[x._row_slice(i)].tolist(), log))
+        return out
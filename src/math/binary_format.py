@@ -0,0 +1,153 @@
+"""Binary on-disk format for matrices.
+
+A file is a fixed 24-byte header followed by the values in row-major order
+as raw little-endian IEEE 754 doubles:
+
+    offset  size  field
+    0       4     magic b"MLWM"
+    4       1     format version (1)
+    5       1     dtype code, b"d" for float64
+    6       2     padding
+    8       8     rows (unsigned little-endian)
+    16      8     cols (unsigned little-endian)
+
+The header is a multiple of 8 bytes, so the values start 8-byte aligned and
+a memory map of the file can be viewed as doubles directly. Appending rows
+writes the new values at the end and then updates the row count.
+"""
+
+from array import array
+import mmap
+import os
+import struct
+import sys
+from typing import Sequence, Tuple
+
+MAGIC = b"MLWM"
+VERSION = 1
+HEADER = struct.Struct("<4sBc2xQQ")
+ITEMSIZE = 8
+
+# Files are little-endian; on big-endian hosts values are byte-swapped on
+# the way in and out, which rules out mapping them directly.
+_NATIVE = sys.byteorder == "little"
+
+
+def _values_bytes(data: Sequence[float]) -> memoryview:
+    """Little-endian bytes of a flat 'd' buffer (array or memoryview)."""
+    if _NATIVE:
+        return memoryview(data).cast('B')
+    swapped = array('d', data)
+    swapped.byteswap()
+    return memoryview(swapped).cast('B')
+
+
+def _read_header(fh, path: str) -> Tuple[int, int]:
+    raw = fh.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError(f"{path} is too short to be a matrix file")
+    magic, version, dtype, rows, cols = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a matrix file")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported format version {version}")
+    if dtype != b"d":
+        raise ValueError(f"{path} has unsupported dtype {dtype!r}")
+    expected = HEADER.size + rows * cols * ITEMSIZE
+    size = os.fstat(fh.fileno()).st_size
+    if size < expected:
+        raise ValueError(f"{path} is truncated: {size} bytes, header needs {expected}")
+    return rows, cols
+
+
+def write(path: str, rows: int, cols: int, data: Sequence[float]) -> None:
+    """Write a flat row-major buffer of rows * cols doubles to path."""
+    with open(path, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, VERSION, b"d", rows, cols))
+        fh.write(_values_bytes(data))
+
+
+def read_header(path: str) -> Tuple[int, int]:
+    """Return (rows, cols) of a matrix file without reading its values."""
+    with open(path, "rb") as fh:
+        return _read_header(fh, path)
+
+
+def load(path: str, use_mmap: bool = True) -> Tuple[int, int, Sequence[float]]:
+    """Open a matrix file.
+
+    Args:
+        path: File written by ``write``/``append``
+        use_mmap: Back the values by a copy-on-write memory map instead of
+            reading them. Opening is then O(1) and pages are read from disk
+            the first time they are touched; writes to the returned buffer
+            stay in memory and never reach the file.
+
+    Returns:
+        (rows, cols, storage): storage is an ``array('d')``, or a memoryview
+        with format 'd' over the mapping
+
+    Raises:
+        ValueError: If the file is not a valid matrix file
+    """
+    with open(path, "rb") as fh:
+        rows, cols = _read_header(fh, path)
+        size = rows * cols
+        if use_mmap and _NATIVE and size > 0:
+            mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+            # The memoryview keeps the mapping alive after the file is closed
+            start = HEADER.size
+            return rows, cols, memoryview(mapping)[start:start + size * ITEMSIZE].cast('d')
+        data = array('d')
+        data.frombytes(fh.read(size * ITEMSIZE))
+    if not _NATIVE:
+        data.byteswap()
+    return rows, cols, data
+
+
+def append(path: str, rows: int, cols: int, data: Sequence[float]) -> int:
+    """Append rows to a matrix file, creating it if it doesn't exist.
+
+    Returns:
+        The file's new row count
+
+    Raises:
+        ValueError: If the file's column count differs from cols
+    """
+    if not os.path.exists(path):
+        write(path, rows, cols, data)
+        return rows
+    with open(path, "r+b") as fh:
+        old_rows, old_cols = _read_header(fh, path)
+        if old_cols != cols and old_rows > 0:
+            raise ValueError(f"Cannot append {cols}-column rows to {path} with {old_cols} columns")
+        # Values first, header last: an interrupted append leaves the old
+        # row count, so the file still reads back as it was.
+        fh.seek(HEADER.size + old_rows * old_cols * ITEMSIZE)
+        fh.write(_values_bytes(data))
+        fh.truncate()
+        fh.flush()
+        fh.seek(0)
+        fh.write(HEADER.pack(MAGIC, VERSION, b"d", old_rows + rows, cols))
+    return old_rows + rows
+
+
+def read_range(path: str, start: int, stop: int) -> Tuple[int, int, array]:
+    """Read rows [start, stop) of a matrix file, seeking past everything else.
+
+    Returns:
+        (stop - start, cols, values)
+
+    Raises:
+        IndexError: If the range is outside the file's rows
+    """
+    with open(path, "rb") as fh:
+        rows, cols = _read_header(fh, path)
+        if start < 0 or stop > rows or start > stop:
+            raise IndexError(f"Row range [{start}, {stop}) out of bounds for {rows} rows")
+        fh.seek(HEADER.size + start * cols * ITEMSIZE)
+        data = array('d')
+        data.frombytes(fh.read((stop - start) * cols * ITEMSIZE))
+    if not _NATIVE:
+        data.byteswap()
+    return stop - start, cols, data
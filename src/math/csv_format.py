@@ -0,0 +1,209 @@
+"""Chunked parsing of numeric CSV/delimited text into flat double buffers.
+
+The file is read in blocks of CHUNK_BYTES, cut at the last newline, and
+each block is converted in bulk: its lines are joined and split on the
+delimiter once, then the fields are converted with one
+``array('d', map(float, ...))`` per selected column. No Python code runs per
+cell. Blocks are independent, so they can also be parsed in worker processes.
+
+Only numeric data is supported. Fields may be quoted (blocks containing a
+quote are split with the ``csv`` module instead); blank lines are skipped.
+"""
+
+from array import array
+from collections import deque
+import csv
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import parallel
+
+# Bytes read and parsed per block
+CHUNK_BYTES = 1 << 22
+
+Columns = Optional[Sequence[Union[int, str]]]
+
+
+def _fields(lines: List[str], delimiter: str) -> List[str]:
+    """All fields of the given lines, in order, as one flat list."""
+    text = delimiter.join(lines)
+    if '"' in text:
+        return [field for row in csv.reader(lines, delimiter=delimiter) for field in row]
+    return text.split(delimiter)
+
+
+def _locate_error(lines: List[str], delimiter: str, ncols: int, first_line: int) -> ValueError:
+    """Build an error pointing at the first malformed line of a block."""
+    number = first_line
+    for number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        fields = _fields([line], delimiter)
+        if len(fields) != ncols:
+            return ValueError(f"Line {number}: expected {ncols} fields, got {len(fields)}")
+        for field in fields:
+            try:
+                float(field)
+            except ValueError:
+                return ValueError(f"Line {number}: could not convert {field.strip()!r} to float")
+    return ValueError(f"Malformed data near line {number}")
+
+
+def parse_block(text: str, delimiter: str, ncols: int, columns: Optional[List[int]],
+                first_line: int = 1) -> Tuple[int, array]:
+    """Parse whole lines of delimited numbers.
+
+    Args:
+        text: One or more complete lines
+        delimiter: Field separator
+        ncols: Number of fields every line must have
+        columns: Indices of the fields to keep, in output order; None keeps all
+        first_line: File line number of the first line, for error messages
+
+    Returns:
+        (rows, values): row-major values of the kept columns
+
+    Raises:
+        ValueError: If a line has the wrong number of fields or a kept field
+            isn't a number
+    """
+    lines = text.splitlines()
+    if not all(line.strip() for line in lines):
+        kept = [line for line in lines if line.strip()]
+    else:
+        kept = lines
+    rows = len(kept)
+    fields = _fields(kept, delimiter)
+    if rows == 0:
+        return 0, array('d')
+    if len(fields) != rows * ncols:
+        raise _locate_error(lines, delimiter, ncols, first_line)
+    try:
+        if columns is None:
+            return rows, array('d', map(float, fields))
+        width = len(columns)
+        values = array('d', [0.0]) * (rows * width)
+        for out_col, col in enumerate(columns):
+            values[out_col::width] = array('d', map(float, fields[col::ncols]))
+        return rows, values
+    except ValueError:
+        raise _locate_error(lines, delimiter, ncols, first_line) from None
+
+
+def _resolve_columns(columns: Columns, names: Optional[List[str]], ncols: int) -> Optional[List[int]]:
+    if columns is None:
+        return None
+    if not columns:
+        raise ValueError("At least one column must be selected")
+    indices = []
+    for col in columns:
+        if isinstance(col, str):
+            if names is None:
+                raise ValueError(f"Column {col!r} selected by name but the file has no header")
+            if col not in names:
+                raise ValueError(f"Column {col!r} not found in header {names}")
+            indices.append(names.index(col))
+        else:
+            index = col + ncols if col < 0 else col
+            if not 0 <= index < ncols:
+                raise IndexError(f"Column index {col} out of bounds for {ncols} columns")
+            indices.append(index)
+    return indices
+
+
+def _blocks(fh, chunk_bytes: int) -> Iterator[Tuple[str, int]]:
+    """Yield (text, first line number) blocks of whole lines."""
+    line = 1
+    pending = b""
+    while True:
+        chunk = fh.read(chunk_bytes)
+        if not chunk:
+            break
+        chunk = pending + chunk
+        cut = chunk.rfind(b"\n") + 1
+        if cut == 0:
+            pending = chunk
+            continue
+        pending = chunk[cut:]
+        text = chunk[:cut].decode("utf-8")
+        yield text, line
+        line += text.count("\n")
+    if pending.strip():
+        yield pending.decode("utf-8"), line
+
+
+def iter_blocks(path: str, columns: Columns = None, delimiter: str = ",", header: bool = False,
+                workers: Optional[int] = None,
+                chunk_bytes: int = CHUNK_BYTES) -> Iterator[Tuple[int, int, array]]:
+    """Parse a file block by block.
+
+    Yields:
+        (rows, cols, values) for each block, in file order; cols is the number
+        of selected columns. With a header, the first block is empty.
+
+    Raises:
+        ValueError: On malformed lines or unknown column names
+    """
+    with open(path, "rb") as fh:
+        first = fh.readline()
+        first_line = 1
+        while first and not first.strip():
+            first = fh.readline()
+            first_line += 1
+        if not first:
+            return
+        first_text = first.decode("utf-8")
+        first_fields = [f.strip() for f in _fields([first_text.rstrip("\r\n")], delimiter)]
+        ncols = len(first_fields)
+        names = first_fields if header else None
+        indices = _resolve_columns(columns, names, ncols)
+        width = ncols if indices is None else len(indices)
+        if header:
+            # An empty block, so a file with no data rows still reports its width
+            yield 0, width, array('d')
+        else:
+            rows, values = parse_block(first_text, delimiter, ncols, indices, first_line)
+            yield rows, width, values
+
+        blocks = ((text, line + first_line) for text, line in _blocks(fh, chunk_bytes))
+        workers = workers or 1
+        if workers == 1:
+            for text, line in blocks:
+                rows, values = parse_block(text, delimiter, ncols, indices, line)
+                yield rows, width, values
+            return
+
+        # Keep a bounded window of blocks in flight so memory stays flat
+        pool = parallel.get_pool(workers)
+        in_flight: Deque = deque()
+        for text, line in blocks:
+            in_flight.append(pool.submit(parse_block, text, delimiter, ncols, indices, line))
+            if len(in_flight) >= 2 * workers:
+                rows, values = in_flight.popleft().result()
+                yield rows, width, values
+        while in_flight:
+            rows, values = in_flight.popleft().result()
+            yield rows, width, values
+
+
+def iter_batches(path: str, batch_rows: int, columns: Columns = None, delimiter: str = ",",
+                 header: bool = False, workers: Optional[int] = None,
+                 chunk_bytes: int = CHUNK_BYTES) -> Iterator[Tuple[int, int, array]]:
+    """Re-cut parsed blocks into batches of exactly batch_rows rows (the last may be short).
+
+    Raises:
+        ValueError: If batch_rows < 1, or on malformed input
+    """
+    if batch_rows < 1:
+        raise ValueError(f"batch_rows must be at least 1, got {batch_rows}")
+    pending = array('d')
+    width = 0
+    for rows, width, values in iter_blocks(path, columns, delimiter, header, workers, chunk_bytes):
+        pending.extend(values)
+        size = batch_rows * width
+        if width and len(pending) >= size:
+            full = len(pending) // size * size
+            for start in range(0, full, size):
+                yield batch_rows, width, pending[start:start + size]
+            del pending[:full]
+    if pending:
+        yield len(pending) // width, width, pending
@@ -0,0 +1,216 @@
+"""Matrix multiply kernels over flat row-major buffers.
+
+Every kernel computes ``out = a @ b`` where ``a`` is an n x k buffer, ``b`` is a
+k x m buffer and ``out`` is a writable n x m buffer, all flat and row-major.
+The fast kernels pack the right operand into its columns once (a transposed
+copy), so each output element is a single ``sum(map(mul, row, col))`` over two
+contiguous Python lists instead of k indexed lookups that stride down ``b``.
+Products whose every dimension is large go to a Strassen kernel, which
+recurses on 2 x 2 blocks and uses the blocked kernel for the leaves.
+"""
+
+from array import array
+from operator import add, mul, sub
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Below this many multiply-adds (n * k * m) packing and tiling cost more than
+# they save, so products are computed straight from slices of the inputs.
+TINY_WORK = 16 ** 3
+
+# Outputs with at most this many columns (matrix-vector style products and
+# tall-skinny outputs) keep all packed columns hot anyway, so rows are streamed
+# whole without tiling.
+SKINNY_COLS = 16
+
+# Tile sizes for the blocked kernel: a block of BLOCK_COLS packed columns is
+# reused across BLOCK_ROWS rows of the left operand before moving on.
+BLOCK_ROWS = 64
+BLOCK_COLS = 64
+
+# The Strassen kernel splits products whose smallest dimension is above this
+# and hands smaller ones to the row-times-column base case. The default is the
+# crossover measured by benchmarks/bench_strassen.py; rerun it to retune.
+STRASSEN_CUTOFF = 256
+
+Kernel = Callable[[Sequence[float], Sequence[float], Sequence[float], int, int, int], None]
+
+
+def pack_rows(a: Sequence[float], n: int, k: int) -> List[List[float]]:
+    """Split an n x k row-major buffer into a list of n row lists."""
+    return [a[i * k:(i + 1) * k].tolist() for i in range(n)]
+
+
+def pack_cols(b: Sequence[float], k: int, m: int) -> List[List[float]]:
+    """Split a k x m row-major buffer into a list of m column lists (its transpose)."""
+    return [b[j::m].tolist() for j in range(m)]
+
+
+def matmul_naive(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+                 n: int, k: int, m: int) -> None:
+    """Reference i-j-k triple loop with one indexed lookup per operand per step."""
+    for i in range(n):
+        for j in range(m):
+            res = 0.0
+            for p in range(k):
+                res += a[i * k + p] * b[p * m + j]
+            out[i * m + j] = res
+
+
+def matmul_tiny(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+                n: int, k: int, m: int) -> None:
+    """Slice-based kernel for very small products; nothing is packed up front."""
+    for i in range(n):
+        row = a[i * k:(i + 1) * k]
+        for j in range(m):
+            out[i * m + j] = sum(map(mul, row, b[j::m]))
+
+
+def matmul_skinny(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+                  n: int, k: int, m: int) -> None:
+    """Kernel for narrow outputs: pack b once, then stream each row of a."""
+    cols = pack_cols(b, k, m)
+    for i in range(n):
+        row = a[i * k:(i + 1) * k].tolist()
+        out[i * m:(i + 1) * m] = array('d', [sum(map(mul, row, col)) for col in cols])
+
+
+def matmul_blocked(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+                   n: int, k: int, m: int) -> None:
+    """Cache-blocked kernel for large and square products.
+
+    The output is computed tile by tile: a block of BLOCK_ROWS packed rows of a
+    meets a block of BLOCK_COLS packed columns of b, so both stay resident while
+    every pair in the tile is reduced.
+    """
+    cols = pack_cols(b, k, m)
+    for i0 in range(0, n, BLOCK_ROWS):
+        i1 = min(n, i0 + BLOCK_ROWS)
+        rows = pack_rows(a[i0 * k:i1 * k], i1 - i0, k)
+        for j0 in range(0, m, BLOCK_COLS):
+            col_block = cols[j0:j0 + BLOCK_COLS]
+            j1 = j0 + len(col_block)
+            base = i0 * m
+            for row in rows:
+                out[base + j0:base + j1] = array('d', [sum(map(mul, row, col)) for col in col_block])
+                base += m
+
+
+def _add(x: array, y: array) -> array:
+    return array('d', map(add, x, y))
+
+
+def _sub(x: array, y: array) -> array:
+    return array('d', map(sub, x, y))
+
+
+def _quadrants(x: Sequence[float], rows: int, cols: int) -> Tuple[array, array, array, array]:
+    """Split a flat rows x cols buffer into its 2 x 2 blocks.
+
+    An odd dimension is padded with one zero row/column so all four blocks
+    have shape ceil(rows / 2) x ceil(cols / 2).
+    """
+    h = (rows + 1) // 2
+    w = (cols + 1) // 2
+    pad = array('d', [0.0]) * (cols % 2)
+    blocks = (array('d'), array('d'), array('d'), array('d'))
+    for i in range(rows):
+        left, right = blocks[0:2] if i < h else blocks[2:4]
+        start = i * cols
+        left.extend(x[start:start + w])
+        right.extend(x[start + w:start + cols])
+        right.extend(pad)
+    if rows % 2:
+        zeros = array('d', [0.0]) * (2 * w)
+        blocks[2].extend(zeros[:w])
+        blocks[3].extend(zeros[w:])
+    return blocks
+
+
+def _strassen(a: Sequence[float], b: Sequence[float], n: int, k: int, m: int, cutoff: int) -> array:
+    """Multiply flat n x k and k x m buffers with the Winograd form of Strassen.
+
+    Each level does 7 half-size products and 15 block additions instead of
+    8 products. Odd dimensions are padded with one zero row/column for the
+    split and the padding is dropped again when the blocks are joined.
+    """
+    if min(n, k, m) <= max(cutoff, 1):
+        out = array('d', [0.0]) * (n * m)
+        matmul_blocked(a, b, out, n, k, m)
+        return out
+    h, p, w = (n + 1) // 2, (k + 1) // 2, (m + 1) // 2
+    a11, a12, a21, a22 = _quadrants(a, n, k)
+    b11, b12, b21, b22 = _quadrants(b, k, m)
+
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+
+    m1 = _strassen(a11, b11, h, p, w, cutoff)
+    u2 = _add(m1, _strassen(s2, t2, h, p, w, cutoff))
+    u3 = _add(u2, _strassen(s3, t3, h, p, w, cutoff))
+    m5 = _strassen(s1, t1, h, p, w, cutoff)
+    c11 = _add(m1, _strassen(a12, b21, h, p, w, cutoff))
+    c12 = _add(_add(u2, m5), _strassen(s4, b22, h, p, w, cutoff))
+    c21 = _sub(u3, _strassen(a22, t4, h, p, w, cutoff))
+    c22 = _add(u3, m5)
+
+    out = array('d')
+    right = m - w
+    for i in range(n):
+        left, rest = (c11, c12) if i < h else (c21, c22)
+        start = (i if i < h else i - h) * w
+        out.extend(left[start:start + w])
+        out.extend(rest[start:start + right])
+    return out
+
+
+def matmul_strassen(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+                    n: int, k: int, m: int) -> None:
+    """Recursive kernel for large products.
+
+    Splits until the smallest dimension is at most STRASSEN_CUTOFF and runs
+    the blocked kernel below that, doing O(n^2.81) multiply-adds instead of
+    O(n^3). Results differ from the other kernels by rounding: the block
+    additions lose a few more bits; benchmarks/bench_strassen.py reports the
+    error against the naive kernel.
+    """
+    out[:n * m] = _strassen(a, b, n, k, m, STRASSEN_CUTOFF)
+
+
+KERNELS: Dict[str, Kernel] = {
+    "naive": matmul_naive,
+    "tiny": matmul_tiny,
+    "skinny": matmul_skinny,
+    "blocked": matmul_blocked,
+    "strassen": matmul_strassen,
+}
+
+
+def select_kernel(n: int, k: int, m: int) -> str:
+    """Pick a kernel name for an (n x k) @ (k x m) product based on its shape."""
+    if n * k * m <= TINY_WORK:
+        return "tiny"
+    if m <= SKINNY_COLS:
+        return "skinny"
+    if min(n, k, m) > STRASSEN_CUTOFF:
+        return "strassen"
+    return "blocked"
+
+
+def matmul(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+           n: int, k: int, m: int, kernel: str = "auto") -> None:
+    """Multiply flat buffers into out using the named kernel (or shape dispatch).
+
+    Raises:
+        ValueError: If the kernel name is unknown
+    """
+    if kernel == "auto":
+        kernel = select_kernel(n, k, m)
+    if kernel not in KERNELS:
+        raise ValueError(f"Unknown matmul kernel '{kernel}', expected one of {sorted(KERNELS)} or 'auto'")
+    KERNELS[kernel](a, b, out, n, k, m)
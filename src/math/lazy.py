@@ -0,0 +1,381 @@
+"""Lazily evaluated Matrix expressions with element-wise fusion.
+
+``lazy(m)`` wraps a Matrix in an ``Expr``. Operations on an Expr only record
+a node; nothing is computed until ``eval()`` (or ``to_rows()`` /
+``get_val_at``). At that point the graph is simplified and scheduled:
+
+- ``transpose(transpose(x))`` folds to ``x``, and nested scalings multiply
+  into one.
+- Every maximal chain of element-wise nodes (add/subtract, row-broadcast
+  add, scale, activations) becomes a single fused pass. Per chunk of
+  storage, the stages are composed as iterators, so no intermediate matrix
+  is written.
+- Intermediates are freed as soon as their last consumer has run, and
+  their buffers are reused. A fused pass writes in place into an input it
+  consumes last, so ``(X @ W + b).relu()`` allocates one matrix, not three.
+
+Example:
+    hidden = (lazy(X) @ W + b).relu()      # nothing computed yet
+    out = hidden.eval()                     # one matmul, one fused pass
+"""
+
+from array import array
+from itertools import repeat
+import operator
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .matrix import Matrix, _map_into, _typecode
+from .activation_functions import _relu_values, _sigmoid_values, _tanh_values
+
+ChunkFn = Callable[[Sequence[float]], Iterable[float]]
+
+_ELEMENTWISE = ("add", "scale", "map")
+
+
+class Expr:
+    """A node of a lazy Matrix expression.
+
+    ``op`` is one of "leaf", "matmul", "transpose", "add" (param: +1.0 or
+    -1.0), "scale" (param: the scalar) or "map" (param: (name, chunk
+    function)). Build expressions with ``lazy`` and the methods or
+    operators below; they accept Matrices and Exprs interchangeably.
+    """
+
+    __slots__ = ("op", "args", "rows", "cols", "param")
+
+    def __init__(self, op: str, args: Tuple['Expr', ...], rows: int, cols: int,
+                 param: object = None) -> None:
+        self.op = op
+        self.args = args
+        self.rows = rows
+        self.cols = cols
+        self.param = param
+
+    def __repr__(self) -> str:
+        return f"Expr(op='{self.op}', shape=({self.rows}, {self.cols}))"
+
+    def matmul(self, other: Union['Expr', Matrix]) -> 'Expr':
+        """Matrix product self @ other.
+
+        Raises:
+            ValueError: If the inner dimensions don't match
+        """
+        other = lazy(other)
+        if self.cols != other.rows:
+            raise ValueError(f"Cannot multiply matrices: {self.rows}x{self.cols} by {other.rows}x{other.cols}")
+        return Expr("matmul", (self, other), self.rows, other.cols)
+
+    def __matmul__(self, other: Union['Expr', Matrix]) -> 'Expr':
+        return self.matmul(other)
+
+    def __rmatmul__(self, other: Matrix) -> 'Expr':
+        return lazy(other).matmul(self)
+
+    def add(self, other: Union['Expr', Matrix], subtract: bool = False) -> 'Expr':
+        """Element-wise self + other (or self - other).
+
+        Either operand may also be a single row (1 x cols), which is
+        combined with every row of the other, as for a bias; the row is never
+        expanded in memory.
+
+        Raises:
+            ValueError: If the shapes are incompatible
+        """
+        other = lazy(other)
+        if other.cols != self.cols or (other.rows != self.rows and 1 not in (self.rows, other.rows)):
+            raise ValueError(f"Cannot add matrices of shapes ({self.rows}, {self.cols}) "
+                             f"and ({other.rows}, {other.cols})")
+        return Expr("add", (self, other), max(self.rows, other.rows), self.cols,
+                    -1.0 if subtract else 1.0)
+
+    def __add__(self, other: Union['Expr', Matrix]) -> 'Expr':
+        return self.add(other)
+
+    def __radd__(self, other: Matrix) -> 'Expr':
+        return lazy(other).add(self)
+
+    def __sub__(self, other: Union['Expr', Matrix]) -> 'Expr':
+        return self.add(other, subtract=True)
+
+    def __rsub__(self, other: Matrix) -> 'Expr':
+        return lazy(other).add(self, subtract=True)
+
+    def scale(self, scalar: float) -> 'Expr':
+        """Multiply every element by scalar."""
+        return Expr("scale", (self,), self.rows, self.cols, scalar)
+
+    def __mul__(self, scalar: float) -> 'Expr':
+        return self.scale(scalar)
+
+    def __rmul__(self, scalar: float) -> 'Expr':
+        return self.scale(scalar)
+
+    def __neg__(self) -> 'Expr':
+        return self.scale(-1.0)
+
+    def transpose(self) -> 'Expr':
+        return Expr("transpose", (self,), self.cols, self.rows)
+
+    @property
+    def T(self) -> 'Expr':
+        return self.transpose()
+
+    def apply(self, fn: ChunkFn, name: str = "apply") -> 'Expr':
+        """Element-wise vectorized function, as for ``Matrix.apply``."""
+        return Expr("map", (self,), self.rows, self.cols, (name, fn))
+
+    def relu(self) -> 'Expr':
+        return self.apply(_relu_values, "relu")
+
+    def sigmoid(self) -> 'Expr':
+        return self.apply(_sigmoid_values, "sigmoid")
+
+    def tanh(self) -> 'Expr':
+        return self.apply(_tanh_values, "tanh")
+
+    def plan(self) -> List[str]:
+        """The steps eval() would run, one string per step (for inspection)."""
+        return [step.describe() for step in _schedule(_simplify(self, {}))]
+
+    def eval(self, out: Optional[Matrix] = None) -> Matrix:
+        """Evaluate the expression.
+
+        Every call recomputes the result, reading the leaves as they are
+        when eval() runs, not when the expression was built.
+
+        Args:
+            out: Optional preallocated result matrix
+
+        Returns:
+            The result (out, if given). An expression that is a bare leaf or a
+            transpose of one evaluates to that matrix or a view of it.
+
+        Raises:
+            ValueError: If out has the wrong shape
+        """
+        if out is not None:
+            out._check_out(out, self.rows, self.cols)
+        return _execute(_simplify(self, {}), out)
+
+    def to_rows(self) -> List[List[float]]:
+        return self.eval().to_rows()
+
+    def get_val_at(self, i: int, j: int) -> float:
+        return self.eval().get_val_at(i, j)
+
+
+def lazy(m: Union[Expr, Matrix]) -> Expr:
+    """Start a lazy expression from a Matrix (an Expr is returned unchanged)."""
+    if isinstance(m, Expr):
+        return m
+    if not isinstance(m, Matrix):
+        raise TypeError(f"Expected a Matrix or Expr, not {type(m).__name__}")
+    return Expr("leaf", (), m.rows, m.cols, m)
+
+
+def _simplify(node: Expr, memo: Dict[int, Expr]) -> Expr:
+    """Return an equivalent graph with transposes and scalings folded.
+
+    Shared subexpressions stay shared (memo is keyed by node identity).
+    """
+    done = memo.get(id(node))
+    if done is not None:
+        return done
+    if node.op == "transpose" and node.args[0].op == "transpose":
+        result = _simplify(node.args[0].args[0], memo)
+        memo[id(node)] = result
+        return result
+    args = tuple(_simplify(arg, memo) for arg in node.args)
+    result = node
+    if node.op == "transpose":
+        child = args[0]
+        if child.op == "transpose":
+            result = child.args[0]
+        elif child.op == "leaf":
+            result = lazy(child.param.T)
+        else:
+            result = Expr("transpose", args, node.rows, node.cols)
+    elif node.op == "scale":
+        child, scalar = args[0], node.param
+        if child.op == "scale":
+            child, scalar = child.args[0], child.param * scalar
+        result = child if scalar == 1.0 else Expr("scale", (child,), node.rows, node.cols, scalar)
+    elif args != node.args:
+        result = Expr(node.op, args, node.rows, node.cols, node.param)
+    memo[id(node)] = result
+    return result
+
+
+class _Step:
+    """One unit of work: a matmul, a transpose view or a fused element-wise pass."""
+
+    def __init__(self, node: Expr, inputs: List[Expr], fn: Optional[Callable[..., Iterable[float]]] = None,
+                 stages: Sequence[str] = ()) -> None:
+        self.node = node
+        self.inputs = inputs
+        self.fn = fn
+        self.stages = stages
+
+    def describe(self) -> str:
+        if self.node.op in ("matmul", "transpose"):
+            return self.node.op
+        return "fused[" + ", ".join(self.stages) + "]"
+
+
+def _fuse(root: Expr, consumers: Dict[int, int]) -> _Step:
+    """Compose the element-wise region under root into one chunk function.
+
+    Element-wise children used only here are inlined; anything else (matmul
+    results, leaves, shared nodes) becomes an input whose storage slices are
+    passed to the composed function.
+    """
+    inputs: List[Expr] = []
+    index: Dict[int, int] = {}
+    stages: List[str] = []
+
+    def build(node: Expr, is_root: bool) -> Callable[[Sequence[Sequence[float]]], Iterable[float]]:
+        if node.op in _ELEMENTWISE and (is_root or consumers[id(node)] == 1):
+            parts = [build(arg, False) for arg in node.args]
+            if node.op == "add":
+                combine = operator.add if node.param > 0 else operator.sub
+                left, right = parts
+                stages.append("add" if node.param > 0 else "sub")
+                return lambda segs: map(combine, left(segs), right(segs))
+            if node.op == "scale":
+                (inner,), scalar = parts, node.param
+                stages.append("scale")
+                return lambda segs: map(operator.mul, inner(segs), repeat(scalar))
+            (inner,), (name, chunk_fn) = parts, node.param
+            stages.append(name)
+            return lambda segs: chunk_fn(inner(segs))
+        if id(node) not in index:
+            index[id(node)] = len(inputs)
+            inputs.append(node)
+        k = index[id(node)]
+        return lambda segs: segs[k]
+
+    composed = build(root, True)
+    return _Step(root, inputs, lambda *segs: composed(segs), stages)
+
+
+def _schedule(root: Expr) -> List[_Step]:
+    """Order the steps so every input is computed before it is used."""
+    consumers: Dict[int, int] = {}
+    stack = [root]
+    seen = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        for arg in node.args:
+            consumers[id(arg)] = consumers.get(id(arg), 0) + 1
+            stack.append(arg)
+
+    steps: List[_Step] = []
+    scheduled = set()
+
+    def visit(node: Expr) -> None:
+        if id(node) in scheduled or node.op == "leaf":
+            return
+        scheduled.add(id(node))
+        if node.op in _ELEMENTWISE:
+            step = _fuse(node, consumers)
+        else:
+            step = _Step(node, list(node.args))
+        for arg in step.inputs:
+            visit(arg)
+        steps.append(step)
+
+    visit(root)
+    return steps
+
+
+def _run_fused(step: _Step, sources: List[Matrix], out: Matrix) -> None:
+    """Write the fused function of the sources into out.
+
+    Same-shaped contiguous inputs go through ``_map_into`` in CHUNK-sized
+    runs; when a bias row is broadcast, the walk is row by row, passing the
+    same bias slice for every row.
+    """
+    broadcast = [src.rows != out.rows for src in sources]
+    if not any(broadcast):
+        _map_into(out, step.fn, *sources)
+        return
+    sources = [src.copy() if src.data is out.data and not src._same_layout(out) else src
+               for src in sources]
+    out_data = out.data
+    for i in range(out.rows):
+        segs = [src.data[src._row_slice(0 if b else i)] for src, b in zip(sources, broadcast)]
+        out_data[out._row_slice(i)] = array(_typecode(out_data), step.fn(*segs))
+
+
+def _execute(root: Expr, out: Optional[Matrix]) -> Matrix:
+    if root.op == "leaf":
+        if out is None:
+            return root.param
+        out._assign(root.param)
+        return out
+    steps = _schedule(root)
+    remaining: Dict[int, int] = {}
+    for step in steps:
+        for arg in step.inputs:
+            remaining[id(arg)] = remaining.get(id(arg), 0) + 1
+    values: Dict[int, Matrix] = {}
+    # Nodes whose buffers this evaluation allocated and may recycle. A
+    # transpose is a view of its input's buffer, so viewing a buffer removes
+    # it from here for good.
+    owned = set()
+    pool: Dict[Tuple[int, int, str], List[Matrix]] = {}
+
+    def value(node: Expr) -> Matrix:
+        return node.param if node.op == "leaf" else values[id(node)]
+
+    def allocate(rows: int, cols: int, dtype: str) -> Matrix:
+        free = pool.get((rows, cols, dtype))
+        return free.pop() if free else Matrix(rows, cols, dtype)
+
+    for step in steps:
+        node = step.node
+        is_root = node is root
+        sources = [value(arg) for arg in step.inputs]
+        # float32 only when every input is, as for the eager ops
+        dtype = "float32" if all(src.dtype == "float32" for src in sources) else "float64"
+        # Inputs consumed for the last time here can donate their buffers
+        dying = []
+        for arg in step.inputs:
+            remaining[id(arg)] -= 1
+            if remaining[id(arg)] == 0 and id(arg) in owned:
+                dying.append(arg)
+
+        if node.op == "transpose":
+            owned.discard(id(step.inputs[0]))
+            dying = []
+            result = sources[0].T
+            if is_root and out is not None:
+                out._assign(result)
+                result = out
+        elif node.op == "matmul":
+            target = out if is_root and out is not None else allocate(node.rows, node.cols, dtype)
+            result = Matrix.multiply(sources[0], sources[1], out=target)
+            owned.add(id(node))
+        else:
+            if is_root and out is not None:
+                target = out
+            else:
+                # Write in place into an input that isn't needed afterwards
+                reusable = [arg for arg in dying
+                            if value(arg).rows == node.rows and value(arg).cols == node.cols
+                            and value(arg).dtype == dtype]
+                target = value(reusable[0]) if reusable else allocate(node.rows, node.cols, dtype)
+                if reusable:
+                    dying.remove(reusable[0])
+            _run_fused(step, sources, target)
+            result = target
+            owned.add(id(node))
+        values[id(node)] = result
+
+        for arg in dying:
+            buf = values.pop(id(arg))
+            pool.setdefault((buf.rows, buf.cols, buf.dtype), []).append(buf)
+    return values[id(root)]
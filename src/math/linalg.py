@@ -0,0 +1,423 @@
+"""Dense linear algebra: LU, Cholesky and QR factorizations and solvers.
+
+Every factorization works on one private flat ``array('d')`` copy of its
+input. Row updates still build short-lived arrays (``_axpy``), and each LU
+panel allocates its L21 @ U12 product before subtracting it:
+
+* ``LU`` uses partial pivoting and is blocked: a panel of BLOCK columns is
+  eliminated, then the trailing submatrix is updated with one
+  ``Matrix.multiply`` (L21 @ U12), so most of the work runs in the matmul
+  kernels.
+* ``Cholesky`` is computed row by row; each entry of L is a single
+  contiguous dot product with an already finished row.
+* ``QR`` applies Householder reflectors to a column-major copy, so each
+  reflector touches contiguous slices of the remaining columns.
+
+``lu``, ``cholesky`` and ``qr`` cache the factorization per matrix, so
+repeated ``solve`` calls against the same matrix factor it only once. A
+cached factorization is reused only while the matrix's shape and bytes still
+match a copy taken when it was factored; writing to the matrix makes the next
+call factor it again.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+import math
+from operator import mul, sub
+import sys
+import weakref
+from typing import Dict, Tuple, Type, Union
+
+from .matrix import Matrix
+from .vector import Vector
+
+# Panel width of the blocked LU
+BLOCK = 64
+
+Operand = Union[Matrix, Vector]
+
+
+def _axpy(y: array, alpha: float, x: array) -> array:
+    """y - alpha * x as a new array."""
+    return array('d', map(sub, y, map(mul, repeat(alpha), x)))
+
+
+class Factorization(ABC):
+    """Common solve/inverse plumbing; subclasses solve one column at a time."""
+
+    rows: int
+    cols: int
+
+    @abstractmethod
+    def _solve_column(self, b: array) -> array:
+        """Solve A x = b for one right-hand side column, as a new array."""
+
+    def solve(self, b: Operand) -> Operand:
+        """Solve A x = b for a right-hand side Vector or for each column of a Matrix.
+
+        Returns:
+            x, of the same type as b
+
+        Raises:
+            ValueError: If b has the wrong number of rows, or A is singular
+            TypeError: If b is not a Vector or Matrix
+        """
+        if isinstance(b, Vector):
+            if b.size() != self.rows:
+                raise ValueError(f"Right-hand side has size {b.size()}, expected {self.rows}")
+            return Vector._from_storage(self._solve_column(array('d', b.vector)))
+        if not isinstance(b, Matrix):
+            raise TypeError(f"Right-hand side must be a Vector or Matrix, not {type(b).__name__}")
+        if b.rows != self.rows:
+            raise ValueError(f"Right-hand side has {b.rows} rows, expected {self.rows}")
+        result = Matrix(self.cols, b.cols)
+        for j in range(b.cols):
+            result.data[result._col_slice(j)] = self._solve_column(array('d', b.data[b._col_slice(j)]))
+        return result
+
+    def inverse(self) -> Matrix:
+        """A^-1, from solving against the identity.
+
+        Raises:
+            ValueError: If A is singular
+        """
+        identity = Matrix(self.rows, self.rows)
+        identity.data[::self.rows + 1] = array('d', [1.0]) * self.rows
+        return self.solve(identity)
+
+
+class LU(Factorization):
+    """P A = L U with partial pivoting, for a square matrix.
+
+    L (unit lower triangular, diagonal not stored) and U share one n x n
+    buffer ``lu``; ``perm[i]`` is the row of A that ended up in row i.
+    """
+
+    def __init__(self, a: Matrix) -> None:
+        """Factor a.
+
+        Raises:
+            ValueError: If a is not square
+        """
+        if a.rows != a.cols:
+            raise ValueError(f"LU needs a square matrix, got {a.rows}x{a.cols}")
+        self.rows = self.cols = n = a.rows
+        self.lu = lu = array('d', a.flat())
+        self.perm = list(range(n))
+        self.sign = 1.0
+        self.singular = False
+        whole = Matrix._from_storage(n, n, lu)
+        for k0 in range(0, n, BLOCK):
+            k1 = min(n, k0 + BLOCK)
+            # Eliminate the panel's columns; rows are swapped whole, so earlier
+            # columns of L follow their rows
+            for k in range(k0, k1):
+                magnitudes = list(map(abs, lu[k * n + k::n]))
+                p = k + magnitudes.index(max(magnitudes))
+                if p != k:
+                    lu[k * n:(k + 1) * n], lu[p * n:(p + 1) * n] = lu[p * n:(p + 1) * n], lu[k * n:(k + 1) * n]
+                    self.perm[k], self.perm[p] = self.perm[p], self.perm[k]
+                    self.sign = -self.sign
+                pivot = lu[k * n + k]
+                if pivot == 0.0:
+                    # The whole column below is zero too; nothing to eliminate
+                    self.singular = True
+                    continue
+                pivot_row = lu[k * n + k + 1:k * n + k1]
+                for i in range(k + 1, n):
+                    start = i * n + k
+                    factor = lu[start] / pivot
+                    lu[start] = factor
+                    if factor:
+                        lu[start + 1:i * n + k1] = _axpy(lu[start + 1:i * n + k1], factor, pivot_row)
+            if k1 == n:
+                break
+            # U12 = L11^-1 A12
+            for i in range(k0 + 1, k1):
+                row = lu[i * n + k1:(i + 1) * n]
+                for j in range(k0, i):
+                    factor = lu[i * n + j]
+                    if factor:
+                        row = _axpy(row, factor, lu[j * n + k1:(j + 1) * n])
+                lu[i * n + k1:(i + 1) * n] = row
+            # A22 -= L21 @ U12
+            whole[k1:, k1:] -= Matrix.multiply(whole[k1:, k0:k1], whole[k0:k1, k1:])
+
+    @property
+    def L(self) -> Matrix:
+        """Unit lower triangular factor."""
+        n = self.rows
+        result = Matrix(n, n)
+        for i in range(n):
+            result.data[i * n:i * n + i] = self.lu[i * n:i * n + i]
+            result.data[i * n + i] = 1.0
+        return result
+
+    @property
+    def U(self) -> Matrix:
+        """Upper triangular factor."""
+        n = self.rows
+        result = Matrix(n, n)
+        for i in range(n):
+            result.data[i * n + i:(i + 1) * n] = self.lu[i * n + i:(i + 1) * n]
+        return result
+
+    def det(self) -> float:
+        """Determinant of A (0.0 if singular)."""
+        if self.singular:
+            return 0.0
+        return self.sign * math.prod(self.lu[::self.rows + 1])
+
+    def _solve_column(self, b: array) -> array:
+        if self.singular:
+            raise ValueError("Matrix is singular")
+        n, lu = self.rows, self.lu
+        y = array('d')
+        for i in range(n):
+            y.append(b[self.perm[i]] - sum(map(mul, lu[i * n:i * n + i], y)))
+        x = array('d', [0.0]) * n
+        for i in range(n - 1, -1, -1):
+            start = i * n + i
+            x[i] = (y[i] - sum(map(mul, lu[start + 1:(i + 1) * n], x[i + 1:]))) / lu[start]
+        return x
+
+
+class Cholesky(Factorization):
+    """A = L L^T for a symmetric positive definite matrix.
+
+    Only the lower triangle of A is read. L is stored in ``l``, n x n
+    row-major with zeros above the diagonal.
+    """
+
+    def __init__(self, a: Matrix) -> None:
+        """Factor a.
+
+        Raises:
+            ValueError: If a is not square or not positive definite
+        """
+        if a.rows != a.cols:
+            raise ValueError(f"Cholesky needs a square matrix, got {a.rows}x{a.cols}")
+        self.rows = self.cols = n = a.rows
+        self.l = l = array('d', a.flat())
+        for i in range(n):
+            start = i * n
+            for j in range(i):
+                l[start + j] = (l[start + j] - sum(map(mul, l[start:start + j], l[j * n:j * n + j]))) / l[j * n + j]
+            diagonal = l[start + i] - sum(map(mul, l[start:start + i], l[start:start + i]))
+            if diagonal <= 0.0:
+                raise ValueError("Matrix is not positive definite")
+            l[start + i] = math.sqrt(diagonal)
+            l[start + i + 1:start + n] = array('d', [0.0]) * (n - i - 1)
+
+    @property
+    def L(self) -> Matrix:
+        """Lower triangular factor."""
+        return Matrix._from_storage(self.rows, self.rows, array('d', self.l))
+
+    def det(self) -> float:
+        """Determinant of A, the squared product of L's diagonal."""
+        diagonal = self.l[::self.rows + 1]
+        return math.prod(map(mul, diagonal, diagonal))
+
+    def _solve_column(self, b: array) -> array:
+        n, l = self.rows, self.l
+        y = array('d')
+        for i in range(n):
+            y.append((b[i] - sum(map(mul, l[i * n:i * n + i], y))) / l[i * n + i])
+        x = array('d', [0.0]) * n
+        for i in range(n - 1, -1, -1):
+            # Row i of L^T is column i of L below the diagonal
+            x[i] = (y[i] - sum(map(mul, l[(i + 1) * n + i::n], x[i + 1:]))) / l[i * n + i]
+        return x
+
+
+class QR(Factorization):
+    """A = Q R by Householder reflections, for an m x n matrix with m >= n.
+
+    Works on ``qt``, a column-major copy of A (row j of ``qt`` is column j).
+    Afterwards R is on and above its diagonal and the reflector vectors are
+    below it, with an implicit leading 1 and scale factors in ``tau``.
+    ``solve`` returns the least-squares solution.
+    """
+
+    def __init__(self, a: Matrix) -> None:
+        """Factor a.
+
+        Raises:
+            ValueError: If a has fewer rows than columns
+        """
+        if a.rows < a.cols:
+            raise ValueError(f"QR needs at least as many rows as columns, got {a.rows}x{a.cols}")
+        self.rows, self.cols = m, n = a.rows, a.cols
+        self.qt = qt = array('d', a.T.flat())
+        self.tau = array('d', [0.0]) * n
+        for k in range(n):
+            start = k * m + k
+            x = qt[start:(k + 1) * m]
+            norm = math.sqrt(sum(map(mul, x, x)))
+            if norm == 0.0:
+                continue
+            r = -math.copysign(norm, x[0])
+            self.tau[k] = tau = (r - x[0]) / r
+            qt[start] = r
+            qt[start + 1:(k + 1) * m] = array('d', map(mul, x[1:], repeat(1.0 / (x[0] - r))))
+            v = self._reflector(k)
+            for j in range(k + 1, n):
+                column = qt[j * m + k:(j + 1) * m]
+                w = tau * sum(map(mul, v, column))
+                if w:
+                    qt[j * m + k:(j + 1) * m] = _axpy(column, w, v)
+
+    def _reflector(self, k: int) -> array:
+        v = array('d', [1.0])
+        v.extend(self.qt[k * self.rows + k + 1:(k + 1) * self.rows])
+        return v
+
+    def _apply_qt(self, b: array) -> array:
+        """Q^T b, in place."""
+        for k in range(self.cols):
+            if self.tau[k]:
+                v = self._reflector(k)
+                w = self.tau[k] * sum(map(mul, v, b[k:]))
+                b[k:] = _axpy(b[k:], w, v)
+        return b
+
+    @property
+    def R(self) -> Matrix:
+        """Upper triangular n x n factor."""
+        m, n = self.rows, self.cols
+        result = Matrix(n, n)
+        for j in range(n):
+            result.data[j:j * n + j + 1:n] = self.qt[j * m:j * m + j + 1]
+        return result
+
+    @property
+    def Q(self) -> Matrix:
+        """Orthonormal m x n factor (the thin Q)."""
+        m, n = self.rows, self.cols
+        result = Matrix(m, n)
+        for j in range(n):
+            column = array('d', [0.0]) * m
+            column[j] = 1.0
+            # Q e_j = H_0 ... H_{n-1} e_j, applying the last reflector first
+            for k in range(n - 1, -1, -1):
+                if self.tau[k]:
+                    v = self._reflector(k)
+                    w = self.tau[k] * sum(map(mul, v, column[k:]))
+                    column[k:] = _axpy(column[k:], w, v)
+            result.data[result._col_slice(j)] = column
+        return result
+
+    def _solve_column(self, b: array) -> array:
+        m, n, qt = self.rows, self.cols, self.qt
+        # Diagonal entries this small relative to the largest are rounding
+        # noise from dependent columns
+        diagonal = qt[::m + 1]
+        tolerance = max(map(abs, diagonal), default=0.0) * m * sys.float_info.epsilon
+        if any(abs(d) <= tolerance for d in diagonal):
+            raise ValueError("Matrix is rank deficient")
+        y = self._apply_qt(b)
+        x = array('d', [0.0]) * n
+        for i in range(n - 1, -1, -1):
+            # Row i of R, right of the diagonal, is entry i of the later columns
+            x[i] = (y[i] - sum(map(mul, qt[(i + 1) * m + i::m], x[i + 1:]))) / diagonal[i]
+        return x
+
+
+# id(matrix) -> (weak reference to it, {factorization kind: (fingerprint, factorization)}).
+# Keyed by id rather than by the matrix, since Matrix.__eq__ is element-wise.
+_cache: Dict[int, Tuple[weakref.ref, Dict[str, Tuple[Tuple[int, int, bytes], Factorization]]]] = {}
+
+
+def _fingerprint(a: Matrix) -> Tuple[int, int, bytes]:
+    # The contents themselves rather than a hash of them, so a changed matrix
+    # can never be mistaken for the one that was factored
+    return a.rows, a.cols, a.flat().tobytes()
+
+
+def _entries(a: Matrix) -> Dict[str, Tuple[Tuple[int, int, bytes], Factorization]]:
+    key = id(a)
+    hit = _cache.get(key)
+    if hit is not None and hit[0]() is a:
+        return hit[1]
+    entries: Dict[str, Tuple[Tuple[int, int, bytes], Factorization]] = {}
+    # Drop the entry when the matrix is garbage collected
+    _cache[key] = (weakref.ref(a, lambda _, key=key: _cache.pop(key, None)), entries)
+    return entries
+
+
+def _factor(kind: Type[Factorization], a: Matrix, cache: bool) -> Factorization:
+    if not cache:
+        return kind(a)
+    entries = _entries(a)
+    fingerprint = _fingerprint(a)
+    hit = entries.get(kind.__name__)
+    if hit is not None and hit[0] == fingerprint:
+        return hit[1]
+    factorization = kind(a)
+    entries[kind.__name__] = (fingerprint, factorization)
+    return factorization
+
+
+def clear_cache() -> None:
+    """Forget all cached factorizations."""
+    _cache.clear()
+
+
+def lu(a: Matrix, cache: bool = True) -> LU:
+    """LU factorization of a square matrix, reused while a is unchanged."""
+    return _factor(LU, a, cache)
+
+
+def cholesky(a: Matrix, cache: bool = True) -> Cholesky:
+    """Cholesky factorization of a symmetric positive definite matrix, reused while a is unchanged."""
+    return _factor(Cholesky, a, cache)
+
+
+def qr(a: Matrix, cache: bool = True) -> QR:
+    """Householder QR of an m x n matrix (m >= n), reused while a is unchanged."""
+    return _factor(QR, a, cache)
+
+
+def solve(a: Matrix, b: Operand, method: str = "lu") -> Operand:
+    """Solve a x = b for square a.
+
+    Args:
+        a: Square coefficient matrix
+        b: Right-hand side Vector, or Matrix of right-hand side columns
+        method: "lu", or "cholesky" for symmetric positive definite a (about
+            twice as fast)
+
+    Returns:
+        x, of the same type as b
+
+    Raises:
+        ValueError: If the shapes don't match, a is singular (or not positive
+            definite for "cholesky"), or the method is unknown
+    """
+    if method == "lu":
+        return lu(a).solve(b)
+    if method == "cholesky":
+        return cholesky(a).solve(b)
+    raise ValueError(f"Unknown solve method '{method}', expected 'lu' or 'cholesky'")
+
+
+def inverse(a: Matrix) -> Matrix:
+    """Inverse of a square matrix. Raises ValueError if it is singular."""
+    return lu(a).inverse()
+
+
+def det(a: Matrix) -> float:
+    """Determinant of a square matrix."""
+    return lu(a).det()
+
+
+def lstsq(a: Matrix, b: Operand) -> Operand:
+    """Least-squares solution of a x = b for m x n a with m >= n, via QR.
+
+    Raises:
+        ValueError: If a has fewer rows than columns, is rank deficient, or b
+            has the wrong number of rows
+    """
+    return qr(a).solve(b)
@@ -1,144 +1,906 @@
-# Type annotations only using built-in types
+from array import array
+from functools import partial
+from itertools import repeat
+import operator
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import binary_format, csv_format, kernels, parallel
+from .vector import DTYPES, Vector
+
+# Element-wise operations are applied CHUNK values at a time, so the temporary
+# array built for each slice assignment stays small no matter how large the
+# matrix is.
+CHUNK = 4096
+
+_DTYPE_NAMES = {code: name for name, code in DTYPES.items()}
+
+
+def _typecode(data: Sequence[float]) -> str:
+    """Typecode of a storage buffer (an array or a 1-D memoryview)."""
+    return data.typecode if isinstance(data, array) else data.format
+
+
+def _dtype_code(dtype: str) -> str:
+    """Typecode for a dtype name. Raises ValueError if it is unknown."""
+    try:
+        return DTYPES[dtype]
+    except KeyError:
+        raise ValueError(f"Unknown dtype '{dtype}', expected one of {list(DTYPES)}") from None
+
+
+def _result_code(*operands: object) -> str:
+    """Typecode of a result: float32 only if every Matrix operand is float32."""
+    codes = {_typecode(x.data) for x in operands if isinstance(x, Matrix)}
+    return 'f' if codes == {'f'} else 'd'
+
+
+def _take(data: Sequence[float], s: slice) -> array:
+    """Slice a storage buffer, always returning an ``array`` of its typecode.
+
+    Slicing an array already yields an array; memoryview-backed storage is
+    copied so the result can be assigned into an array slice.
+    """
+    chunk = data[s]
+    return chunk if isinstance(chunk, array) else array(_typecode(data), chunk)
+
+
+def _segments(m: 'Matrix', contiguous: bool, size: int) -> Iterable[slice]:
+    """Yield storage slices covering m in row-major order.
+
+    Contiguous matrices are walked CHUNK values at a time; otherwise one slice
+    per row is produced. Two matrices of the same shape walked with the same
+    `contiguous` flag yield slices of matching lengths.
+    """
+    if contiguous:
+        base = m.offset
+        for start in range(0, size, CHUNK):
+            yield slice(base + start, base + min(start + CHUNK, size))
+    else:
+        for i in range(m.rows):
+            yield m._row_slice(i)
+
+
+def _map_into(out: 'Matrix', fn: Callable[..., Iterable[float]], *sources: 'Matrix') -> None:
+    """Write fn(*source_slices) into out, one storage slice at a time.
+
+    fn receives matching slices of every source and returns the values for the
+    corresponding slice of out, e.g. ``partial(map, operator.add)``. Each slice
+    is read before it is written, so out may be one of the sources. A source
+    that shares out's storage with a different layout (for example
+    ``m.add_(m.T)``) is copied first so no element is read after it was
+    overwritten.
+    """
+    sources = tuple(src.copy() if src.data is out.data and not src._same_layout(out) else src
+                    for src in sources)
+    contiguous = out.is_contiguous() and all(src.is_contiguous() for src in sources)
+    size = out.rows * out.cols
+    out_data = out.data
+    code = _typecode(out_data)
+    source_data = [src.data for src in sources]
+    walkers = [_segments(src, contiguous, size) for src in sources]
+    for dest in _segments(out, contiguous, size):
+        out_data[dest] = array(code, fn(*(data[next(walk)] for data, walk in zip(source_data, walkers))))
+
+
+# Operator arguments: matrices, vectors (treated as one row) and numbers
+Operand = Union['Matrix', Vector, float]
+
+
+def _operand(x: Operand) -> Optional[Union['Matrix', float]]:
+    """Normalize an operator argument, or return None if it isn't supported.
+
+    A Vector becomes a 1 x n row view over its storage.
+    """
+    if isinstance(x, (Matrix, int, float)):
+        return x
+    if isinstance(x, Vector):
+        return Matrix._from_storage(1, x.size(), x.vector)
+    return None
+
+
+def _broadcast_shape(m1: 'Matrix', m2: 'Matrix') -> Tuple[int, int]:
+    """Shape of m1 and m2 broadcast together; a size-1 axis stretches to match."""
+    rows = m1.rows if m2.rows == 1 else m2.rows
+    cols = m1.cols if m2.cols == 1 else m2.cols
+    if m1.rows not in (1, rows) or m1.cols not in (1, cols):
+        raise ValueError(f"Cannot broadcast matrices of shapes ({m1.rows}, {m1.cols}) and ({m2.rows}, {m2.cols})")
+    return rows, cols
+
+
+def _row_source(x: Union['Matrix', float], rows: int, cols: int) -> Callable[[int], Iterable[float]]:
+    """Return a function giving row i of x broadcast to rows x cols.
+
+    A single row is copied out once and handed back for every row, and a
+    column value or scalar is repeated lazily, so the broadcast operand is
+    never expanded in memory.
+    """
+    if not isinstance(x, Matrix):
+        return lambda i: repeat(x, cols)
+    if x.cols == 1 and cols != 1:
+        column = _take(x.data, x._col_slice(0))
+        if x.rows == 1:
+            return lambda i: repeat(column[0], cols)
+        return lambda i: repeat(column[i], cols)
+    if x.rows == 1 and rows != 1:
+        row = _take(x.data, x._row_slice(0))
+        return lambda i: row
+    data = x.data
+    return lambda i: data[x._row_slice(i)]
+
+
+def _index_range(key: Union[int, slice], length: int, axis: str) -> Tuple[int, int, int]:
+    """Normalize an int or slice key to (start, count, step) along one axis."""
+    if isinstance(key, slice):
+        start, stop, step = key.indices(length)
+        if step < 1:
+            raise ValueError("Matrix views only support positive slice steps")
+        return start, len(range(start, stop, step)), step
+    if isinstance(key, int):
+        index = key + length if key < 0 else key
+        if index < 0 or index >= length:
+            raise IndexError(f"{axis} index {key} out of bounds for size {length}")
+        return index, 1, 1
+    raise TypeError(f"Matrix indices must be ints or slices, not {type(key).__name__}")
 
 
 class Matrix:
-    """A basic matrix implementation for educational ML purposes."""
-    
-    def __init__(self, n: int, m: int) -> None:
-        """Initialize matrix with n rows and m columns, filled with zeros."""
+    """A basic matrix implementation for educational ML purposes.
+
+    Values live in a flat ``array`` buffer (``self.data``) and element
+    (i, j) is stored at ``data[offset + i * row_stride + j * col_stride]``.
+    A freshly created matrix is row-major with ``offset == 0``,
+    ``row_stride == cols`` and ``col_stride == 1``. Views made by
+    ``transpose``, slicing, ``row`` and ``col`` share the buffer of the matrix
+    they came from and only change the offset and strides; writes through a
+    view are visible in the original. Use ``copy()`` for independent storage.
+
+    The buffer's element type is the matrix's ``dtype``: "float64"
+    (``array('d')``, the default) or "float32" (``array('f')``), which halves
+    memory. Results keep the dtype of their operands; mixing float32 with
+    float64 gives float64. Arithmetic is carried out in Python floats either
+    way, and values are rounded to float32 when stored.
+    """
+
+    def __init__(self, n: int, m: int, dtype: str = "float64") -> None:
+        """Initialize matrix with n rows and m columns, filled with zeros.
+
+        Raises:
+            ValueError: If dtype is not "float64" or "float32"
+        """
         self.rows = n
         self.cols = m
-        self.matrix = [[0.0 for _ in range(m)] for _ in range(n)]
-    
+        self.data = array(_dtype_code(dtype), [0.0]) * (n * m)
+        self.offset = 0
+        self.row_stride = m
+        self.col_stride = 1
+
+    @staticmethod
+    def _view(data: Sequence[float], n: int, m: int, offset: int,
+              row_stride: int, col_stride: int) -> 'Matrix':
+        """Create a matrix over existing storage with the given layout."""
+        result = Matrix.__new__(Matrix)
+        result.rows = n
+        result.cols = m
+        result.data = data
+        result.offset = offset
+        result.row_stride = row_stride
+        result.col_stride = col_stride
+        return result
+
+    @staticmethod
+    def _from_storage(n: int, m: int, data: Sequence[float]) -> 'Matrix':
+        """Wrap an existing flat row-major buffer without copying or zero-filling."""
+        return Matrix._view(data, n, m, 0, m, 1)
+
+    @staticmethod
+    def zeros(n: int, m: int, dtype: str = "float64") -> 'Matrix':
+        """Create an n x m matrix filled with zeros."""
+        return Matrix(n, m, dtype)
+
+    @staticmethod
+    def full(n: int, m: int, val: float, dtype: str = "float64") -> 'Matrix':
+        """Create an n x m matrix with every element set to val."""
+        return Matrix._from_storage(n, m, array(_dtype_code(dtype), [val]) * (n * m))
+
+    @staticmethod
+    def from_rows(rows: Iterable[Sequence[float]], dtype: str = "float64") -> 'Matrix':
+        """Create a matrix from a sequence of equally sized rows.
+
+        Args:
+            rows: Iterable of rows, each a sequence of numbers
+            dtype: "float64" or "float32"
+
+        Returns:
+            New matrix holding a copy of the values
+
+        Raises:
+            ValueError: If the rows don't all have the same length, or the
+                dtype is unknown
+        """
+        data = array(_dtype_code(dtype))
+        n = 0
+        m = -1
+        for row in rows:
+            if m == -1:
+                m = len(row)
+            elif len(row) != m:
+                raise ValueError(f"Row {n} has length {len(row)}, expected {m}")
+            data.extend(row)
+            n += 1
+        return Matrix._from_storage(n, max(m, 0), data)
+
+    @staticmethod
+    def from_buffer(buf: Sequence[float], n: int, m: int, dtype: Optional[str] = None) -> 'Matrix':
+        """Create an n x m matrix over a flat row-major buffer.
+
+        An ``array('d')`` or ``array('f')``, or a 1-D memoryview with format
+        ``'d'`` or ``'f'``, is used directly when it matches dtype, so writes
+        to the matrix are visible through the buffer and vice versa. Any other
+        iterable of numbers is copied into a new array.
+
+        Args:
+            buf: Flat row-major values
+            n: Number of rows
+            m: Number of columns
+            dtype: "float64" or "float32"; None keeps the dtype of an array
+                or memoryview buffer and uses float64 for anything else
+
+        Returns:
+            Matrix backed by buf (or a copy of it)
+
+        Raises:
+            ValueError: If the buffer doesn't hold exactly n * m values, or
+                the dtype is unknown
+        """
+        code = _dtype_code(dtype) if dtype is not None else None
+        if isinstance(buf, memoryview) and buf.ndim != 1:
+            buf = buf.tolist()
+        if isinstance(buf, (array, memoryview)) and _typecode(buf) in _DTYPE_NAMES:
+            data = buf if code in (None, _typecode(buf)) else array(code, buf)
+        else:
+            data = array(code or 'd', buf)
+        if len(data) != n * m:
+            raise ValueError(f"Buffer of length {len(data)} cannot be viewed as a {n}x{m} matrix")
+        return Matrix._from_storage(n, m, data)
+
+    def save(self, path: str) -> None:
+        """Write the matrix to path in the binary format (see ``binary_format``).
+
+        Files always hold float64 values; float32 matrices are widened.
+        """
+        binary_format.write(path, self.rows, self.cols, self.astype("float64").flat()
+                            if self.dtype != "float64" else self.flat())
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> 'Matrix':
+        """Open a matrix saved with ``save`` or ``append_rows``.
+
+        Args:
+            path: Matrix file
+            mmap: Back the matrix by a copy-on-write memory map of the file, so
+                opening is instant and only the pages actually used are read.
+                Writes change the matrix but never the file. False reads the
+                whole file into memory.
+
+        Returns:
+            The loaded matrix
+
+        Raises:
+            ValueError: If path is not a valid matrix file
+        """
+        rows, cols, data = binary_format.load(path, mmap)
+        return Matrix._from_storage(rows, cols, data)
+
+    @staticmethod
+    def append_rows(path: str, m: 'Matrix') -> int:
+        """Append the rows of m to a matrix file, creating it if needed.
+
+        Returns:
+            The file's new row count
+
+        Raises:
+            ValueError: If the file has a different number of columns
+        """
+        return binary_format.append(path, m.rows, m.cols, m.astype("float64").flat()
+                                    if m.dtype != "float64" else m.flat())
+
+    @staticmethod
+    def read_rows(path: str, start: int, stop: int) -> 'Matrix':
+        """Read rows [start, stop) of a matrix file without reading the rest.
+
+        Raises:
+            IndexError: If the range is outside the file's rows
+        """
+        rows, cols, data = binary_format.read_range(path, start, stop)
+        return Matrix._from_storage(rows, cols, data)
+
+    @staticmethod
+    def from_csv(path: str, columns: Optional[Sequence[Union[int, str]]] = None,
+                 delimiter: str = ",", header: bool = False,
+                 workers: Optional[int] = None) -> 'Matrix':
+        """Read a numeric CSV (or other delimited text) file into a matrix.
+
+        The file is parsed in large blocks, each converted in bulk straight
+        into flat storage (see ``csv_format``).
+
+        Args:
+            path: File of one row per line
+            columns: Column indices, or names when header is True, to keep (in
+                this order); None keeps every column
+            delimiter: Field separator
+            header: Whether the first line holds column names
+            workers: Number of processes to parse blocks in; None or 1 parses
+                in this process
+
+        Returns:
+            Matrix with one row per non-blank data line
+
+        Raises:
+            ValueError: If a line has the wrong number of fields, a kept field
+                isn't a number, or a column name is unknown
+            IndexError: If a column index is out of range
+        """
+        data = array('d')
+        rows = cols = 0
+        for block_rows, cols, values in csv_format.iter_blocks(path, columns, delimiter, header, workers):
+            data.extend(values)
+            rows += block_rows
+        return Matrix._from_storage(rows, cols, data)
+
+    @staticmethod
+    def iter_csv_batches(path: str, batch_rows: int,
+                         columns: Optional[Sequence[Union[int, str]]] = None,
+                         delimiter: str = ",", header: bool = False,
+                         workers: Optional[int] = None) -> Iterator['Matrix']:
+        """Stream a delimited text file as matrices of batch_rows rows.
+
+        Only a few parse blocks are held in memory at a time, so this works
+        for files larger than memory. Arguments are as for ``from_csv``.
+
+        Yields:
+            Matrices of batch_rows rows; the last may have fewer
+
+        Raises:
+            ValueError: If batch_rows < 1, or as for ``from_csv``
+        """
+        for rows, cols, values in csv_format.iter_batches(path, batch_rows, columns, delimiter,
+                                                          header, workers):
+            yield Matrix._from_storage(rows, cols, values)
+
+    def is_contiguous(self) -> bool:
+        """Whether the elements occupy one unbroken row-major range of the buffer."""
+        return ((self.cols <= 1 or self.col_stride == 1)
+                and (self.rows <= 1 or self.row_stride == self.cols))
+
+    @property
+    def dtype(self) -> str:
+        """Element type of the storage: "float64" or "float32"."""
+        return _DTYPE_NAMES[_typecode(self.data)]
+
+    def astype(self, dtype: str) -> 'Matrix':
+        """Return a contiguous copy with the given dtype.
+
+        Raises:
+            ValueError: If dtype is unknown
+        """
+        code = _dtype_code(dtype)
+        if code == _typecode(self.data):
+            return self.copy()
+        return Matrix._from_storage(self.rows, self.cols, array(code, self.flat()))
+
+    def _same_layout(self, other: 'Matrix') -> bool:
+        return (self.offset == other.offset and self.row_stride == other.row_stride
+                and self.col_stride == other.col_stride)
+
+    def _row_slice(self, i: int) -> slice:
+        """Storage slice holding row i."""
+        start = self.offset + i * self.row_stride
+        return slice(start, start + self.cols * self.col_stride, self.col_stride)
+
+    def _col_slice(self, j: int) -> slice:
+        """Storage slice holding column j."""
+        start = self.offset + j * self.col_stride
+        return slice(start, start + self.rows * self.row_stride, self.row_stride)
+
+    def _flat_buffer(self) -> Sequence[float]:
+        """Row-major buffer of exactly rows * cols values, without copying.
+
+        Only valid for contiguous matrices; a matrix that starts part-way into
+        (or covers only part of) its storage is exposed as a memoryview slice.
+        """
+        size = self.rows * self.cols
+        if self.offset == 0 and len(self.data) == size:
+            return self.data
+        return memoryview(self.data)[self.offset:self.offset + size]
+
+    def flat(self) -> Sequence[float]:
+        """Row-major values as one flat buffer.
+
+        Contiguous matrices are exposed without copying (so writes go through);
+        other views are copied first.
+        """
+        return self.contiguous()._flat_buffer()
+
+    def copy(self) -> 'Matrix':
+        """Return a contiguous copy with its own storage."""
+        if self.is_contiguous():
+            start = self.offset
+            return Matrix._from_storage(self.rows, self.cols,
+                                        _take(self.data, slice(start, start + self.rows * self.cols)))
+        result = Matrix(self.rows, self.cols, self.dtype)
+        result._assign(self)
+        return result
+
+    def contiguous(self) -> 'Matrix':
+        """Return this matrix if it is contiguous, otherwise a contiguous copy."""
+        return self if self.is_contiguous() else self.copy()
+
+    def _assign(self, src: 'Matrix') -> None:
+        """Copy the values of a same-shaped matrix into this one, converting its dtype."""
+        if src.data is self.data and not src._same_layout(self):
+            src = src.copy()
+        contiguous = self.is_contiguous() and src.is_contiguous()
+        size = self.rows * self.cols
+        src_data = src.data
+        code = _typecode(self.data)
+        convert = _typecode(src_data) != code
+        for dest, source in zip(_segments(self, contiguous, size), _segments(src, contiguous, size)):
+            chunk = _take(src_data, source)
+            self.data[dest] = array(code, chunk) if convert else chunk
+
+    def row(self, i: int) -> 'Matrix':
+        """Return row i as a 1 x cols view."""
+        return self[i, :]
+
+    def col(self, j: int) -> 'Matrix':
+        """Return column j as a rows x 1 view."""
+        return self[:, j]
+
+    def __getitem__(self, key: Union[Tuple[Union[int, slice], Union[int, slice]], slice, int]) -> Union[float, 'Matrix']:
+        """Index with ``m[i, j]`` for a value, or with slices for a view.
+
+        ``m[r0:r1, c0:c1]``, ``m[i, :]``, ``m[:, j]`` and ``m[r0:r1]`` all return
+        views sharing this matrix's storage. Integer indices inside a slicing
+        key keep their axis with length 1, so the result is always a Matrix.
+        """
+        row_key, col_key = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(row_key, int) and isinstance(col_key, int):
+            i, _, _ = _index_range(row_key, self.rows, "Row")
+            j, _, _ = _index_range(col_key, self.cols, "Column")
+            return self.data[self.offset + i * self.row_stride + j * self.col_stride]
+        r0, n, r_step = _index_range(row_key, self.rows, "Row")
+        c0, m, c_step = _index_range(col_key, self.cols, "Column")
+        offset = self.offset + r0 * self.row_stride + c0 * self.col_stride
+        return Matrix._view(self.data, n, m, offset, self.row_stride * r_step, self.col_stride * c_step)
+
+    def __setitem__(self, key: Union[Tuple[Union[int, slice], Union[int, slice]], slice, int],
+                    value: Union[float, 'Matrix']) -> None:
+        """Set one value with ``m[i, j] = v``, or fill a sliced region.
+
+        The region may be assigned a scalar or a Matrix of the same shape.
+        """
+        target = self[key]
+        if not isinstance(target, Matrix):
+            row_key, col_key = key
+            i, _, _ = _index_range(row_key, self.rows, "Row")
+            j, _, _ = _index_range(col_key, self.cols, "Column")
+            self.data[self.offset + i * self.row_stride + j * self.col_stride] = value
+        elif isinstance(value, Matrix):
+            target._check_out(value, target.rows, target.cols)
+            target._assign(value)
+        else:
+            target.fill_(value)
+
+    def to_rows(self) -> List[List[float]]:
+        """Return the matrix contents as a list of row lists."""
+        return [self.data[self._row_slice(i)].tolist() for i in range(self.rows)]
+
     def print(self) -> None:
         """Print the matrix dimensions and contents."""
         print(f"Num rows: {self.rows} Num Cols: {self.cols}")
-        for row in self.matrix:
+        for row in self.to_rows():
             print(row)
 
     def set_val_at(self, i: int, j: int, val: float) -> None:
         """Set value at position (i, j). Raises IndexError if out of bounds."""
         if i >= self.rows or i < 0 or j >= self.cols or j < 0:
             raise IndexError(f"Index ({i}, {j}) out of bounds for {self.rows}x{self.cols} matrix")
-        self.matrix[i][j] = val
+        self.data[self.offset + i * self.row_stride + j * self.col_stride] = val
 
     def get_val_at(self, i: int, j: int) -> float:
         """Get value at position (i, j). Raises IndexError if out of bounds."""
         if i >= self.rows or i < 0 or j >= self.cols or j < 0:
             raise IndexError(f"Index ({i}, {j}) out of bounds for {self.rows}x{self.cols} matrix")
-        return self.matrix[i][j]
+        return self.data[self.offset + i * self.row_stride + j * self.col_stride]
 
     def get_rows(self) -> int:
         """Get number of rows."""
         return self.rows
-    
+
     def get_cols(self) -> int:
         """Get number of columns."""
         return self.cols
 
+    @property
+    def T(self) -> 'Matrix':
+        """Transposed view of this matrix."""
+        return Matrix.transpose(self)
+
+    def _check_out(self, out: 'Matrix', rows: int, cols: int) -> None:
+        """Raise ValueError unless out has shape rows x cols."""
+        if out.rows != rows or out.cols != cols:
+            raise ValueError(f"Output matrix has shape ({out.rows}, {out.cols}), expected ({rows}, {cols})")
+
+    def add_(self, other: 'Matrix', alpha: float = 1.0) -> 'Matrix':
+        """Add alpha * other to this matrix in place.
+
+        Args:
+            other: Matrix with the same shape
+            alpha: Scale applied to other before adding
+
+        Returns:
+            This matrix
+
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError(f"Cannot add matrices of shapes ({self.rows}, {self.cols}) and ({other.rows}, {other.cols})")
+        if alpha == 1:
+            _map_into(self, partial(map, operator.add), self, other)
+        elif alpha == -1:
+            _map_into(self, partial(map, operator.sub), self, other)
+        else:
+            scale = partial(operator.mul, alpha)
+            _map_into(self, lambda x, y: map(operator.add, x, map(scale, y)), self, other)
+        return self
+
+    def scale_(self, scalar: float) -> 'Matrix':
+        """Multiply every element by scalar in place and return this matrix."""
+        _map_into(self, partial(map, partial(operator.mul, scalar)), self)
+        return self
+
+    def fill_(self, value: float) -> 'Matrix':
+        """Set every element to value in place and return this matrix."""
+        contiguous = self.is_contiguous()
+        for seg in _segments(self, contiguous, self.rows * self.cols):
+            self.data[seg] = array(_typecode(self.data), [value]) * len(range(seg.start, seg.stop, seg.step or 1))
+        return self
+
+    # Operators follow NumPy: arithmetic and comparisons are element-wise and
+    # broadcast (see ``elementwise``), comparisons return 1.0/0.0 masks, and
+    # ``@`` is the matrix product. A Vector operand acts as a single row.
+
+    def _binary(self, other: Operand, op: Callable[[float, float], float],
+                reflected: bool = False) -> 'Matrix':
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        if reflected:
+            return Matrix.elementwise(other, self, op)
+        return Matrix.elementwise(self, other, op)
+
+    def _inplace(self, other: Operand, op: Callable[[float, float], float]) -> 'Matrix':
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        return Matrix.elementwise(self, other, op, out=self)
+
+    def __add__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.add)
+
+    def __radd__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.add, reflected=True)
+
+    def __sub__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.sub, reflected=True)
+
+    def __mul__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.mul)
+
+    def __rmul__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.truediv)
+
+    def __rtruediv__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.truediv, reflected=True)
+
+    def __neg__(self) -> 'Matrix':
+        return Matrix.scalar_multiply(self, -1.0)
+
+    def __eq__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.eq)
+
+    def __ne__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.ne)
+
+    def __lt__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.lt)
+
+    def __le__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.le)
+
+    def __gt__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.gt)
+
+    def __ge__(self, other: Operand) -> 'Matrix':
+        return self._binary(other, operator.ge)
+
+    # Defining __eq__ would otherwise make matrices unhashable
+    __hash__ = object.__hash__
+
+    def __bool__(self) -> bool:
+        raise ValueError("The truth value of a Matrix is ambiguous; compare masks explicitly")
+
+    def __matmul__(self, other: Union['Matrix', Vector]) -> Union['Matrix', Vector]:
+        if isinstance(other, Matrix):
+            return Matrix.multiply(self, other)
+        if isinstance(other, Vector):
+            column = Matrix._from_storage(other.size(), 1, other.vector)
+            return Vector._from_storage(Matrix.multiply(self, column).data)
+        return NotImplemented
+
+    def __rmatmul__(self, other: Vector) -> Vector:
+        if isinstance(other, Vector):
+            row = Matrix._from_storage(1, other.size(), other.vector)
+            return Vector._from_storage(Matrix.multiply(row, self).data)
+        return NotImplemented
+
+    def __iadd__(self, other: Operand) -> 'Matrix':
+        if isinstance(other, Matrix) and other.rows == self.rows and other.cols == self.cols:
+            return self.add_(other)
+        return self._inplace(other, operator.add)
+
+    def __isub__(self, other: Operand) -> 'Matrix':
+        if isinstance(other, Matrix) and other.rows == self.rows and other.cols == self.cols:
+            return self.add_(other, -1.0)
+        return self._inplace(other, operator.sub)
+
+    def __imul__(self, other: Operand) -> 'Matrix':
+        if isinstance(other, (int, float)):
+            return self.scale_(other)
+        return self._inplace(other, operator.mul)
+
+    def __itruediv__(self, other: Operand) -> 'Matrix':
+        return self._inplace(other, operator.truediv)
+
     @staticmethod
-    def add(m1: 'Matrix', m2: 'Matrix', subtract: bool = False) -> 'Matrix':
+    def add(m1: 'Matrix', m2: 'Matrix', subtract: bool = False,
+            out: Optional['Matrix'] = None) -> 'Matrix':
         """Add or subtract two matrices element-wise.
-        
+
         Args:
             m1: First matrix
             m2: Second matrix
             subtract: If True, performs subtraction (m1 - m2)
-            
+            out: Optional preallocated result matrix (may be m1 or m2)
+
         Returns:
-            Result matrix
-            
+            Result matrix (out, if given)
+
         Raises:
             ValueError: If matrix dimensions don't match
         """
         # Check dimensions match
         if m1.get_rows() != m2.get_rows() or m1.get_cols() != m2.get_cols():
             raise ValueError(f"Cannot add matrices of shapes ({m1.get_rows()}, {m1.get_cols()}) and ({m2.get_rows()}, {m2.get_cols()})")
-        
-        sign = 1
-        if subtract:
-            sign = -1
-        
-        result = Matrix(m1.get_rows(), m1.get_cols())
-        for i in range(0, m1.get_rows()):
-            for j in range(0, m1.get_cols()):
-                v1 = m1.get_val_at(i, j)
-                v2 = sign * m2.get_val_at(i, j)
-                result.set_val_at(i, j, v1 + v2)
-        return result
-    
+
+        op = operator.sub if subtract else operator.add
+        if out is None:
+            code = _result_code(m1, m2)
+            if m1.is_contiguous() and m2.is_contiguous():
+                return Matrix._from_storage(m1.rows, m1.cols,
+                                            array(code, map(op, m1._flat_buffer(), m2._flat_buffer())))
+            out = Matrix(m1.rows, m1.cols, _DTYPE_NAMES[code])
+        else:
+            m1._check_out(out, m1.rows, m1.cols)
+        _map_into(out, partial(map, op), m1, m2)
+        return out
+
     @staticmethod
-    def multiply(m1: 'Matrix', m2: 'Matrix') -> 'Matrix':
+    def elementwise(m1: Operand, m2: Operand, op: Callable[[float, float], float],
+                    out: Optional['Matrix'] = None) -> 'Matrix':
+        """Apply a binary function element-wise, broadcasting NumPy style.
+
+        Either operand may be a scalar. A matrix with a single row is reused
+        for every row of the other operand (and a single column for every
+        column) without being expanded: the row is read once and handed to
+        each row's map, and column values are repeated lazily.
+
+        Args:
+            m1: Left operand, a Matrix or a number
+            m2: Right operand, a Matrix or a number
+            op: Function of two floats, e.g. ``operator.add``; comparisons
+                give 1.0/0.0 masks
+            out: Optional preallocated result matrix (may be m1 or m2)
+
+        Returns:
+            Result matrix (out, if given)
+
+        Raises:
+            TypeError: If neither operand is a Matrix
+            ValueError: If the shapes can't be broadcast together, or out has
+                the wrong shape
+        """
+        if not isinstance(m1, Matrix) and not isinstance(m2, Matrix):
+            raise TypeError("elementwise needs at least one Matrix operand")
+        # A 1 x 1 matrix against a larger one behaves like a scalar
+        if isinstance(m1, Matrix) and isinstance(m2, Matrix) and (m1.rows, m1.cols) != (m2.rows, m2.cols):
+            if m1.rows == m1.cols == 1:
+                m1 = m1.data[m1.offset]
+            elif m2.rows == m2.cols == 1:
+                m2 = m2.data[m2.offset]
+        matrices = [x for x in (m1, m2) if isinstance(x, Matrix)]
+        if len(matrices) == 2:
+            rows, cols = _broadcast_shape(m1, m2)
+        else:
+            rows, cols = matrices[0].rows, matrices[0].cols
+        if out is not None:
+            matrices[0]._check_out(out, rows, cols)
+        dtype = _DTYPE_NAMES[_result_code(*matrices)]
+
+        if all(x.rows == rows and x.cols == cols for x in matrices):
+            if len(matrices) == 2:
+                fn = partial(map, op)
+            elif matrices[0] is m1:
+                fn = lambda xs: map(op, xs, repeat(m2))
+            else:
+                fn = lambda ys: map(op, repeat(m1), ys)
+            if out is None:
+                if all(x.is_contiguous() for x in matrices):
+                    return Matrix._from_storage(rows, cols, array(DTYPES[dtype],
+                                                                  fn(*(x._flat_buffer() for x in matrices))))
+                out = Matrix(rows, cols, dtype)
+            _map_into(out, fn, *matrices)
+            return out
+
+        if out is None:
+            out = Matrix(rows, cols, dtype)
+        else:
+            # A full-size operand laid out differently over out's storage
+            # would be overwritten before it is read
+            m1, m2 = (x.copy() if isinstance(x, Matrix) and x.data is out.data and not x._same_layout(out)
+                      else x for x in (m1, m2))
+        left = _row_source(m1, rows, cols)
+        right = _row_source(m2, rows, cols)
+        out_data = out.data
+        code = _typecode(out_data)
+        for i in range(rows):
+            out_data[out._row_slice(i)] = array(code, map(op, left(i), right(i)))
+        return out
+
+    @staticmethod
+    def multiply(m1: 'Matrix', m2: 'Matrix', kernel: str = "auto",
+                 workers: Optional[int] = None, out: Optional['Matrix'] = None) -> 'Matrix':
         """Matrix multiplication using dot product.
-        
+
+        The right operand is packed into columns once and each output element is
+        reduced from two contiguous lists; see ``kernels`` for the available
+        kernels and how one is chosen from the operand shapes. Non-contiguous
+        views are copied to a contiguous layout first. The kernels accumulate in
+        float64: float32 operands are widened first and a float32 result is
+        rounded once when stored.
+
         Args:
             m1: Left matrix
             m2: Right matrix
-            
+            kernel: Kernel name ("tiny", "skinny", "blocked", "strassen",
+                "naive"), or "auto" to pick one by shape
+            workers: Number of processes to split output rows across; None
+                uses ``parallel.get_num_workers()`` (1 unless configured).
+                Small products always run serially.
+            out: Optional preallocated result matrix; must not share storage
+                with m1 or m2
+
         Returns:
-            Result matrix
-            
+            Result matrix (out, if given)
+
         Raises:
-            ValueError: If dimensions are incompatible for multiplication
+            ValueError: If dimensions are incompatible for multiplication, or
+                out has the wrong shape or aliases an operand
         """
         # Check if multiplication is valid (m1 cols must equal m2 rows)
         if m1.get_cols() != m2.get_rows():
             raise ValueError(f"Cannot multiply matrices: {m1.get_rows()}x{m1.get_cols()} by {m2.get_rows()}x{m2.get_cols()}")
-            
-        num_rows = m1.get_rows()
-        num_cols = m2.get_cols()
-        result = Matrix(num_rows, num_cols)
-        
-        for i in range(num_rows):
-            for j in range(num_cols):
-                res = 0
-                # Dot product of row i from m1 and column j from m2
-                for k in range(m2.get_rows()):
-                    res += m1.get_val_at(i, k) * m2.get_val_at(k, j)
-                result.set_val_at(i, j, res)
-        return result
+
+        if out is None:
+            out = Matrix(m1.rows, m2.cols, _DTYPE_NAMES[_result_code(m1, m2)])
+        else:
+            m1._check_out(out, m1.rows, m2.cols)
+            if out.data is m1.data or out.data is m2.data:
+                raise ValueError("Output matrix of multiply must not share storage with an operand")
+        direct = out.is_contiguous() and _typecode(out.data) == 'd'
+        target = out if direct else Matrix(out.rows, out.cols)
+        a = (m1.contiguous() if m1.dtype == "float64" else m1.astype("float64"))._flat_buffer()
+        b = (m2.contiguous() if m2.dtype == "float64" else m2.astype("float64"))._flat_buffer()
+        parallel.matmul(a, b, target._flat_buffer(), m1.rows, m1.cols, m2.cols, workers, kernel)
+        if target is not out:
+            out._assign(target)
+        return out
 
     @staticmethod
-    def transpose(m1: 'Matrix') -> 'Matrix':
+    def transpose(m1: 'Matrix', out: Optional['Matrix'] = None) -> 'Matrix':
         """Transpose a matrix (flip rows and columns).
-        
+
+        Without out this returns a view: rows and columns are swapped by
+        swapping the strides, so no values are copied and writes to the result
+        show up in m1.
+
         Args:
             m1: Matrix to transpose
-            
+            out: Optional preallocated matrix to copy the transpose into; must
+                not share storage with m1
+
         Returns:
-            Transposed matrix
-        """
-        prior_num_rows = m1.get_rows()
-        prior_num_cols = m1.get_cols()
-        
-        # Transposed matrix has flipped dimensions
-        new_num_rows = prior_num_cols
-        new_num_cols = prior_num_rows
-
-        result = Matrix(new_num_rows, new_num_cols)
-
-        # Swap indices: result[j][i] = original[i][j]
-        for i in range(prior_num_rows):
-            for j in range(prior_num_cols):
-                v = m1.get_val_at(i, j)
-                result.set_val_at(j, i, v)
-        return result
+            Transposed view of m1, or out with the transposed values
+
+        Raises:
+            ValueError: If out has the wrong shape or aliases m1
+        """
+        # Transposed matrix has flipped dimensions and strides
+        view = Matrix._view(m1.data, m1.cols, m1.rows, m1.offset, m1.col_stride, m1.row_stride)
+        if out is None:
+            return view
+        m1._check_out(out, m1.cols, m1.rows)
+        if out.data is m1.data:
+            raise ValueError("Output matrix of transpose must not share storage with its input")
+        out._assign(view)
+        return out
 
     @staticmethod
-    def scalar_multiply(m1: 'Matrix', scalar: float) -> 'Matrix':
+    def apply(m1: 'Matrix', fn: Callable[[Sequence[float]], Iterable[float]],
+              out: Optional['Matrix'] = None) -> 'Matrix':
+        """Apply a vectorized function to every element of a matrix.
+
+        fn is called on runs of consecutive elements (array slices of at most
+        CHUNK values) and must return the same number of results, e.g.
+        ``lambda xs: map(math.tanh, xs)``.
+
+        Args:
+            m1: Input matrix
+            fn: Function from a run of values to the transformed values
+            out: Optional preallocated result matrix (may be m1)
+
+        Returns:
+            Matrix of results (out, if given)
+
+        Raises:
+            ValueError: If out has the wrong shape
+        """
+        if out is None:
+            out = Matrix(m1.rows, m1.cols, m1.dtype)
+        else:
+            m1._check_out(out, m1.rows, m1.cols)
+        _map_into(out, fn, m1)
+        return out
+
+    @staticmethod
+    def scalar_multiply(m1: 'Matrix', scalar: float, out: Optional['Matrix'] = None) -> 'Matrix':
         """Multiply all elements of a matrix by a scalar value.
-        
+
         Args:
             m1: Matrix to multiply
             scalar: Scalar value to multiply by
-            
+            out: Optional preallocated result matrix (may be m1)
+
         Returns:
-            New matrix with all elements multiplied by scalar
-        """
-        result = Matrix(m1.get_rows(), m1.get_cols())
-        
-        for i in range(m1.get_rows()):
-            for j in range(m1.get_cols()):
-                v = m1.get_val_at(i, j)
-                result.set_val_at(i, j, v * scalar)
-        return result
+            Matrix with all elements multiplied by scalar (out, if given)
+
+        Raises:
+            ValueError: If out has the wrong shape
+        """
+        scale = partial(operator.mul, scalar)
+        if out is None:
+            if m1.is_contiguous():
+                return Matrix._from_storage(m1.rows, m1.cols,
+                                            array(_typecode(m1.data), map(scale, m1._flat_buffer())))
+            out = Matrix(m1.rows, m1.cols, m1.dtype)
+        else:
+            m1._check_out(out, m1.rows, m1.cols)
+        _map_into(out, partial(map, scale), m1)
+        return out
@@ -0,0 +1,141 @@
+"""Multi-process matrix multiply over shared memory.
+
+The output rows of ``a @ b`` are split into contiguous blocks, one per worker
+of a ``ProcessPoolExecutor``. Both operands and the output live in
+``multiprocessing.shared_memory`` blocks, so a task only carries the block
+names, the shape and its row range; workers run the regular serial kernel from
+``kernels`` on their slice of the shared buffers.
+
+Parallelism is opt-in: the default worker count is 1. Use
+``set_num_workers`` for a process-wide default or pass ``workers=`` to
+``Matrix.multiply``.
+"""
+
+import atexit
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence
+
+from . import kernels
+
+# Products with fewer multiply-adds (n * k * m) than this run serially; below
+# it, copying into shared memory and waking the pool costs more than it saves.
+PARALLEL_THRESHOLD = 96 ** 3
+
+_num_workers = 1
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def set_num_workers(workers: int) -> None:
+    """Set the default number of worker processes used by Matrix.multiply.
+
+    Raises:
+        ValueError: If workers is less than 1
+    """
+    global _num_workers
+    if workers < 1:
+        raise ValueError(f"Number of workers must be at least 1, got {workers}")
+    _num_workers = workers
+
+
+def get_num_workers() -> int:
+    """Get the default number of worker processes used by Matrix.multiply."""
+    return _num_workers
+
+
+def shutdown() -> None:
+    """Shut down all worker pools. They are recreated on next use."""
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
+
+
+atexit.register(shutdown)
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared process pool with this many workers, created on first use.
+
+    Pools are kept until ``shutdown``, so callers must not shut them down.
+    """
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        _pools[workers] = pool
+    return pool
+
+
+def _create_shared(values: int) -> shared_memory.SharedMemory:
+    # Zero-size blocks are rejected, so always allocate at least one double.
+    return shared_memory.SharedMemory(create=True, size=max(values, 1) * 8)
+
+
+def _matmul_rows(names: List[str], n: int, k: int, m: int,
+                 row_start: int, row_end: int, kernel: str) -> None:
+    """Worker task: compute output rows [row_start, row_end) in shared memory."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        a, b, out = (block.buf.cast('d') for block in blocks)
+        try:
+            kernels.matmul(a[row_start * k:row_end * k], b[:k * m],
+                           out[row_start * m:row_end * m],
+                           row_end - row_start, k, m, kernel)
+        finally:
+            a.release()
+            b.release()
+            out.release()
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def row_blocks(n: int, parts: int) -> List[range]:
+    """Split n rows into at most `parts` contiguous, nearly equal ranges."""
+    parts = max(1, min(parts, n))
+    size, extra = divmod(n, parts)
+    blocks = []
+    start = 0
+    for p in range(parts):
+        end = start + size + (1 if p < extra else 0)
+        blocks.append(range(start, end))
+        start = end
+    return blocks
+
+
+def matmul(a: Sequence[float], b: Sequence[float], out: Sequence[float],
+           n: int, k: int, m: int, workers: Optional[int] = None,
+           kernel: str = "auto") -> None:
+    """Multiply flat buffers into out, spreading output rows over worker processes.
+
+    Falls back to the serial kernel when only one worker is requested, there is
+    only one output row, or the product is below PARALLEL_THRESHOLD.
+    """
+    if workers is None:
+        workers = _num_workers
+    if workers <= 1 or n < 2 or n * k * m < PARALLEL_THRESHOLD:
+        kernels.matmul(a, b, out, n, k, m, kernel)
+        return
+
+    blocks = [_create_shared(n * k), _create_shared(k * m), _create_shared(n * m)]
+    try:
+        views = [block.buf.cast('d') for block in blocks]
+        try:
+            shared_a, shared_b, shared_out = views
+            shared_a[:n * k] = a if isinstance(a, (array, memoryview)) else array('d', a)
+            shared_b[:k * m] = b if isinstance(b, (array, memoryview)) else array('d', b)
+
+            pool = get_pool(workers)
+            names = [block.name for block in blocks]
+            futures = [pool.submit(_matmul_rows, names, n, k, m, rows.start, rows.stop, kernel)
+                       for rows in row_blocks(n, workers)]
+            for future in futures:
+                future.result()
+            memoryview(out)[:n * m] = shared_out[:n * m]
+        finally:
+            for view in views:
+                view.release()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
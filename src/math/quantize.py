@@ -0,0 +1,144 @@
+"""Post-training int8 quantization of weight matrices for inference.
+
+A weight matrix W (used as ``x @ W``) is stored as one signed byte per
+value plus one scale per output column: column j holds
+``q = round(W[:, j] / scale[j])`` with ``scale[j] = max|W[:, j]| / 127``, so
+every q is in [-127, 127] and the largest weight in each column is exact.
+That is 1 byte per weight instead of 8 (float64) or 4 (float32).
+
+``QuantizedMatrix.multiply`` quantizes each row of x the same way on the
+fly, accumulates the int8 products of a row and a column as exact Python
+integers and dequantizes once per output with ``scale_x[i] * scale_w[j]``.
+Only inference is supported; train in float and quantize afterwards.
+"""
+
+from array import array
+from operator import mul
+from typing import List, Optional, Sequence, Tuple
+
+from .matrix import Matrix, _typecode
+
+# Largest quantized magnitude; -128 is left unused so the range is symmetric
+QMAX = 127
+
+
+def _quantize_row(values: Sequence[float]) -> Tuple[List[int], float]:
+    """Symmetric int8 values and scale of one row (scale 0.0 for an all-zero row)."""
+    top = max(map(abs, values), default=0.0)
+    if top == 0.0:
+        return [0] * len(values), 0.0
+    inv = QMAX / top
+    return [round(v * inv) for v in values], top / QMAX
+
+
+class QuantizedMatrix:
+    """An int8 weight matrix with one float scale per column.
+
+    ``values`` is an ``array('b')`` holding the columns one after another
+    (column j is ``values[j * rows:(j + 1) * rows]``), so the quantized
+    multiply reads each output's weights as one contiguous run; ``scales``
+    is an ``array('d')`` with one entry per column.
+    """
+
+    def __init__(self, n: int, m: int, values: Sequence[int], scales: Sequence[float]) -> None:
+        """Wrap column-major int8 values and per-column scales for an n x m matrix.
+
+        Raises:
+            ValueError: If the arrays don't match the shape, or a value is
+                outside [-127, 127]
+        """
+        if len(values) != n * m or len(scales) != m:
+            raise ValueError(f"Expected {n * m} values and {m} scales, got {len(values)} and {len(scales)}")
+        if len(values) and (min(values) < -QMAX or max(values) > QMAX):
+            raise ValueError(f"Quantized values must be in [-{QMAX}, {QMAX}]")
+        self.rows = n
+        self.cols = m
+        self.values = values if isinstance(values, array) and values.typecode == 'b' else array('b', values)
+        self.scales = scales if isinstance(scales, array) and scales.typecode == 'd' else array('d', scales)
+
+    @staticmethod
+    def quantize(m: Matrix) -> 'QuantizedMatrix':
+        """Quantize a weight matrix column by column (one scale per output).
+
+        Args:
+            m: Weight matrix, used as ``x @ m``
+
+        Returns:
+            Quantized copy of m
+        """
+        values = array('b')
+        scales = array('d')
+        for j in range(m.cols):
+            q, scale = _quantize_row(m.data[m._col_slice(j)])
+            values.extend(q)
+            scales.append(scale)
+        return QuantizedMatrix(m.rows, m.cols, values, scales)
+
+    def dequantize(self, dtype: str = "float64") -> Matrix:
+        """The float matrix these values and scales represent."""
+        result = Matrix(self.rows, self.cols, dtype)
+        n = self.rows
+        for j, scale in enumerate(self.scales):
+            column = self.values[j * n:(j + 1) * n]
+            result.data[result._col_slice(j)] = array(result.data.typecode, [q * scale for q in column])
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of storage for the values and scales."""
+        return len(self.values) * self.values.itemsize + len(self.scales) * self.scales.itemsize
+
+    def get_rows(self) -> int:
+        """Get number of rows."""
+        return self.rows
+
+    def get_cols(self) -> int:
+        """Get number of columns."""
+        return self.cols
+
+    @staticmethod
+    def multiply(x: Matrix, w: 'QuantizedMatrix', out: Optional[Matrix] = None) -> Matrix:
+        """Compute ``x @ w`` with integer accumulation.
+
+        Each row of x is quantized with its own scale, every output is an
+        exact integer dot product of two int8 runs, and the result is scaled
+        back once per output.
+
+        Args:
+            x: Float input matrix (a batch of rows)
+            w: Quantized weights
+            out: Optional preallocated result matrix; must not share storage
+                with x
+
+        Returns:
+            Result matrix with the dtype of x (out, if given)
+
+        Raises:
+            ValueError: If the shapes are incompatible, or out has the wrong
+                shape or aliases x
+        """
+        if x.cols != w.rows:
+            raise ValueError(f"Cannot multiply matrices: {x.rows}x{x.cols} by {w.rows}x{w.cols}")
+        if out is None:
+            out = Matrix(x.rows, w.cols, x.dtype)
+        else:
+            x._check_out(out, x.rows, w.cols)
+            if out.data is x.data:
+                raise ValueError("Output matrix of multiply must not share storage with its input")
+        n = w.rows
+        columns = [w.values[j * n:(j + 1) * n].tolist() for j in range(w.cols)]
+        code = _typecode(out.data)
+        for i in range(x.rows):
+            qx, scale = _quantize_row(x.data[x._row_slice(i)])
+            scales = [scale * s for s in w.scales]
+            out.data[out._row_slice(i)] = array(code, [sum(map(mul, qx, column)) * s
+                                                       for column, s in zip(columns, scales)])
+        return out
+
+    def __rmatmul__(self, other: Matrix) -> Matrix:
+        if isinstance(other, Matrix):
+            return QuantizedMatrix.multiply(other, self)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"QuantizedMatrix(shape=({self.rows}, {self.cols}), nbytes={self.nbytes})"
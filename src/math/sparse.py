@@ -0,0 +1,325 @@
+"""Sparse matrices stored in compressed sparse row form."""
+
+from array import array
+from bisect import bisect_left
+from itertools import compress, repeat
+import operator
+from operator import add, mul
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .matrix import Matrix, _typecode
+
+
+class SparseMatrix:
+    """A sparse matrix in compressed sparse row (CSR) form.
+
+    Only non-zero entries are stored, in three flat arrays:
+    ``indptr`` (rows + 1 offsets), ``indices`` (column of each entry) and
+    ``values``. The entries of row i are ``indices[indptr[i]:indptr[i + 1]]``
+    (sorted by column) with the matching slice of ``values``. Memory use and
+    the cost of every operation grow with the number of non-zeros (``nnz``)
+    rather than with rows * cols.
+
+    The compressed sparse column (CSC) form is the CSR form of the transpose;
+    it is built on first use of ``T`` or ``csc()`` and cached. Operations
+    return new matrices and never modify their inputs, so the cache stays
+    valid; treat a SparseMatrix as immutable.
+
+    ``get_rows``, ``get_cols`` and ``flat`` match Matrix, so a SparseMatrix of
+    targets can be passed to ``Loss`` functions; the categorical
+    cross-entropy losses only visit its non-zeros.
+    """
+
+    def __init__(self, n: int, m: int, indptr: Sequence[int], indices: Sequence[int],
+                 values: Sequence[float]) -> None:
+        """Wrap CSR arrays for an n x m matrix.
+
+        Raises:
+            ValueError: If the arrays are inconsistent with each other or the shape
+        """
+        if len(indptr) != n + 1 or indptr[0] != 0:
+            raise ValueError(f"indptr must have {n + 1} entries starting at 0")
+        if len(indices) != len(values) or indptr[n] != len(values):
+            raise ValueError(f"indptr ends at {indptr[n]} but there are {len(indices)} indices "
+                             f"and {len(values)} values")
+        if any(map(operator.gt, indptr[:-1], indptr[1:])):
+            raise ValueError("indptr must be non-decreasing")
+        if len(indices) and (min(indices) < 0 or max(indices) >= m):
+            raise ValueError(f"Column indices must be in [0, {m})")
+        self.rows = n
+        self.cols = m
+        self.indptr = indptr if isinstance(indptr, array) else array('q', indptr)
+        self.indices = indices if isinstance(indices, array) else array('i', indices)
+        self.values = values if isinstance(values, array) else array('d', values)
+        self._transpose: Optional['SparseMatrix'] = None
+
+    @staticmethod
+    def from_coo(n: int, m: int, row_indices: Sequence[int], col_indices: Sequence[int],
+                 values: Sequence[float]) -> 'SparseMatrix':
+        """Build from coordinate (COO) triplets: entry k is values[k] at (row_indices[k], col_indices[k]).
+
+        Triplets may come in any order; duplicates are summed.
+
+        Raises:
+            ValueError: If the three sequences differ in length
+            IndexError: If a coordinate is outside the n x m shape
+        """
+        count = len(values)
+        if len(row_indices) != count or len(col_indices) != count:
+            raise ValueError("row_indices, col_indices and values must have the same length")
+        if count and (min(row_indices) < 0 or max(row_indices) >= n
+                      or min(col_indices) < 0 or max(col_indices) >= m):
+            raise IndexError(f"Coordinates out of bounds for a {n}x{m} matrix")
+        keys = [i * m + j for i, j in zip(row_indices, col_indices)]
+        order = sorted(range(count), key=keys.__getitem__)
+        indptr = array('q', [0]) * (n + 1)
+        indices = array('i')
+        merged = array('d')
+        last = -1
+        for k in order:
+            key = keys[k]
+            if key == last:
+                merged[-1] += values[k]
+                continue
+            last = key
+            indices.append(key % m)
+            merged.append(values[k])
+            indptr[key // m + 1] += 1
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+        return SparseMatrix(n, m, indptr, indices, merged)
+
+    @staticmethod
+    def from_dense(dense: Matrix, tol: float = 0.0) -> 'SparseMatrix':
+        """Keep the entries of a Matrix whose absolute value exceeds tol."""
+        n, m = dense.rows, dense.cols
+        indptr = array('q', [0])
+        indices = array('i')
+        values = array('d')
+        columns = range(m)
+        # float() so an int tol compares with the float entries (int.__lt__
+        # returns NotImplemented, which is truthy, for a float argument)
+        above = float(tol).__lt__
+        for i in range(n):
+            row = dense.row(i).flat()
+            keep = row if tol == 0.0 else map(above, map(abs, row))
+            nonzero = list(compress(columns, keep))
+            indices.extend(nonzero)
+            values.extend([row[j] for j in nonzero])
+            indptr.append(len(values))
+        return SparseMatrix(n, m, indptr, indices, values)
+
+    def to_dense(self) -> Matrix:
+        """Return a dense Matrix with the same values."""
+        out = Matrix(self.rows, self.cols)
+        data = out.data
+        indptr, indices, values = self.indptr, self.indices, self.values
+        for i in range(self.rows):
+            base = i * self.cols
+            for p in range(indptr[i], indptr[i + 1]):
+                data[base + indices[p]] = values[p]
+        return out
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored entries."""
+        return len(self.values)
+
+    def density(self) -> float:
+        """Fraction of entries that are stored."""
+        size = self.rows * self.cols
+        return self.nnz / size if size else 0.0
+
+    def get_rows(self) -> int:
+        return self.rows
+
+    def get_cols(self) -> int:
+        return self.cols
+
+    def get_val_at(self, i: int, j: int) -> float:
+        """Value at (i, j); 0.0 if not stored. Raises IndexError if out of bounds."""
+        if i < 0 or i >= self.rows or j < 0 or j >= self.cols:
+            raise IndexError(f"Index ({i}, {j}) out of bounds for {self.rows}x{self.cols} matrix")
+        start, end = self.indptr[i], self.indptr[i + 1]
+        p = bisect_left(self.indices, j, start, end)
+        return self.values[p] if p < end and self.indices[p] == j else 0.0
+
+    def items(self) -> Iterator[Tuple[int, int, float]]:
+        """Yield (row, col, value) for every stored entry in row-major order."""
+        indptr, indices, values = self.indptr, self.indices, self.values
+        for i in range(self.rows):
+            for p in range(indptr[i], indptr[i + 1]):
+                yield i, indices[p], values[p]
+
+    def row_entries(self, i: int) -> Tuple[Sequence[int], Sequence[float]]:
+        """(column indices, values) of the stored entries of row i."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.values[start:end]
+
+    def flat(self) -> array:
+        """Row-major values of the dense equivalent (allocates rows * cols values)."""
+        return self.to_dense().data
+
+    @property
+    def T(self) -> 'SparseMatrix':
+        """The transpose, i.e. this matrix in CSC form. Built once, O(nnz)."""
+        if self._transpose is None:
+            n, m = self.rows, self.cols
+            indptr, indices, values = self.indptr, self.indices, self.values
+            counts = array('q', [0]) * (m + 1)
+            for j in indices:
+                counts[j + 1] += 1
+            for j in range(m):
+                counts[j + 1] += counts[j]
+            t_indices = array('i', [0]) * len(indices)
+            t_values = array('d', [0.0]) * len(values)
+            # Rows are visited in order, so each column's entries stay sorted
+            position = counts[:-1]
+            for i in range(n):
+                for p in range(indptr[i], indptr[i + 1]):
+                    j = indices[p]
+                    dest = position[j]
+                    position[j] = dest + 1
+                    t_indices[dest] = i
+                    t_values[dest] = values[p]
+            transpose = SparseMatrix(m, n, counts, t_indices, t_values)
+            transpose._transpose = self
+            self._transpose = transpose
+        return self._transpose
+
+    def csc(self) -> Tuple[array, array, array]:
+        """(indptr, row indices, values) of the CSC form, column by column."""
+        t = self.T
+        return t.indptr, t.indices, t.values
+
+    @staticmethod
+    def multiply(s: 'SparseMatrix', dense: Matrix, out: Optional[Matrix] = None) -> Matrix:
+        """Sparse x dense product s @ dense.
+
+        Row i of the result is the sum of ``v * dense.row(k)`` over the stored
+        entries (k, v) of row i of s, so the cost is nnz * dense.cols.
+
+        Args:
+            s: Sparse left operand
+            dense: Dense right operand
+            out: Optional preallocated result (s.rows x dense.cols); may be
+                float32
+
+        Returns:
+            Dense float64 result matrix (out, if given)
+
+        Raises:
+            ValueError: If the shapes don't match
+        """
+        if s.cols != dense.rows:
+            raise ValueError(f"Cannot multiply matrices: {s.rows}x{s.cols} by {dense.rows}x{dense.cols}")
+        m = dense.cols
+        if out is None:
+            out = Matrix(s.rows, m)
+        else:
+            out._check_out(out, s.rows, m)
+        b = dense.flat()
+        indptr, indices, values = s.indptr, s.indices, s.values
+        code = _typecode(out.data)
+        zeros = array(code, [0.0]) * m
+        for i in range(s.rows):
+            acc: Iterable[float] = zeros
+            for p in range(indptr[i], indptr[i + 1]):
+                k = indices[p]
+                scaled = map(mul, b[k * m:(k + 1) * m], repeat(values[p]))
+                acc = list(scaled) if acc is zeros else list(map(add, acc, scaled))
+            out.data[out._row_slice(i)] = acc if isinstance(acc, array) else array(code, acc)
+        return out
+
+    @staticmethod
+    def transpose_multiply(s: 'SparseMatrix', dense: Matrix, out: Optional[Matrix] = None) -> Matrix:
+        """Product s.T @ dense, e.g. the weight gradient X.T @ dY for sparse inputs X.
+
+        Uses the cached CSC form of s, so the transpose is never densified.
+
+        Raises:
+            ValueError: If s.rows != dense.rows
+        """
+        return SparseMatrix.multiply(s.T, dense, out)
+
+    def _with_values(self, values: array) -> 'SparseMatrix':
+        """Same sparsity structure (shared, read-only), new values."""
+        return SparseMatrix(self.rows, self.cols, self.indptr, self.indices, values)
+
+    @staticmethod
+    def scalar_multiply(s: 'SparseMatrix', scalar: float) -> 'SparseMatrix':
+        """Multiply every element by scalar."""
+        return s._with_values(array('d', map(mul, s.values, repeat(scalar))))
+
+    @staticmethod
+    def apply(s: 'SparseMatrix', fn: Callable[[Sequence[float]], Iterable[float]]) -> 'SparseMatrix':
+        """Apply a vectorized function to the stored values only.
+
+        Like ``Matrix.apply``, fn receives a sequence of values and returns the
+        new values. Zeros are not visited, so this is only correct for
+        functions with fn(0) == 0, such as relu, abs, square or scaling.
+        """
+        return s._with_values(array('d', fn(s.values)))
+
+    @staticmethod
+    def add(s1: 'SparseMatrix', other: Union['SparseMatrix', Matrix],
+            subtract: bool = False) -> Union['SparseMatrix', Matrix]:
+        """Element-wise s1 + other (or s1 - other).
+
+        Sparse + sparse merges the two row patterns and stays sparse; sparse +
+        dense is dense and costs one dense copy plus nnz updates.
+
+        Raises:
+            ValueError: If the shapes don't match
+        """
+        if s1.rows != other.get_rows() or s1.cols != other.get_cols():
+            raise ValueError(f"Cannot add matrices of shapes {s1.rows}x{s1.cols} and "
+                             f"{other.get_rows()}x{other.get_cols()}")
+        sign = -1.0 if subtract else 1.0
+        if isinstance(other, Matrix):
+            out = Matrix.scalar_multiply(other, sign) if subtract else other.copy()
+            data, cols = out.data, out.cols
+            for i, j, v in s1.items():
+                data[i * cols + j] += v
+            return out
+        indptr = array('q', [0])
+        indices = array('i')
+        values = array('d')
+        for i in range(s1.rows):
+            merged = dict(zip(*s1.row_entries(i)))
+            for j, v in zip(*other.row_entries(i)):
+                merged[j] = merged.get(j, 0.0) + sign * v
+            columns = sorted(merged)
+            indices.extend(columns)
+            values.extend([merged[j] for j in columns])
+            indptr.append(len(values))
+        return SparseMatrix(s1.rows, s1.cols, indptr, indices, values)
+
+    @staticmethod
+    def hadamard(s: 'SparseMatrix', other: Union['SparseMatrix', Matrix]) -> 'SparseMatrix':
+        """Element-wise product; the result is never denser than s.
+
+        Raises:
+            ValueError: If the shapes don't match
+        """
+        if s.rows != other.get_rows() or s.cols != other.get_cols():
+            raise ValueError(f"Cannot multiply matrices of shapes {s.rows}x{s.cols} and "
+                             f"{other.get_rows()}x{other.get_cols()}")
+        if isinstance(other, Matrix):
+            get = other.get_val_at
+            return s._with_values(array('d', [v * get(i, j) for i, j, v in s.items()]))
+        indptr = array('q', [0])
+        indices = array('i')
+        values = array('d')
+        for i in range(s.rows):
+            theirs = dict(zip(*other.row_entries(i)))
+            for j, v in zip(*s.row_entries(i)):
+                if j in theirs:
+                    indices.append(j)
+                    values.append(v * theirs[j])
+            indptr.append(len(values))
+        return SparseMatrix(s.rows, s.cols, indptr, indices, values)
+
+    def nbytes(self) -> int:
+        """Bytes used by the CSR arrays."""
+        return sum(a.itemsize * len(a) for a in (self.indptr, self.indices, self.values))
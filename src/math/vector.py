@@ -1,13 +1,49 @@
+from array import array
+from itertools import repeat
 import math
-# Type annotations only using built-in types
+import operator
+from typing import Callable, Iterable, Union
+
+
+# Storage element types: dtype name -> array typecode (shared with Matrix)
+DTYPES = {"float64": 'd', "float32": 'f'}
 
 
 class Vector:
-    """A basic vector implementation for educational ML purposes."""
+    """A basic vector implementation for educational ML purposes.
+
+    Values are stored in a flat ``array('d')`` (``self.vector``), or an
+    ``array('f')`` for dtype "float32". Results keep the dtype of their
+    operands; mixing float32 with float64 gives float64.
+    """
     
-    def __init__(self, n: int) -> None:
-        """Initialize vector with n dimensions, filled with zeros."""
-        self.vector = [0.0 for _ in range(n)]
+    def __init__(self, n: int, dtype: str = "float64") -> None:
+        """Initialize vector with n dimensions, filled with zeros.
+
+        Raises:
+            ValueError: If dtype is not "float64" or "float32"
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype '{dtype}', expected one of {list(DTYPES)}")
+        self.vector = array(DTYPES[dtype], [0.0]) * n
+
+    @staticmethod
+    def _from_storage(data: array) -> 'Vector':
+        """Wrap an existing ``array('d')`` or ``array('f')`` without copying."""
+        result = Vector.__new__(Vector)
+        result.vector = data
+        return result
+
+    @property
+    def dtype(self) -> str:
+        """Element type of the storage: "float64" or "float32"."""
+        return "float32" if self.vector.typecode == 'f' else "float64"
+
+    def astype(self, dtype: str) -> 'Vector':
+        """Return a copy with the given dtype. Raises ValueError if dtype is unknown."""
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype '{dtype}', expected one of {list(DTYPES)}")
+        return Vector._from_storage(array(DTYPES[dtype], self.vector))
 
     def size(self) -> int:
         """Get the size/dimension of the vector."""
@@ -41,11 +77,7 @@ class Vector:
         """
         if v1.size() != v2.size():
             raise ValueError(f"Cannot compute dot product of vectors with sizes {v1.size()} and {v2.size()}")
-        
-        result = 0.0
-        for i in range(v1.size()):
-            result += v1.get(i) * v2.get(i)
-        return result
+        return float(sum(map(operator.mul, v1.vector, v2.vector)))
 
     @staticmethod
     def apply_scalar(v: 'Vector', scalar: float) -> 'Vector':
@@ -58,10 +90,7 @@ class Vector:
         Returns:
             New vector with scaled values
         """
-        result = Vector(v.size())
-        for i in range(v.size()):
-            result.set(i, v.get(i) * scalar)
-        return result
+        return Vector._from_storage(array(v.vector.typecode, map(operator.mul, v.vector, repeat(scalar))))
 
     @staticmethod
     def project(onto: 'Vector', orig: 'Vector') -> 'Vector':
@@ -73,12 +102,16 @@ class Vector:
             
         Returns:
             Projected vector
-        """
-        onto_magnitude = onto.l2_norm()
-        dot_prod = Vector.dot_product(onto, orig)
 
-        # Projection formula: proj_onto(orig) = (orig·onto / |onto|²) * onto
-        scale = dot_prod / onto_magnitude ** 2
+        Raises:
+            ValueError: If the sizes differ or onto is the zero vector
+        """
+        # Projection formula: proj_onto(orig) = (orig·onto / |onto|²) * onto,
+        # with |onto|² taken directly as onto·onto rather than squaring a sqrt
+        onto_squared = Vector.dot_product(onto, onto)
+        if onto_squared == 0.0:
+            raise ValueError("Cannot project onto a zero vector")
+        scale = Vector.dot_product(onto, orig) / onto_squared
         return Vector.apply_scalar(onto, scale)
 
 
@@ -88,11 +121,85 @@ class Vector:
         Returns:
             L2 norm of the vector
         """
-        sum_squares = 0.0
-        for i in range(self.size()):
-            sum_squares += self.get(i) ** 2
-        return math.sqrt(sum_squares)
+        return math.sqrt(sum(map(operator.mul, self.vector, self.vector)))
     
     def print(self) -> None:
         """Print the vector contents."""
-        print(self.vector)
+        print(self.vector.tolist())
+
+    # Operators are element-wise against a same-sized Vector or a scalar;
+    # comparisons return 1.0/0.0 masks and ``@`` is the dot product. Mixed
+    # with a Matrix, the vector acts as a single row (see Matrix.elementwise).
+
+    def _binary(self, other: Union['Vector', float], op: Callable[[float, float], float],
+                reflected: bool = False) -> 'Vector':
+        code = self.vector.typecode
+        if isinstance(other, Vector):
+            if other.size() != self.size():
+                raise ValueError(f"Cannot combine vectors with sizes {self.size()} and {other.size()}")
+            values: Iterable[float] = other.vector
+            if other.vector.typecode != code:
+                code = 'd'
+        elif isinstance(other, (int, float)):
+            values = repeat(other)
+        else:
+            return NotImplemented
+        if reflected:
+            return Vector._from_storage(array(code, map(op, values, self.vector)))
+        return Vector._from_storage(array(code, map(op, self.vector, values)))
+
+    def __add__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.add)
+
+    def __radd__(self, other: float) -> 'Vector':
+        return self._binary(other, operator.add, reflected=True)
+
+    def __sub__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other: float) -> 'Vector':
+        return self._binary(other, operator.sub, reflected=True)
+
+    def __mul__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.mul)
+
+    def __rmul__(self, other: float) -> 'Vector':
+        return self._binary(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.truediv)
+
+    def __rtruediv__(self, other: float) -> 'Vector':
+        return self._binary(other, operator.truediv, reflected=True)
+
+    def __neg__(self) -> 'Vector':
+        return Vector._from_storage(array(self.vector.typecode, map(operator.neg, self.vector)))
+
+    def __eq__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.eq)
+
+    def __ne__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.ne)
+
+    def __lt__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.lt)
+
+    def __le__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.le)
+
+    def __gt__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.gt)
+
+    def __ge__(self, other: Union['Vector', float]) -> 'Vector':
+        return self._binary(other, operator.ge)
+
+    # Defining __eq__ would otherwise make vectors unhashable
+    __hash__ = object.__hash__
+
+    def __bool__(self) -> bool:
+        raise ValueError("The truth value of a Vector is ambiguous; compare masks explicitly")
+
+    def __matmul__(self, other: 'Vector') -> float:
+        if isinstance(other, Vector):
+            return Vector.dot_product(self, other)
+        return NotImplemented
@@ -0,0 +1,201 @@
+"""A dense store of equal-length vectors for batched similarity search.
+
+All vectors live in one flat row-major ``array('d')`` (or the ``array('f')``
+of a float32 matrix passed to ``from_matrix``), vector i occupying
+``data[i * dim:(i + 1) * dim]``, so a scan against a query is one
+``sum(map(mul, ...))`` per stored vector over contiguous slices rather than
+per-element ``get`` calls.
+"""
+
+from array import array
+import heapq
+import math
+from operator import mul
+from typing import Iterable, List, Optional, Set, Tuple
+
+from .matrix import Matrix, _take, _typecode
+from .vector import Vector
+
+# Scores accepted by VectorBatch.top_k
+METRICS = ("cosine", "dot")
+
+
+class VectorBatch:
+    """N vectors of dimension dim in one contiguous buffer (``self.data``).
+
+    L2 norms are computed on first use and cached. ``set`` and ``append``
+    invalidate the cached norm of the vectors they write; after writing
+    through ``data`` or ``as_matrix()`` directly, call ``invalidate()``.
+    """
+
+    def __init__(self, n: int, dim: int) -> None:
+        """Initialize a batch of n zero vectors of dimension dim."""
+        self.dim = dim
+        self.data = array('d', [0.0]) * (n * dim)
+        self._count = n
+        self._norms: Optional[array] = None
+        self._stale: Set[int] = set()
+
+    @staticmethod
+    def from_vectors(vectors: Iterable[Vector], dim: Optional[int] = None) -> 'VectorBatch':
+        """Copy vectors into a new batch.
+
+        Args:
+            vectors: Vectors of equal size
+            dim: Dimension, needed only when vectors may be empty
+
+        Raises:
+            ValueError: If the vectors don't all have the same size
+        """
+        vectors = list(vectors)
+        if dim is None:
+            dim = vectors[0].size() if vectors else 0
+        batch = VectorBatch(0, dim)
+        for v in vectors:
+            batch.append(v)
+        return batch
+
+    @staticmethod
+    def from_matrix(m: Matrix) -> 'VectorBatch':
+        """Use the rows of m as the vectors.
+
+        A contiguous matrix (including a memory-mapped one) shares its storage
+        with the batch; other views are copied first.
+        """
+        batch = VectorBatch.__new__(VectorBatch)
+        batch.dim = m.cols
+        batch.data = m.flat()
+        batch._count = m.rows
+        batch._norms = None
+        batch._stale = set()
+        return batch
+
+    def as_matrix(self) -> Matrix:
+        """The batch as an N x dim matrix sharing its storage."""
+        return Matrix._from_storage(self._count, self.dim, self.data)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _check_index(self, i: int) -> None:
+        if i >= self._count or i < 0:
+            raise IndexError(f"Index {i} out of bounds for batch of {self._count} vectors")
+
+    def _check_size(self, v: Vector) -> None:
+        if v.size() != self.dim:
+            raise ValueError(f"Vector has size {v.size()}, batch vectors have size {self.dim}")
+
+    def _values(self, v: Vector) -> array:
+        """The values of v in the typecode of the batch storage."""
+        code = _typecode(self.data)
+        return v.vector if v.vector.typecode == code else array(code, v.vector)
+
+    def get(self, i: int) -> Vector:
+        """Return a copy of vector i. Raises IndexError if out of bounds."""
+        self._check_index(i)
+        # _take copies memoryview-backed storage into an array of its own
+        return Vector._from_storage(_take(self.data, slice(i * self.dim, (i + 1) * self.dim)))
+
+    def set(self, i: int, v: Vector) -> None:
+        """Overwrite vector i, converting v to the batch's dtype.
+
+        Raises:
+            IndexError: If i is out of bounds
+            ValueError: If v has the wrong size
+        """
+        self._check_index(i)
+        self._check_size(v)
+        self.data[i * self.dim:(i + 1) * self.dim] = self._values(v)
+        self._stale.add(i)
+
+    def append(self, v: Vector) -> None:
+        """Add a vector at the end, converting it to the batch's dtype.
+
+        Raises:
+            ValueError: If v has the wrong size
+        """
+        self._check_size(v)
+        if not isinstance(self.data, array):
+            # Storage shared with a memoryview can't grow; take a copy
+            self.data = array(_typecode(self.data), self.data)
+        self.data.extend(self._values(v))
+        if self._norms is not None:
+            self._norms.append(0.0)
+            self._stale.add(self._count)
+        self._count += 1
+
+    def invalidate(self, rows: Optional[Iterable[int]] = None) -> None:
+        """Drop cached norms for the given rows, or for every row."""
+        if rows is None:
+            self._norms = None
+            self._stale.clear()
+        else:
+            self._stale.update(rows)
+
+    def _rows(self) -> Iterable[array]:
+        data, dim = self.data, self.dim
+        return (data[start:start + dim] for start in range(0, self._count * dim, dim))
+
+    def norms(self) -> array:
+        """L2 norm of every vector, computed once and cached."""
+        if self._norms is None:
+            self._norms = array('d', [math.sqrt(sum(map(mul, row, row))) for row in self._rows()])
+            self._stale.clear()
+        elif self._stale:
+            data, dim = self.data, self.dim
+            for i in self._stale:
+                row = data[i * dim:(i + 1) * dim]
+                self._norms[i] = math.sqrt(sum(map(mul, row, row)))
+            self._stale.clear()
+        return self._norms
+
+    def dots(self, query: Vector) -> array:
+        """Dot product of every vector with query.
+
+        Raises:
+            ValueError: If query has the wrong size
+        """
+        self._check_size(query)
+        q = query.vector.tolist()
+        return array('d', [sum(map(mul, q, row)) for row in self._rows()])
+
+    def cosine_similarity(self, query: Vector) -> array:
+        """Cosine similarity of every vector with query.
+
+        Similarities involving a zero vector (stored or query) are 0.0.
+
+        Raises:
+            ValueError: If query has the wrong size
+        """
+        dots = self.dots(query)
+        query_norm = query.l2_norm()
+        if query_norm == 0.0:
+            return array('d', [0.0]) * self._count
+        return array('d', [dot / (norm * query_norm) if norm else 0.0
+                           for dot, norm in zip(dots, self.norms())])
+
+    def top_k(self, query: Vector, k: int, metric: str = "cosine") -> List[Tuple[int, float]]:
+        """The k vectors most similar to query, best first.
+
+        Selection keeps a heap of the k best scores (O(N log k)) instead of
+        sorting all N; ties go to the lower index.
+
+        Args:
+            query: Query vector
+            k: Number of results; fewer are returned if the batch is smaller
+            metric: "cosine" or "dot"
+
+        Returns:
+            (index, score) pairs in decreasing order of score
+
+        Raises:
+            ValueError: If k is negative, the metric is unknown or query has
+                the wrong size
+        """
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {list(METRICS)}")
+        scores = self.cosine_similarity(query) if metric == "cosine" else self.dots(query)
+        best = heapq.nlargest(k, range(self._count), key=scores.__getitem__)
+        return [(i, scores[i]) for i in best]
@@ -0,0 +1,7 @@
+"""Neural network layers with fused forward and preallocated backward passes."""
+
+from .layers import Activation, Dense, Layer, ReLU, Sequential, Sigmoid, Tanh
+from .losses import CrossEntropyLoss, MSELoss
+
+__all__ = ["Activation", "CrossEntropyLoss", "Dense", "Layer", "MSELoss", "ReLU", "Sequential",
+           "Sigmoid", "Tanh"]
\ No newline at end of file
@@ -0,0 +1,372 @@
+"""Layers for feed-forward networks: Dense, activations and Sequential.
+
+Every layer keeps the buffers it writes. The output of ``forward`` and the
+gradient returned by ``backward`` are allocated once per batch size and
+overwritten by later calls, so a training loop allocates no per-step
+matrices beyond what ``Matrix.multiply`` needs internally. Copy a returned
+matrix to keep it past the next call.
+
+``Dense`` computes ``activation(x @ W + b)`` with one matmul into its
+output buffer followed by one pass that adds the bias and applies the
+activation per row. Its backward pass writes the weight and bias gradients
+into fixed buffers (``weight_grad``, ``bias_grad``); they are overwritten,
+not accumulated. ``Sequential`` puts the parameters of all its layers in one
+contiguous 1 x P matrix (``parameters``), with the gradients laid out the
+same way (``gradients``), so an update is a single pass such as
+``model.parameters.add_(model.gradients, -lr)``.
+
+Example:
+    model = Sequential(Dense(4, 16, init="he"), ReLU(), Dense(16, 1))
+    loss = MSELoss()
+    for x, y in loader:
+        loss(model(x), y)
+        model.backward(loss.backward())
+        model.parameters.add_(model.gradients, -0.01)
+"""
+
+from array import array
+from operator import add
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..math.activation_functions import _relu_values, _sigmoid_values, _tanh_values
+from ..math.matrix import Matrix, _map_into
+from ..random import Sampler
+
+ChunkFn = Callable[[Sequence[float]], Iterable[float]]
+
+
+def _relu_grad(grads: Sequence[float], outputs: Sequence[float]) -> List[float]:
+    return [g if y > 0.0 else 0.0 for g, y in zip(grads, outputs)]
+
+
+def _sigmoid_grad(grads: Sequence[float], outputs: Sequence[float]) -> List[float]:
+    return [g * y * (1.0 - y) for g, y in zip(grads, outputs)]
+
+
+def _tanh_grad(grads: Sequence[float], outputs: Sequence[float]) -> List[float]:
+    return [g * (1.0 - y * y) for g, y in zip(grads, outputs)]
+
+
+# Activation name -> (values function, gradient from upstream grads and the
+# activation's own outputs). Every derivative here is a function of the
+# output, so backward never needs the pre-activation values.
+ACTIVATIONS: Dict[str, Tuple[ChunkFn, Callable[[Sequence[float], Sequence[float]], List[float]]]] = {
+    "relu": (_relu_values, _relu_grad),
+    "sigmoid": (_sigmoid_values, _sigmoid_grad),
+    "tanh": (_tanh_values, _tanh_grad),
+}
+
+
+def _check_activation(name: Optional[str]) -> None:
+    if name is not None and name not in ACTIVATIONS:
+        raise ValueError(f"Unknown activation '{name}', expected one of {list(ACTIVATIONS)} or None")
+
+
+class Layer:
+    """Base class: a differentiable map from a batch (one example per row) to a batch."""
+
+    def __init__(self) -> None:
+        self._buffers: Dict[Tuple[str, int, int], Matrix] = {}
+
+    def _buffer(self, name: str, rows: int, cols: int) -> Matrix:
+        """The layer's reusable rows x cols buffer called name."""
+        key = (name, rows, cols)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = Matrix(rows, cols)
+        return buf
+
+    def forward(self, x: Matrix) -> Matrix:
+        """Compute the layer's output for batch x."""
+        raise NotImplementedError
+
+    def backward(self, grad: Matrix, need_input_grad: bool = True) -> Optional[Matrix]:
+        """Backpropagate grad (dLoss/dOutput of the last forward call).
+
+        Writes this layer's parameter gradients and returns dLoss/dInput, or
+        None when need_input_grad is False.
+        """
+        raise NotImplementedError
+
+    def num_parameters(self) -> int:
+        """Number of trainable values."""
+        return 0
+
+    def _bind(self, params: Sequence[float], grads: Sequence[float], offset: int) -> int:
+        """Move parameters and gradients into shared flat storage at offset.
+
+        Current parameter values are copied over. Returns the offset just past
+        this layer's block.
+        """
+        return offset
+
+    def __call__(self, x: Matrix) -> Matrix:
+        return self.forward(x)
+
+
+class Dense(Layer):
+    """Fully connected layer: activation(x @ weight + bias).
+
+    weight is in_features x out_features and bias is 1 x out_features, with
+    gradients of the same shapes in ``weight_grad`` and ``bias_grad``.
+    """
+
+    def __init__(self, in_features: int, out_features: int, activation: Optional[str] = None,
+                 sampler: Optional[Sampler] = None, seed: Optional[int] = None,
+                 init: Optional[str] = None) -> None:
+        """Create a layer with initialized weights and a zero bias.
+
+        The initialization depends only on these arguments: a ReLU layer
+        placed after this one in a Sequential doesn't change it, so pass
+        activation="relu" or init="he" for He initialization.
+
+        Args:
+            in_features: Columns of the input
+            out_features: Columns of the output
+            activation: "relu", "sigmoid", "tanh" or None for a linear layer
+            sampler: Sampler for the initial weights; defaults to Sampler(seed)
+            seed: Seed for the default sampler
+            init: "he" (normal) or "xavier" (uniform); None uses He for a
+                ReLU activation and Xavier otherwise
+
+        Raises:
+            ValueError: If a size is less than 1, or the activation or init
+                is unknown
+        """
+        super().__init__()
+        if in_features < 1 or out_features < 1:
+            raise ValueError(f"Dense layer sizes must be at least 1, got ({in_features}, {out_features})")
+        _check_activation(activation)
+        if init is None:
+            init = "he" if activation == "relu" else "xavier"
+        if init not in ("he", "xavier"):
+            raise ValueError(f"Unknown init '{init}', expected 'he', 'xavier' or None")
+        self.in_features = in_features
+        self.out_features = out_features
+        self.activation = activation
+        sampler = sampler if sampler is not None else Sampler(seed)
+        self.weight = Matrix(in_features, out_features)
+        if init == "he":
+            sampler.he_normal_(self.weight)
+        else:
+            sampler.xavier_uniform_(self.weight)
+        self.bias = Matrix(1, out_features)
+        self.weight_grad = Matrix(in_features, out_features)
+        self.bias_grad = Matrix(1, out_features)
+        self._input: Optional[Matrix] = None
+        self._output: Optional[Matrix] = None
+
+    def num_parameters(self) -> int:
+        return (self.in_features + 1) * self.out_features
+
+    def _bind(self, params: Sequence[float], grads: Sequence[float], offset: int) -> int:
+        n, m = self.in_features, self.out_features
+        views = []
+        for storage, weight, bias in ((params, self.weight, self.bias),
+                                      (grads, self.weight_grad, self.bias_grad)):
+            new_weight = Matrix._view(storage, n, m, offset, m, 1)
+            new_bias = Matrix._view(storage, 1, m, offset + n * m, m, 1)
+            new_weight._assign(weight)
+            new_bias._assign(bias)
+            views.append((new_weight, new_bias))
+        (self.weight, self.bias), (self.weight_grad, self.bias_grad) = views
+        return offset + n * m + m
+
+    def forward(self, x: Matrix) -> Matrix:
+        """activation(x @ weight + bias), written into the layer's output buffer.
+
+        Raises:
+            ValueError: If x doesn't have in_features columns
+        """
+        return self._forward(x, self.activation)
+
+    def _forward(self, x: Matrix, activation: Optional[str]) -> Matrix:
+        if x.cols != self.in_features:
+            raise ValueError(f"Dense layer expects {self.in_features} input columns, got {x.cols}")
+        out = self._buffer("output", x.rows, self.out_features)
+        Matrix.multiply(x, self.weight, out=out)
+        # One pass adds the bias and applies the activation, row by row
+        bias = self.bias.flat().tolist()
+        values = ACTIVATIONS[activation][0] if activation is not None else None
+        data, cols = out.data, out.cols
+        for start in range(0, out.rows * cols, cols):
+            row = map(add, data[start:start + cols], bias)
+            data[start:start + cols] = array('d', values(row) if values is not None else row)
+        self._input = x
+        self._output = out
+        return out
+
+    def backward(self, grad: Matrix, need_input_grad: bool = True) -> Optional[Matrix]:
+        """Write weight_grad and bias_grad and return dLoss/dInput.
+
+        Raises:
+            RuntimeError: If forward hasn't been called
+            ValueError: If grad doesn't match the last output's shape
+        """
+        return self._backward(grad, need_input_grad, self.activation)
+
+    def _backward(self, grad: Matrix, need_input_grad: bool, activation: Optional[str]) -> Optional[Matrix]:
+        if self._output is None:
+            raise RuntimeError("Dense.backward called before forward")
+        out = self._output
+        out._check_out(grad, out.rows, out.cols)
+        if activation is not None:
+            # dLoss/d(pre-activation), from the saved outputs
+            dz = self._buffer("pre_activation_grad", out.rows, out.cols)
+            _map_into(dz, ACTIVATIONS[activation][1], grad, out)
+        else:
+            dz = grad
+        Matrix.multiply(self._input.T, dz, out=self.weight_grad)
+        # Column sums of dz: zip walks the rows in parallel, one tuple per column
+        flat, cols = dz.flat(), dz.cols
+        rows = [flat[start:start + cols] for start in range(0, dz.rows * cols, cols)]
+        self.bias_grad._assign(Matrix._from_storage(1, cols, array('d', map(sum, zip(*rows)))))
+        if not need_input_grad:
+            return None
+        return Matrix.multiply(dz, self.weight.T, out=self._buffer("input_grad", dz.rows, self.in_features))
+
+
+class Activation(Layer):
+    """Element-wise activation layer.
+
+    Following a Dense layer inside a Sequential, it is fused into that
+    layer's forward pass instead of running on its own.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Create an activation layer ("relu", "sigmoid" or "tanh").
+
+        Raises:
+            ValueError: If the activation is unknown
+        """
+        super().__init__()
+        if name is None:
+            raise ValueError("Activation layers need an activation name")
+        _check_activation(name)
+        self.name = name
+        self._output: Optional[Matrix] = None
+
+    def forward(self, x: Matrix) -> Matrix:
+        out = self._buffer("output", x.rows, x.cols)
+        _map_into(out, ACTIVATIONS[self.name][0], x)
+        self._output = out
+        return out
+
+    def backward(self, grad: Matrix, need_input_grad: bool = True) -> Optional[Matrix]:
+        if self._output is None:
+            raise RuntimeError(f"{type(self).__name__}.backward called before forward")
+        out = self._output
+        out._check_out(grad, out.rows, out.cols)
+        if not need_input_grad:
+            return None
+        result = self._buffer("input_grad", out.rows, out.cols)
+        _map_into(result, ACTIVATIONS[self.name][1], grad, out)
+        return result
+
+
+class ReLU(Activation):
+    """max(x, 0) element-wise."""
+
+    def __init__(self) -> None:
+        super().__init__("relu")
+
+
+class Sigmoid(Activation):
+    """Logistic sigmoid element-wise."""
+
+    def __init__(self) -> None:
+        super().__init__("sigmoid")
+
+
+class Tanh(Activation):
+    """Hyperbolic tangent element-wise."""
+
+    def __init__(self) -> None:
+        super().__init__("tanh")
+
+
+class _FusedDense(Layer):
+    """A linear Dense layer and the activation layer after it, run as one step.
+
+    The Dense layer's parameters, buffers and ``activation`` are left as they
+    are; only this step applies the activation, so the same layers can be
+    reused elsewhere unchanged.
+    """
+
+    def __init__(self, dense: Dense, activation: str) -> None:
+        super().__init__()
+        self.dense = dense
+        self.activation = activation
+
+    def num_parameters(self) -> int:
+        return self.dense.num_parameters()
+
+    def _bind(self, params: Sequence[float], grads: Sequence[float], offset: int) -> int:
+        return self.dense._bind(params, grads, offset)
+
+    def forward(self, x: Matrix) -> Matrix:
+        return self.dense._forward(x, self.activation)
+
+    def backward(self, grad: Matrix, need_input_grad: bool = True) -> Optional[Matrix]:
+        return self.dense._backward(grad, need_input_grad, self.activation)
+
+
+def _fuse(layers: Sequence[Layer]) -> List[Layer]:
+    """Pair each activation layer that follows a linear Dense with that Dense."""
+    steps: List[Layer] = []
+    for layer in layers:
+        previous = steps[-1] if steps else None
+        if isinstance(layer, Activation) and isinstance(previous, Dense) and previous.activation is None:
+            steps[-1] = _FusedDense(previous, layer.name)
+        else:
+            steps.append(layer)
+    return steps
+
+
+class Sequential(Layer):
+    """Layers applied in order, with all parameters in one contiguous block.
+
+    ``parameters`` and ``gradients`` are 1 x P matrices; each layer's weights
+    and gradients are views into them, so writes through either are shared.
+    """
+
+    def __init__(self, *layers: Layer) -> None:
+        """Chain layers, fusing an activation layer into a preceding linear Dense.
+
+        The pair runs as one private step; neither layer is modified, and
+        the activation layer is not run on its own.
+        """
+        super().__init__()
+        self.layers = list(layers)
+        self._steps = _fuse(self.layers)
+        size = self.num_parameters()
+        self.parameters = Matrix(1, size)
+        self.gradients = Matrix(1, size)
+        self._bind(self.parameters.data, self.gradients.data, 0)
+
+    def num_parameters(self) -> int:
+        return sum(layer.num_parameters() for layer in self._steps)
+
+    def _bind(self, params: Sequence[float], grads: Sequence[float], offset: int) -> int:
+        start = offset
+        for layer in self._steps:
+            offset = layer._bind(params, grads, offset)
+        size = offset - start
+        self.parameters = Matrix._view(params, 1, size, start, size, 1)
+        self.gradients = Matrix._view(grads, 1, size, start, size, 1)
+        return offset
+
+    def forward(self, x: Matrix) -> Matrix:
+        for layer in self._steps:
+            x = layer.forward(x)
+        return x
+
+    def backward(self, grad: Matrix, need_input_grad: bool = False) -> Optional[Matrix]:
+        """Backpropagate through every layer, writing ``gradients``.
+
+        The gradient with respect to the input is only computed (and
+        returned) when need_input_grad is True.
+        """
+        for i in range(len(self._steps) - 1, -1, -1):
+            grad = self._steps[i].backward(grad, need_input_grad=need_input_grad or i > 0)
+        return grad
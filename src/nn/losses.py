@@ -0,0 +1,77 @@
+"""Loss layers: the loss value plus its gradient in a reused buffer.
+
+Values come from ``Loss``; ``backward`` writes dLoss/dPredictions for the
+last call into a buffer kept per batch shape, which is what
+``Sequential.backward`` takes.
+"""
+
+from array import array
+from itertools import repeat
+import math
+from operator import mul, sub
+from typing import Dict, Optional, Tuple
+
+from ..loss.loss import Loss
+from ..math.activation_functions import _softmax_row
+from ..math.matrix import Matrix, _map_into
+
+
+class _LossLayer:
+    def __init__(self) -> None:
+        self._buffers: Dict[Tuple[int, int], Matrix] = {}
+        self._predictions: Optional[Matrix] = None
+        self._targets: Optional[Matrix] = None
+
+    def _grad_buffer(self) -> Matrix:
+        if self._predictions is None:
+            raise RuntimeError(f"{type(self).__name__}.backward called before the loss was computed")
+        key = (self._predictions.rows, self._predictions.cols)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = Matrix(*key)
+        return buf
+
+    def __call__(self, predictions: Matrix, targets: Matrix) -> float:
+        return self.forward(predictions, targets)
+
+
+class MSELoss(_LossLayer):
+    """Mean squared error over all elements."""
+
+    def forward(self, predictions: Matrix, targets: Matrix) -> float:
+        """Mean squared error. Raises ValueError if the shapes don't match."""
+        loss = Loss.mse_loss(predictions, targets)
+        self._predictions, self._targets = predictions, targets
+        return loss
+
+    def backward(self) -> Matrix:
+        """2 * (predictions - targets) / count, for the last forward call."""
+        grad = self._grad_buffer()
+        scale = 2.0 / (grad.rows * grad.cols)
+        _map_into(grad, lambda p, t: map(mul, map(sub, p, t), repeat(scale)),
+                  self._predictions, self._targets)
+        return grad
+
+
+class CrossEntropyLoss(_LossLayer):
+    """Softmax cross-entropy of logits against target rows, averaged over rows."""
+
+    def forward(self, predictions: Matrix, targets: Matrix) -> float:
+        """Cross-entropy of the logits. Raises ValueError if the shapes don't match."""
+        loss = Loss.cross_entropy_with_logits(predictions, targets)
+        self._predictions, self._targets = predictions, targets
+        return loss
+
+    def backward(self) -> Matrix:
+        """(sum(y) * softmax(z) - y) / rows, for the last forward call."""
+        grad = self._grad_buffer()
+        rows, cols = grad.rows, grad.cols
+        logits, targets = self._predictions.flat(), self._targets.flat()
+        scale = 1.0 / rows
+        for start in range(0, rows * cols, cols):
+            y = targets[start:start + cols]
+            total = math.fsum(y) * scale
+            probs = _softmax_row(logits[start:start + cols].tolist(), log=False)
+            grad.data[start:start + cols] = array(
+                'd', [total * p - t * scale for p, t in zip(probs, y)])
+        return grad
@@ -0,0 +1,5 @@
+"""Optimizers that update flat parameter buffers in place."""
+
+from .optimizers import SGD, Adam, AdamW, Optimizer, RMSProp
+
+__all__ = ["Adam", "AdamW", "Optimizer", "RMSProp", "SGD"]
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""Optimizers that update a flat parameter buffer in place.
+
+An optimizer is built over a parameters matrix and a gradients matrix of
+the same shape, typically the contiguous blocks of a ``Sequential``
+(``model.parameters`` and ``model.gradients``). Its state (velocities,
+moment estimates) lives in flat buffers aligned with the parameters and of
+the same dtype (float64 or float32). ``step`` walks the buffers CHUNK values at a time: each chunk
+of gradients is read once, clipped, decayed, and folded into the state and
+the parameters. Nothing the size of the model is allocated per step.
+
+Clipping by global norm needs the norm before any parameter moves, so when
+``max_grad_norm`` is set ``step`` first sums the squared gradients (one
+read-only pass) and then applies the clip factor inside the update sweep.
+
+Example:
+    optimizer = Adam(model.parameters, model.gradients, lr=1e-3, max_grad_norm=1.0)
+    for x, y in loader:
+        loss(model(x), y)
+        model.backward(loss.backward())
+        optimizer.step()
+"""
+
+from array import array
+from itertools import repeat
+import math
+from operator import mul
+from typing import Optional, Sequence, Tuple
+
+from ..math.matrix import CHUNK, Matrix, _typecode
+
+# Added to the norm before dividing when clipping, so a zero norm is safe
+CLIP_EPSILON = 1e-6
+
+
+def _zeros(n: int, code: str = 'd') -> array:
+    return array(code, [0.0]) * n
+
+
+def _axpy(alpha: float, x: Sequence[float], y: Sequence[float], code: str = 'd') -> array:
+    """alpha * x + y, as an array of typecode code."""
+    return array(code, [alpha * a + b for a, b in zip(x, y)])
+
+
+class Optimizer:
+    """Base class: validates the buffers and runs the chunked update sweep.
+
+    Subclasses implement ``_update(s, p, g)``, which writes the new values
+    of storage slice s given that slice of the parameters (p) and of the
+    clipped gradients (g).
+    """
+
+    def __init__(self, params: Matrix, grads: Matrix, lr: float,
+                 max_grad_norm: Optional[float] = None) -> None:
+        """Create an optimizer over params, reading gradients from grads.
+
+        Args:
+            params: Parameters, updated in place; must be contiguous
+            grads: Gradients with the same shape; must be contiguous
+            lr: Learning rate (may be changed between steps via ``lr``)
+            max_grad_norm: If given, gradients are scaled down so their
+                global L2 norm is at most this before each update
+
+        Raises:
+            ValueError: If the shapes differ, a buffer isn't contiguous, or
+                lr or max_grad_norm is negative
+        """
+        if params.rows != grads.rows or params.cols != grads.cols:
+            raise ValueError(f"Parameters have shape ({params.rows}, {params.cols}) "
+                             f"but gradients have shape ({grads.rows}, {grads.cols})")
+        if not params.is_contiguous() or not grads.is_contiguous():
+            raise ValueError("Optimizers need contiguous parameter and gradient buffers")
+        if lr < 0:
+            raise ValueError(f"Learning rate must be non-negative, got {lr}")
+        if max_grad_norm is not None and max_grad_norm < 0:
+            raise ValueError(f"max_grad_norm must be non-negative, got {max_grad_norm}")
+        self.params = params
+        self.grads = grads
+        self.lr = lr
+        self.max_grad_norm = max_grad_norm
+        self.steps = 0
+        self._p = params._flat_buffer()
+        self._g = grads._flat_buffer()
+        # Typecode of the parameters, used for the updates and the state
+        self._code = _typecode(self._p)
+        self.size = len(self._p)
+
+    def grad_norm(self) -> float:
+        """Global L2 norm of the gradients."""
+        g = self._g
+        return math.sqrt(sum(sum(map(mul, g[start:start + CHUNK], g[start:start + CHUNK]))
+                             for start in range(0, self.size, CHUNK)))
+
+    def zero_grad(self) -> None:
+        """Set every gradient to 0."""
+        self.grads.fill_(0.0)
+
+    def step(self) -> Optional[float]:
+        """Update the parameters from the current gradients.
+
+        Returns:
+            The global gradient norm before clipping when max_grad_norm is
+            set, otherwise None
+        """
+        norm = None
+        scale = 1.0
+        if self.max_grad_norm is not None:
+            norm = self.grad_norm()
+            if norm > self.max_grad_norm:
+                scale = self.max_grad_norm / (norm + CLIP_EPSILON)
+        self.steps += 1
+        self._begin_step()
+        p_all, g_all = self._p, self._g
+        for start in range(0, self.size, CHUNK):
+            s = slice(start, min(start + CHUNK, self.size))
+            g = g_all[s]
+            if scale != 1.0:
+                g = array('d', map(mul, g, repeat(scale)))
+            self._update(s, p_all[s], g)
+        return norm
+
+    def _begin_step(self) -> None:
+        """Hook for per-step constants (e.g. bias corrections)."""
+
+    def _update(self, s: slice, p: Sequence[float], g: Sequence[float]) -> None:
+        raise NotImplementedError
+
+
+class SGD(Optimizer):
+    """Stochastic gradient descent with optional (Nesterov) momentum.
+
+    With momentum mu: v = mu * v + g, then p -= lr * v, or
+    p -= lr * (g + mu * v) with Nesterov. weight_decay adds
+    weight_decay * p to the gradient.
+    """
+
+    def __init__(self, params: Matrix, grads: Matrix, lr: float = 0.01, momentum: float = 0.0,
+                 nesterov: bool = False, weight_decay: float = 0.0,
+                 max_grad_norm: Optional[float] = None) -> None:
+        """Create an SGD optimizer; see ``Optimizer`` for params, grads, lr and max_grad_norm.
+
+        Raises:
+            ValueError: As for ``Optimizer``, or if momentum or weight_decay
+                is negative, or nesterov is set without momentum
+        """
+        super().__init__(params, grads, lr, max_grad_norm)
+        if momentum < 0 or weight_decay < 0:
+            raise ValueError(f"momentum and weight_decay must be non-negative, got {momentum} and {weight_decay}")
+        if nesterov and momentum == 0:
+            raise ValueError("Nesterov momentum requires momentum > 0")
+        self.momentum = momentum
+        self.nesterov = nesterov
+        self.weight_decay = weight_decay
+        self.velocity = _zeros(self.size, self._code) if momentum else None
+
+    def _update(self, s: slice, p: Sequence[float], g: Sequence[float]) -> None:
+        if self.weight_decay:
+            g = _axpy(self.weight_decay, p, g)
+        if self.velocity is not None:
+            v = _axpy(self.momentum, self.velocity[s], g, self._code)
+            self.velocity[s] = v
+            g = _axpy(self.momentum, v, g) if self.nesterov else v
+        self._p[s] = _axpy(-self.lr, g, p, self._code)
+
+
+class Adam(Optimizer):
+    """Adam, with L2 weight decay added to the gradient.
+
+    m = b1 * m + (1 - b1) * g and v = b2 * v + (1 - b2) * g^2, then
+    p -= lr * m_hat / (sqrt(v_hat) + eps) with bias-corrected m_hat, v_hat.
+    """
+
+    # Whether weight decay shrinks the parameters directly (AdamW) instead of
+    # being added to the gradient
+    decoupled = False
+
+    def __init__(self, params: Matrix, grads: Matrix, lr: float = 1e-3,
+                 betas: Tuple[float, float] = (0.9, 0.999), eps: float = 1e-8,
+                 weight_decay: float = 0.0, max_grad_norm: Optional[float] = None) -> None:
+        """Create an Adam optimizer; see ``Optimizer`` for params, grads, lr and max_grad_norm.
+
+        Raises:
+            ValueError: As for ``Optimizer``, or if a beta is outside [0, 1)
+                or eps or weight_decay is negative
+        """
+        super().__init__(params, grads, lr, max_grad_norm)
+        if not all(0.0 <= beta < 1.0 for beta in betas):
+            raise ValueError(f"betas must be in [0, 1), got {betas}")
+        if eps < 0 or weight_decay < 0:
+            raise ValueError(f"eps and weight_decay must be non-negative, got {eps} and {weight_decay}")
+        self.betas = betas
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.exp_avg = _zeros(self.size, self._code)
+        self.exp_avg_sq = _zeros(self.size, self._code)
+        self._step_size = 0.0
+        self._eps_hat = eps
+
+    def _begin_step(self) -> None:
+        # lr * m_hat / (sqrt(v_hat) + eps) rewritten over the raw moments:
+        # step_size * m / (sqrt(v) + eps * sqrt(1 - b2^t))
+        b1, b2 = self.betas
+        root = math.sqrt(1.0 - b2 ** self.steps)
+        self._step_size = self.lr * root / (1.0 - b1 ** self.steps)
+        self._eps_hat = self.eps * root
+
+    def _update(self, s: slice, p: Sequence[float], g: Sequence[float]) -> None:
+        b1, b2 = self.betas
+        c1, c2 = 1.0 - b1, 1.0 - b2
+        decay = 1.0
+        if self.weight_decay:
+            if self.decoupled:
+                decay -= self.lr * self.weight_decay
+            else:
+                g = _axpy(self.weight_decay, p, g)
+        code = self._code
+        m = array(code, [b1 * mi + c1 * gi for mi, gi in zip(self.exp_avg[s], g)])
+        v = array(code, [b2 * vi + c2 * gi * gi for vi, gi in zip(self.exp_avg_sq[s], g)])
+        self.exp_avg[s] = m
+        self.exp_avg_sq[s] = v
+        step_size, eps, sqrt = self._step_size, self._eps_hat, math.sqrt
+        self._p[s] = array(code, [decay * pi - step_size * mi / (sqrt(vi) + eps)
+                                  for pi, mi, vi in zip(p, m, v)])
+
+
+class AdamW(Adam):
+    """Adam with decoupled weight decay: p -= lr * weight_decay * p each step."""
+
+    decoupled = True
+
+    def __init__(self, params: Matrix, grads: Matrix, lr: float = 1e-3,
+                 betas: Tuple[float, float] = (0.9, 0.999), eps: float = 1e-8,
+                 weight_decay: float = 0.01, max_grad_norm: Optional[float] = None) -> None:
+        """Create an AdamW optimizer; arguments as for ``Adam``."""
+        super().__init__(params, grads, lr, betas, eps, weight_decay, max_grad_norm)
+
+
+class RMSProp(Optimizer):
+    """RMSProp: s = alpha * s + (1 - alpha) * g^2, then p -= lr * g / (sqrt(s) + eps)."""
+
+    def __init__(self, params: Matrix, grads: Matrix, lr: float = 0.01, alpha: float = 0.99,
+                 eps: float = 1e-8, weight_decay: float = 0.0,
+                 max_grad_norm: Optional[float] = None) -> None:
+        """Create an RMSProp optimizer; see ``Optimizer`` for params, grads, lr and max_grad_norm.
+
+        Raises:
+            ValueError: As for ``Optimizer``, or if alpha is outside [0, 1)
+                or eps or weight_decay is negative
+        """
+        super().__init__(params, grads, lr, max_grad_norm)
+        if not 0.0 <= alpha < 1.0:
+            raise ValueError(f"alpha must be in [0, 1), got {alpha}")
+        if eps < 0 or weight_decay < 0:
+            raise ValueError(f"eps and weight_decay must be non-negative, got {eps} and {weight_decay}")
+        self.alpha = alpha
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.square_avg = _zeros(self.size, self._code)
+
+    def _update(self, s: slice, p: Sequence[float], g: Sequence[float]) -> None:
+        if self.weight_decay:
+            g = _axpy(self.weight_decay, p, g)
+        alpha, c = self.alpha, 1.0 - self.alpha
+        code = self._code
+        sq = array(code, [alpha * si + c * gi * gi for si, gi in zip(self.square_avg[s], g)])
+        self.square_avg[s] = sq
+        lr, eps, sqrt = self.lr, self.eps, math.sqrt
+        self._p[s] = array(code, [pi - lr * gi / (sqrt(si) + eps) for pi, gi, si in zip(p, g, sq)])
@@ -0,0 +1,5 @@
+"""Opt-in profiling of hot paths: per-op tables, JSON reports and Chrome traces."""
+
+from .profiler import HOT_PATHS, OpStats, Profiler, register
+
+__all__ = ["HOT_PATHS", "OpStats", "Profiler", "register"]
\ No newline at end of file
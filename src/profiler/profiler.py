@@ -0,0 +1,404 @@
+"""Opt-in profiling of the library's hot paths.
+
+A ``Profiler`` records, per op, the call count, wall time (total, and self
+time excluding nested profiled calls), elements processed and, with
+``memory=True``, the peak bytes allocated inside the call (tracemalloc;
+on Python 3.8, which lacks ``tracemalloc.reset_peak``, the net bytes
+still allocated when the call returns).
+Autograd backward passes are broken down per node type
+("Value.*.backward", "Tensor.matmul.backward", ...).
+
+Instrumentation is installed only while a profiler is enabled: entering it
+replaces the registered functions (``HOT_PATHS``) with timing wrappers and
+leaving it puts the originals back, so code run without a profiler goes
+through exactly the same functions as if this module didn't exist.
+
+Example:
+    with Profiler() as prof:
+        train_one_epoch()
+    print(prof.table())
+    prof.save_json("profile.json")
+    prof.save_chrome_trace("trace.json")   # open in chrome://tracing or Perfetto
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..autograd.computation_graph import ComputationGraph
+from ..autograd.tensor import Tensor
+from ..loss.loss import Loss
+from ..math.activation_functions import ActivationFunctions
+from ..math.matrix import Matrix
+from ..math.quantize import QuantizedMatrix
+from ..math.vector import Vector
+from ..nn.layers import Activation, Dense, _FusedDense
+from ..optim.optimizers import Optimizer
+
+ElementsFn = Callable[[Tuple[Any, ...], Any], int]
+
+
+def _size(x: Any) -> Optional[int]:
+    if isinstance(x, Matrix):
+        return x.rows * x.cols
+    if isinstance(x, Vector):
+        return x.size()
+    return None
+
+
+def default_elements(args: Tuple[Any, ...], result: Any) -> int:
+    """Size of a Matrix/Vector result, else of the first Matrix/Vector argument.
+
+    Calls on plain numbers count as one element.
+    """
+    for x in (result,) + tuple(args):
+        size = _size(x)
+        if size is not None:
+            return size
+    return 1 if isinstance(result, (int, float)) else 0
+
+
+def _multiply_elements(args: Tuple[Any, ...], result: Any) -> int:
+    # Multiply-adds: n * k * m
+    m1, m2 = args[0], args[1]
+    return m1.rows * m1.cols * m2.cols
+
+
+# Functions instrumented while a profiler is enabled: (owner, attribute,
+# elements function). Extend with ``register``.
+HOT_PATHS: List[Tuple[Any, str, ElementsFn]] = [
+    (Matrix, "multiply", _multiply_elements),
+    (Matrix, "add", default_elements),
+    (Matrix, "elementwise", default_elements),
+    (Matrix, "apply", default_elements),
+    (Matrix, "scalar_multiply", default_elements),
+    (Matrix, "add_", default_elements),
+    (Matrix, "scale_", default_elements),
+    (QuantizedMatrix, "multiply", _multiply_elements),
+    (Vector, "dot_product", default_elements),
+    (Vector, "apply_scalar", default_elements),
+    (Vector, "project", default_elements),
+    (Vector, "l2_norm", default_elements),
+    (ActivationFunctions, "relu", default_elements),
+    (ActivationFunctions, "sigmoid", default_elements),
+    (ActivationFunctions, "tanh", default_elements),
+    (ActivationFunctions, "softmax", default_elements),
+    (ActivationFunctions, "log_softmax", default_elements),
+    (Loss, "mse_loss", default_elements),
+    (Loss, "mae_loss", default_elements),
+    (Loss, "binary_cross_entropy", default_elements),
+    (Loss, "categorical_cross_entropy", default_elements),
+    (Loss, "cross_entropy_with_logits", default_elements),
+    (Dense, "forward", default_elements),
+    (Dense, "backward", default_elements),
+    # A Dense layer fused with the activation after it inside a Sequential
+    (_FusedDense, "forward", default_elements),
+    (_FusedDense, "backward", default_elements),
+    (Activation, "forward", default_elements),
+    (Activation, "backward", default_elements),
+    (Optimizer, "step", lambda args, result: args[0].size),
+    (Tensor, "backward", lambda args, result: default_elements((args[0].data,), None)),
+]
+
+
+def register(owner: Any, attribute: str, elements: ElementsFn = default_elements) -> None:
+    """Instrument owner.attribute (a function, method or staticmethod) in future profiles."""
+    if attribute not in vars(owner):
+        raise AttributeError(f"{owner.__name__} has no attribute '{attribute}' of its own")
+    HOT_PATHS.append((owner, attribute, elements))
+
+
+# tracemalloc.reset_peak (Python 3.9+), or None on Python 3.8
+_RESET_PEAK = getattr(tracemalloc, "reset_peak", None)
+
+
+def _traced_memory() -> Tuple[int, int]:
+    """(current, peak) traced bytes.
+
+    Without reset_peak the peak can't be scoped to one call, so the current
+    size stands in for it.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    return (current, peak) if _RESET_PEAK is not None else (current, current)
+
+
+class OpStats:
+    """Aggregated measurements for one op."""
+
+    __slots__ = ("name", "category", "calls", "total_seconds", "self_seconds", "elements", "bytes")
+
+    def __init__(self, name: str, category: str) -> None:
+        self.name = name
+        self.category = category
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.self_seconds = 0.0
+        self.elements = 0
+        self.bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "self_seconds": self.self_seconds,
+            "elements": self.elements,
+            "elements_per_sec": self.elements / self.total_seconds if self.total_seconds > 0 else 0.0,
+            "bytes": self.bytes,
+        }
+
+
+class Profiler:
+    """Records per-op statistics (and trace events) while enabled.
+
+    Use as a context manager, or as a decorator to profile every call of a
+    function; statistics accumulate across uses. Enabling a profiler that is
+    already enabled nests (it stays enabled until the outermost exit), but
+    only one profiler can be enabled at a time.
+    """
+
+    _active: Optional['Profiler'] = None
+
+    def __init__(self, memory: bool = False, trace: bool = True, max_events: int = 1_000_000) -> None:
+        """Create a disabled profiler.
+
+        Args:
+            memory: Also record peak bytes allocated per call, using
+                tracemalloc (which slows everything down while enabled)
+            trace: Keep one event per call for ``save_chrome_trace``
+            max_events: Stop recording trace events after this many
+        """
+        self.memory = memory
+        self.trace = trace
+        self.max_events = max_events
+        self.stats: Dict[str, OpStats] = {}
+        self.events: List[Tuple[str, str, float, float, int, int, int]] = []
+        self.enabled = False
+        self._depth = 0
+        self._local = threading.local()
+        self._originals: List[Tuple[Any, str, Any]] = []
+        self._started_tracemalloc = False
+        self._epoch = time.perf_counter()
+
+    # -- enabling -----------------------------------------------------------
+
+    def enable(self) -> None:
+        """Install the instrumentation.
+
+        Raises:
+            RuntimeError: If another profiler is already enabled
+        """
+        if Profiler._active is self:
+            self._depth += 1
+            return
+        if Profiler._active is not None:
+            raise RuntimeError("Another profiler is already enabled")
+        self._depth = 1
+        Profiler._active = self
+        self.enabled = True
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        for owner, attribute, elements in HOT_PATHS:
+            self._patch(owner, attribute, self._wrap(owner, attribute, elements))
+        self._patch(ComputationGraph, "backward", self._graph_backward())
+        self._patch(Tensor, "_result", staticmethod(self._tensor_result(Tensor._result)))
+
+    def disable(self) -> None:
+        """Restore the original functions (once the outermost enable is undone)."""
+        if self._depth > 1:
+            self._depth -= 1
+            return
+        self._depth = 0
+        for owner, attribute, original in reversed(self._originals):
+            setattr(owner, attribute, original)
+        self._originals.clear()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.enabled = False
+        if Profiler._active is self:
+            Profiler._active = None
+
+    def __enter__(self) -> 'Profiler':
+        self.enable()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.disable()
+
+    def __call__(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            with self:
+                return fn(*args, **kwargs)
+        return profiled
+
+    def reset(self) -> None:
+        """Drop all recorded statistics and events."""
+        self.stats.clear()
+        self.events.clear()
+        self._epoch = time.perf_counter()
+
+    def _patch(self, owner: Any, attribute: str, replacement: Any) -> None:
+        self._originals.append((owner, attribute, vars(owner)[attribute]))
+        setattr(owner, attribute, replacement)
+
+    # -- recording ----------------------------------------------------------
+
+    def _push(self) -> List[Any]:
+        """Open a span: [start, time in child spans, start bytes, peak bytes seen]."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        current = 0
+        if self.memory:
+            current, peak = _traced_memory()
+            if stack:
+                stack[-1][3] = max(stack[-1][3], peak)
+            if _RESET_PEAK is not None:
+                _RESET_PEAK()
+        frame = [0.0, 0.0, current, current]
+        stack.append(frame)
+        frame[0] = time.perf_counter()
+        return frame
+
+    def _pop(self, frame: List[Any], name: str, category: str, elements: int) -> None:
+        elapsed = time.perf_counter() - frame[0]
+        stack = self._local.stack
+        stack.pop()
+        allocated = 0
+        if self.memory:
+            peak = max(frame[3], _traced_memory()[1])
+            allocated = peak - frame[2]
+            if stack:
+                stack[-1][3] = max(stack[-1][3], peak)
+        if stack:
+            stack[-1][1] += elapsed
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = OpStats(name, category)
+        stats.calls += 1
+        stats.total_seconds += elapsed
+        stats.self_seconds += elapsed - frame[1]
+        stats.elements += elements
+        stats.bytes += allocated
+        if self.trace and len(self.events) < self.max_events:
+            self.events.append((name, category, frame[0], elapsed, threading.get_ident(),
+                                elements, allocated))
+
+    def _wrap(self, owner: Any, attribute: str, elements: ElementsFn) -> Any:
+        original = vars(owner)[attribute]
+        static = isinstance(original, staticmethod)
+        fn = original.__func__ if static else original
+        name = f"{owner.__name__}.{attribute}"
+        push, pop = self._push, self._pop
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            frame = push()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                pop(frame, name, "op", 0)
+                raise
+            pop(frame, name, "op", elements(args, result))
+            return result
+        return staticmethod(timed) if static else timed
+
+    def _graph_backward(self) -> Callable[..., None]:
+        """ComputationGraph.backward with a span per node, named by its op."""
+        push, pop = self._push, self._pop
+        names: Dict[str, str] = {}
+
+        def backward(graph: ComputationGraph, grad: float = 1.0) -> None:
+            frame = push()
+            graph.root.grad = grad
+            for node in reversed(graph.order):
+                if node._prev:
+                    name = names.get(node._op)
+                    if name is None:
+                        name = names[node._op] = f"Value.{node._op}.backward"
+                    inner = push()
+                    node._backward(node)
+                    pop(inner, name, "autograd", 1)
+            pop(frame, "ComputationGraph.backward", "autograd", len(graph.order))
+        backward.__doc__ = ComputationGraph.backward.__doc__
+        return backward
+
+    def _tensor_result(self, original: Callable[..., Tensor]) -> Callable[..., Tensor]:
+        """Tensor._result that wraps each new node's backward rule in a span."""
+        profiler = self
+
+        def result(data: Matrix, children: Tuple[Tensor, ...], op: str,
+                   backward: Callable[[Tensor], None]) -> Tensor:
+            name = f"Tensor.{op}.backward"
+
+            def timed(out: Tensor) -> None:
+                if not profiler.enabled:
+                    backward(out)
+                    return
+                frame = profiler._push()
+                try:
+                    backward(out)
+                finally:
+                    profiler._pop(frame, name, "autograd", out.data.rows * out.data.cols)
+            return original(data, children, op, timed)
+        return result
+
+    # -- reports ------------------------------------------------------------
+
+    def report(self) -> Dict[str, Any]:
+        """Statistics per op, most self time first, as a JSON-ready dict."""
+        ops = sorted(self.stats.values(), key=lambda s: s.self_seconds, reverse=True)
+        return {
+            "total_seconds": sum(s.self_seconds for s in ops),
+            "memory": self.memory,
+            "ops": [s.to_dict() for s in ops],
+        }
+
+    def table(self, limit: Optional[int] = None) -> str:
+        """The report as a text table (optionally only the top limit ops)."""
+        report = self.report()
+        ops = report["ops"][:limit] if limit is not None else report["ops"]
+        total = report["total_seconds"] or 1.0
+        header = (f"{'op':<36} {'calls':>8} {'total ms':>10} {'self ms':>10} {'self %':>7} "
+                  f"{'M elem/s':>10}")
+        if self.memory:
+            header += f" {'KiB':>10}"
+        lines = [header, "-" * len(header)]
+        for op in ops:
+            line = (f"{op['name']:<36} {op['calls']:>8} {op['total_seconds'] * 1000:>10.3f} "
+                    f"{op['self_seconds'] * 1000:>10.3f} {op['self_seconds'] / total:>7.1%} "
+                    f"{op['elements_per_sec'] / 1e6:>10.2f}")
+            if self.memory:
+                line += f" {op['bytes'] / 1024:>10.1f}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def save_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.report(), fh, indent=2)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Recorded calls in the Chrome trace-event format (complete events, microseconds)."""
+        pid = os.getpid()
+        events = []
+        for name, category, start, elapsed, tid, elements, allocated in self.events:
+            args: Dict[str, Any] = {"elements": elements}
+            if self.memory:
+                args["bytes"] = allocated
+            events.append({"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                           "ts": (start - self._epoch) * 1e6, "dur": elapsed * 1e6, "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str) -> None:
+        """Write the trace for chrome://tracing or https://ui.perfetto.dev."""
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.chrome_trace(), fh)
+
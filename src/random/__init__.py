@@ -1,5 +1,5 @@
 """Random sampling utilities."""
 
-# Sampler implementation is a placeholder for now
+from .sampler import Sampler
 
-__all__ = []
\ No newline at end of file
+__all__ = ["Sampler"]
\ No newline at end of file
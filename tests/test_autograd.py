@@ -0,0 +1,232 @@
+"""Tests for autograd module."""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.autograd.codegen import CompiledGraph, trace
+from src.autograd.computation_graph import ComputationGraph, Value, topological_order
+from src.autograd.tensor import Tensor
+from src.math.matrix import Matrix
+
+
+def numerical_grad(fn, values, i, h=1e-6):
+    """Central difference of fn with respect to values[i]."""
+    up = list(values)
+    down = list(values)
+    up[i] += h
+    down[i] -= h
+    return (fn(*up) - fn(*down)) / (2 * h)
+
+
+def test_value_gradients():
+    """Test gradients of every op against finite differences."""
+    print("Testing Value Gradients")
+    print("=" * 40)
+
+    def build(a, b, c):
+        x, y, z = Value(a), Value(b), Value(c)
+        out = ((x * y + z ** 2) / (y - 0.5)).tanh() + (x * z).relu() + (y ** x).log() - x.exp() * 0.1
+        return x, y, z, out
+
+    def f(a, b, c):
+        return build(a, b, c)[3].data
+
+    inputs = [0.7, 1.3, -0.4]
+    x, y, z, out = build(*inputs)
+    out.backward()
+    for i, node in enumerate((x, y, z)):
+        expected = numerical_grad(f, inputs, i)
+        assert abs(node.grad - expected) < 1e-5, (i, node.grad, expected)
+
+    # Product rule uses the other operand's data, not its gradient
+    a, b = Value(3.0), Value(-2.0)
+    (a * b).backward()
+    assert a.grad == -2.0 and b.grad == 3.0
+
+    # A node used twice accumulates both contributions
+    a = Value(3.0)
+    (a * a + a).backward()
+    assert a.grad == 7.0
+
+    # relu passes gradient only for positive inputs
+    n = Value(-1.0)
+    n.relu().backward()
+    assert n.grad == 0.0
+    print("✓ Gradient tests passed")
+    print()
+
+
+def test_deep_graph():
+    """Test that deep graphs don't hit the recursion limit."""
+    print("Testing Deep Graph")
+    print("=" * 40)
+
+    depth = 100_000
+    x = Value(1.0)
+    out = x
+    for _ in range(depth):
+        out = out * 1.0 + 0.0
+    graph = out.backward()
+    assert x.grad == 1.0
+    # x, then per step: a constant and product, a constant and sum
+    assert len(graph) == 1 + 4 * depth
+    print(f"Backward through {len(graph)} nodes")
+    print()
+
+
+def test_graph_reuse():
+    """Test forward/zero_grad/backward on a cached graph."""
+    print("Testing Graph Reuse")
+    print("=" * 40)
+
+    x = Value(2.0)
+    w = Value(0.5)
+    loss = (x * w - 3) ** 2
+    graph = ComputationGraph(loss)
+    order = graph.order
+
+    graph.backward()
+    assert w.grad == 2 * (2.0 * 0.5 - 3) * 2.0
+
+    # New leaf values: re-evaluate in place and backprop again without re-sorting
+    x.data = 4.0
+    assert graph.forward() == (4.0 * 0.5 - 3) ** 2
+    graph.zero_grad()
+    graph.backward()
+    assert graph.order is order
+    assert w.grad == 2 * (4.0 * 0.5 - 3) * 4.0
+    assert x.grad == 2 * (4.0 * 0.5 - 3) * 0.5
+
+    # Every node appears after its inputs
+    position = {node: i for i, node in enumerate(topological_order(loss))}
+    for node in position:
+        for child in node._prev:
+            assert position[child] < position[node]
+    print("✓ Graph reuse tests passed")
+    print()
+
+
+def test_tensor_gradients():
+    """Test matrix-level backward rules against finite differences."""
+    print("Testing Tensor Gradients")
+    print("=" * 40)
+
+    import random
+    rng = random.Random(4)
+
+    def rand(n, m):
+        return Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(n * m)], n, m)
+
+    x_data, w_data, b_data = rand(5, 3), rand(3, 4), rand(1, 4)
+    w2_data = rand(4, 2)
+    y_data = Matrix.from_rows([[1, 0], [0, 1], [1, 0], [0, 1], [1, 0]])
+
+    def forward(x, w, b, w2):
+        hidden = (x @ w + b).tanh()
+        scores = (hidden.T.T @ w2).relu() * 2.0 - Tensor(y_data)
+        return scores.sigmoid().mse_loss(Tensor(y_data)) + (hidden @ w2).cross_entropy_with_logits(Tensor(y_data))
+
+    leaves = [Tensor(m.copy(), requires_grad=True) for m in (x_data, w_data, b_data, w2_data)]
+    loss = forward(*leaves)
+    assert loss.data.get_rows() == 1 and loss.data.get_cols() == 1
+    order = loss.backward()
+
+    h = 1e-6
+    for index, (leaf, base) in enumerate(zip(leaves, (x_data, w_data, b_data, w2_data))):
+        for i in range(base.get_rows()):
+            for j in range(base.get_cols()):
+                def at(delta):
+                    probes = [Tensor(m.copy()) for m in (x_data, w_data, b_data, w2_data)]
+                    probe = probes[index]
+                    probe.data.set_val_at(i, j, base.get_val_at(i, j) + delta)
+                    return forward(*probes).data.get_val_at(0, 0)
+                expected = (at(h) - at(-h)) / (2 * h)
+                assert abs(leaf.grad.get_val_at(i, j) - expected) < 1e-6
+
+    # One node per matrix op, not per element
+    assert len(order) < 30
+    # Only leaves keep gradients; constants get none
+    assert loss.grad is None
+    print(f"Graph has {len(order)} nodes")
+    print("✓ Tensor gradient tests passed")
+    print()
+
+
+def test_compiled_graph():
+    """Test generated forward/backward code against the Value graph."""
+    print("Testing Compiled Graph")
+    print("=" * 40)
+
+    def model(x, y, z):
+        out = ((x * y + z ** 2) / (y - 0.5)).tanh() + (x * z).relu() + (y ** x).log() - x.exp() * 0.1
+        return out + x * x + (z * -1.0) ** 2.0
+
+    for inputs in ([0.7, 1.3, -0.4], [-0.3, 2.0, 1.5], [1.1, 0.6, 0.2]):
+        leaves = [Value(v) for v in inputs]
+        out = model(*leaves)
+        out.backward()
+        fresh = [Value(v) for v in inputs]
+        compiled = CompiledGraph(model(*fresh), fresh)
+        value, grads = compiled.value_and_grad(inputs)
+        assert abs(value - out.data) < 1e-12 and compiled.forward(inputs) == value
+        for grad, leaf in zip(grads, leaves):
+            assert abs(grad - leaf.grad) < 1e-9, (grad, leaf.grad)
+
+    # Leaves that aren't inputs are constants; unused inputs get a zero gradient
+    w, c, unused = Value(2.0), Value(3.0), Value(5.0)
+    compiled = CompiledGraph(w * c + w, [w, unused])
+    assert compiled.value_and_grad([4.0, 1.0]) == (16.0, [4.0, 0.0])
+    assert compiled.value_and_grad([4.0, 1.0], grad=2.0)[1] == [8.0, 0.0]
+    # Negative constants keep their sign under **
+    e = Value(2.0)
+    assert CompiledGraph(Value(-2.0) ** e, [e]).forward([2.0]) == 4.0
+
+    # One compiled graph per argument structure
+    @trace
+    def loss(ws, xs, target):
+        pred = Value(0.0)
+        for w, x in zip(ws, xs):
+            pred = pred + w * x
+        return (pred - target) ** 2
+
+    value, (dws, dxs, dtarget) = loss.value_and_grad([0.5, -1.0], [1.0, 2.0], 3.0)
+    assert value == 20.25 and dws == [-9.0, -18.0] and dxs == [-4.5, 9.0] and dtarget == 9.0
+    assert loss([1.0, 1.0], [1.0, 1.0], 2.0) == 0.0
+    assert loss.compiled([0.0, 0.0], [0.0, 0.0], 0.0) is loss.compiled([1.0, 2.0], [3.0, 4.0], 5.0)
+    assert loss([1.0] * 3, [2.0] * 3, 0.0) == 36.0
+    assert len(loss._cache) == 2
+
+    # Nested arguments come back nested
+    matrix_sum = trace(lambda rows: sum((v * v for row in rows for v in row), Value(0.0)))
+    assert matrix_sum.value_and_grad([[1.0, 2.0], [3.0, 4.0]]) == (30.0, [[[2.0, 4.0], [6.0, 8.0]]])
+
+    a = Value(1.0)
+    for bad in (lambda: CompiledGraph(a * a, [a, a]), lambda: CompiledGraph(a * a, [a * 2.0]),
+                lambda: compiled.forward([1.0])):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    try:
+        trace(lambda x: 1.0)(2.0)
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    print("✓ Compiled graph tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_value_gradients()
+    test_deep_graph()
+    test_graph_reuse()
+    test_tensor_gradients()
+    test_compiled_graph()
+    print("ALL AUTOGRAD TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,80 @@
+"""Tests for the benchmark harness."""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench import CASES, compare, load_report, run_case, run_suite, save_report
+from src.bench.cli import BASELINE, main
+
+
+def test_run_case():
+    """Test that every case runs and reports its metrics."""
+    print("Testing Benchmark Cases")
+    print("=" * 40)
+
+    names = [case.name for case in CASES]
+    assert len(names) == len(set(names))
+    for case in CASES:
+        result = run_case(case, 4, repeat=1, min_time=0.0)
+        assert result["case"] == case.name and result["size"] == 4
+        assert result["seconds"] > 0 and result["ops_per_sec"] > 0
+        assert result["ns_per_element"] > 0
+        assert result["peak_bytes"] >= 0
+    print(f"✓ {len(CASES)} cases ran")
+
+    report = run_suite(CASES[:1], [2, 3], repeat=1, min_time=0.0, measure_memory=False)
+    assert [r["size"] for r in report["results"]] == [2, 3]
+    assert report["results"][0]["peak_bytes"] is None
+    print("✓ Benchmark case tests passed")
+    print()
+
+
+def test_compare_and_cli():
+    """Test baseline comparison, JSON round trip and the command line."""
+    print("Testing Baseline Comparison")
+    print("=" * 40)
+
+    baseline = {"results": [{"case": "a", "size": 1, "seconds": 1.0},
+                            {"case": "b", "size": 1, "seconds": 1.0}]}
+    current = {"results": [{"case": "a", "size": 1, "seconds": 1.05},
+                           {"case": "b", "size": 1, "seconds": 1.5},
+                           {"case": "c", "size": 1, "seconds": 9.0}]}
+    comparisons = compare(current, baseline, threshold=0.10)
+    assert [(c["case"], c["regression"]) for c in comparisons] == [("a", False), ("b", True)]
+    assert abs(comparisons[1]["ratio"] - 1.5) < 1e-12
+    assert not any(c["regression"] for c in compare(current, baseline, threshold=0.60))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.json")
+        args = ["--cases", "loss.mse", "--sizes", "4", "--repeat", "1", "--min-time", "0"]
+        assert main(args + ["--output", path, "--no-baseline"]) == 0
+        report = load_report(path)
+        assert [r["case"] for r in report["results"]] == ["loss.mse"]
+
+        # A baseline 1000x faster than reality must be flagged
+        for r in report["results"]:
+            r["seconds"] /= 1000
+        save_report(report, path)
+        assert main(args + ["--baseline", path]) == 1
+        with open(path) as fh:
+            assert json.load(fh)["results"][0]["case"] == "loss.mse"
+
+    # The bundled baseline covers every case and is compared against by default
+    bundled = {r["case"] for r in load_report(BASELINE)["results"]}
+    assert bundled == {case.name for case in CASES}
+    print("✓ Baseline comparison tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_run_case()
+    test_compare_and_cli()
+    print("ALL BENCH TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,123 @@
+"""Tests for data module."""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data import DataLoader, Dataset, MatrixDataset
+from src.math.matrix import Matrix
+
+
+def make_dataset(n=10):
+    X = Matrix.from_rows([[i, i * 10.0] for i in range(n)])
+    Y = Matrix.from_rows([[float(i)] for i in range(n)])
+    return MatrixDataset(X, Y)
+
+
+def test_batches():
+    """Test batch contents, ordering and sizes."""
+    print("Testing DataLoader Batches")
+    print("=" * 40)
+
+    for prefetch in (0, 2):
+        loader = DataLoader(make_dataset(), batch_size=4, prefetch=prefetch)
+        batches = list(loader)
+        assert len(loader) == len(batches) == 3
+        assert [x.rows for x, _ in batches] == [4, 4, 2]
+        assert batches[0][0].to_rows() == [[0, 0], [1, 10], [2, 20], [3, 30]]
+        assert batches[2][1].to_rows() == [[8], [9]]
+
+    loader = DataLoader(make_dataset(), batch_size=4, drop_last=True)
+    assert len(loader) == 2 and [x.rows for x, _ in loader] == [4, 4]
+
+    # A single matrix yields bare matrices; views are handled
+    X = Matrix.from_rows([[i, -i] for i in range(6)])
+    batches = list(DataLoader(MatrixDataset(X.T.T[:, 1:]), batch_size=6))
+    assert batches[0].to_rows() == [[-i] for i in range(6)]
+
+    # float32 storage is gathered with its own item size and keeps its dtype
+    X = Matrix.from_rows([[i, i + 0.5] for i in range(6)], dtype="float32")
+    for shuffle in (False, True):
+        rows = []
+        for x in DataLoader(MatrixDataset(X[1:]), batch_size=2, shuffle=shuffle, seed=0):
+            assert x.dtype == "float32"
+            rows += x.to_rows()
+        assert sorted(rows) == [[i, i + 0.5] for i in range(1, 6)]
+
+    for bad in (lambda: DataLoader(make_dataset(), 0), lambda: DataLoader(make_dataset(), 2, prefetch=-1),
+                lambda: MatrixDataset(), lambda: MatrixDataset(Matrix(2, 1), Matrix(3, 1))):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    print("✓ Batch tests passed")
+    print()
+
+
+def test_shuffle():
+    """Test shuffled epochs are complete, varied and reproducible."""
+    print("Testing Shuffled Sampling")
+    print("=" * 40)
+
+    def epoch(loader):
+        return [int(v[0]) for _, y in loader for v in y.to_rows()]
+
+    loader = DataLoader(make_dataset(50), batch_size=8, shuffle=True, seed=3)
+    first, second = epoch(loader), epoch(loader)
+    assert sorted(first) == sorted(second) == list(range(50))
+    assert first != second and first != list(range(50))
+
+    again = DataLoader(make_dataset(50), batch_size=8, shuffle=True, seed=3, prefetch=0)
+    assert epoch(again) == first and epoch(again) == second
+
+    # Features and targets stay paired
+    for x, y in DataLoader(make_dataset(50), batch_size=8, shuffle=True, seed=1):
+        assert [r[1] for r in x.to_rows()] == [r[0] * 10 for r in y.to_rows()]
+    print("✓ Shuffle tests passed")
+    print()
+
+
+def test_prefetch_thread():
+    """Test errors propagate and early exit stops the prefetch thread."""
+    print("Testing Prefetch Thread")
+    print("=" * 40)
+
+    class Failing(Dataset):
+        def __len__(self):
+            return 10
+
+        def gather(self, indices):
+            if 5 in indices:
+                raise RuntimeError("bad row")
+            return Matrix(len(indices), 1)
+
+    seen = 0
+    try:
+        for _ in DataLoader(Failing(), batch_size=2, prefetch=1):
+            seen += 1
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError:
+        pass
+    assert seen == 2
+
+    before = threading.active_count()
+    batches = iter(DataLoader(make_dataset(100), batch_size=1, prefetch=2))
+    next(batches)
+    batches.close()
+    assert threading.active_count() == before
+    print("✓ Prefetch tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_batches()
+    test_shuffle()
+    test_prefetch_thread()
+    print("ALL DATA TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,149 @@
+"""Tests for loss module."""
+
+import sys
+import os
+import math
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.math.matrix import Matrix
+from src.math.sparse import SparseMatrix
+from src.loss.loss import Loss, StreamingLoss
+
+
+def test_elementwise_losses():
+    """Test MSE, MAE and binary cross-entropy against hand computations."""
+    print("Testing Element-wise Losses")
+    print("=" * 40)
+
+    predictions = Matrix.from_rows([[1.0, 2.0], [3.0, 4.0]])
+    actual = Matrix.from_rows([[1.0, 0.0], [5.0, 3.0]])
+
+    # (0 + 4 + 4 + 1) / 4
+    assert Loss.mse_loss(predictions, actual) == 9 / 4
+    # (0 + 2 + 2 + 1) / 4
+    assert Loss.mae_loss(predictions, actual) == 5 / 4
+
+    probs = Matrix.from_rows([[0.9, 0.2], [0.5, 1.0]])
+    labels = Matrix.from_rows([[1.0, 0.0], [1.0, 1.0]])
+    expected = -(math.log(0.9) + math.log(0.8) + math.log(0.5) + math.log(1 - 1e-12)) / 4
+    assert abs(Loss.binary_cross_entropy(probs, labels) - expected) < 1e-12
+
+    # Probabilities of exactly 0 are clipped instead of raising
+    zero = Matrix.from_rows([[0.0]])
+    assert math.isfinite(Loss.binary_cross_entropy(zero, Matrix.from_rows([[1.0]])))
+
+    # Views are accepted
+    assert Loss.mse_loss(predictions.T, actual.T) == 9 / 4
+
+    for fn in (Loss.mse_loss, Loss.mae_loss, Loss.binary_cross_entropy):
+        try:
+            fn(Matrix(2, 2), Matrix(2, 3))
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    print("✓ Element-wise loss tests passed")
+    print()
+
+
+def test_cross_entropy_losses():
+    """Test categorical cross-entropy and the fused logits version."""
+    print("Testing Cross-entropy Losses")
+    print("=" * 40)
+
+    logits = Matrix.from_rows([[2.0, 1.0, 0.1], [0.5, 2.5, -1.0], [1000.0, 0.0, 0.0]])
+    targets = Matrix.from_rows([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    # Reference: explicit softmax then -log p of the target class
+    expected = 0.0
+    for row, cls in zip(logits.to_rows(), (0, 1, 2)):
+        top = max(row)
+        lse = top + math.log(sum(math.exp(v - top) for v in row))
+        expected += lse - row[cls]
+    expected /= 3
+
+    fused = Loss.cross_entropy_with_logits(logits, targets)
+    assert abs(fused - expected) < 1e-9
+    assert math.isfinite(fused)
+
+    probs = Matrix.from_rows([[0.7, 0.2, 0.1], [0.1, 0.8, 0.1]])
+    onehot = Matrix.from_rows([[1, 0, 0], [0, 1, 0]])
+    expected_cce = -(math.log(0.7) + math.log(0.8)) / 2
+    assert abs(Loss.categorical_cross_entropy(probs, onehot) - expected_cce) < 1e-12
+    print("✓ Cross-entropy tests passed")
+    print()
+
+
+def test_streaming_loss():
+    """Test that streaming over batches matches the loss on the full data."""
+    print("Testing Streaming Loss")
+    print("=" * 40)
+
+    import random
+    rng = random.Random(3)
+    rows = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(50)]
+    targets = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(50)]
+    full_p = Matrix.from_rows(rows)
+    full_a = Matrix.from_rows(targets)
+
+    def batches():
+        for start in range(0, 50, 7):
+            yield full_p[start:start + 7], full_a[start:start + 7]
+
+    for kind in ("mse", "mae", "cross_entropy_with_logits"):
+        full = getattr(Loss, {"mse": "mse_loss", "mae": "mae_loss"}.get(kind, kind))(full_p, full_a)
+        streamed = Loss.streaming(kind, batches())
+        assert abs(full - streamed) < 1e-12, kind
+
+    # Compensated accumulation: many tiny batches after a huge one
+    acc = StreamingLoss("mae")
+    acc.update(Matrix.from_rows([[1e16]]), Matrix.from_rows([[0.0]]))
+    for _ in range(1000):
+        acc.update(Matrix.from_rows([[1.0]]), Matrix.from_rows([[0.0]]))
+    assert acc.result() == (1e16 + 1000) / 1001
+
+    for bad in (lambda: StreamingLoss("hinge"), lambda: Loss.streaming("mse", [])):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    print("✓ Streaming loss tests passed")
+    print()
+
+
+def test_sparse_targets():
+    """Test that sparse targets give the same losses as dense ones."""
+    print("Testing Sparse Targets")
+    print("=" * 40)
+
+    logits = Matrix.from_rows([[2.0, -1.0, 0.5], [0.0, 3.0, 1.0], [1.0, 1.0, 1.0]])
+    labels = Matrix.from_rows([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 0.0, 0.0]])
+    sparse = SparseMatrix.from_dense(labels)
+    probs = Matrix.from_rows([[0.7, 0.2, 0.1], [0.1, 0.6, 0.3], [0.3, 0.3, 0.4]])
+
+    for loss in (Loss.mse_loss, Loss.mae_loss, Loss.binary_cross_entropy, Loss.categorical_cross_entropy):
+        assert abs(loss(probs, sparse) - loss(probs, labels)) < 1e-12
+    assert abs(Loss.cross_entropy_with_logits(logits, sparse)
+               - Loss.cross_entropy_with_logits(logits, labels)) < 1e-12
+    assert abs(Loss.streaming("cross_entropy_with_logits", [(logits, sparse)])
+               - Loss.cross_entropy_with_logits(logits, labels)) < 1e-12
+    try:
+        Loss.categorical_cross_entropy(probs, SparseMatrix.from_dense(Matrix(3, 2)))
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    print("✓ Sparse target tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_elementwise_losses()
+    test_cross_entropy_losses()
+    test_streaming_loss()
+    test_sparse_targets()
+    print("ALL LOSS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -1,12 +1,18 @@
 """Tests for math module - extracted from original implementation with assertions."""
 
+import math
 import sys
 import os
+import operator
+import tempfile
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.math.matrix import Matrix
 from src.math.vector import Vector
+from src.math.vector_batch import VectorBatch
 from src.math.activation_functions import ActivationFunctions
+from src.math.sparse import SparseMatrix
+from src.math.lazy import lazy
 
 
 def test_matrix_operations():
@@ -324,6 +330,1005 @@ def test_matrix_scalar_multiply():
     print()
 
 
+def test_matrix_constructors():
+    """Test flat-storage constructors and buffer sharing."""
+    print("Testing Matrix Constructors")
+    print("=" * 40)
+
+    from array import array
+
+    # zeros / full
+    z = Matrix.zeros(2, 3)
+    assert z.get_rows() == 2 and z.get_cols() == 3
+    assert z.to_rows() == [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+    f = Matrix.full(2, 2, 7.5)
+    assert f.to_rows() == [[7.5, 7.5], [7.5, 7.5]]
+
+    # from_rows copies values in row-major order
+    m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    assert m.get_val_at(0, 2) == 3
+    assert m.get_val_at(1, 0) == 4
+    assert list(m.data) == [1, 2, 3, 4, 5, 6]
+    try:
+        Matrix.from_rows([[1, 2], [3]])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    # from_buffer shares an array('d') instead of copying it
+    buf = array('d', [1, 2, 3, 4])
+    shared = Matrix.from_buffer(buf, 2, 2)
+    shared.set_val_at(1, 1, 40)
+    assert buf[3] == 40
+
+    # memoryview-backed matrices support the regular operations
+    view_backed = Matrix.from_buffer(memoryview(buf), 2, 2)
+    transposed = Matrix.transpose(view_backed)
+    assert transposed.to_rows() == [[1, 3], [2, 40]]
+
+    # Other iterables are copied
+    copied = Matrix.from_buffer([1, 2, 3, 4, 5, 6], 3, 2)
+    assert copied.get_val_at(2, 1) == 6
+    try:
+        Matrix.from_buffer([1, 2, 3], 2, 2)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Constructor tests passed")
+    print()
+
+
+def test_matmul_kernels():
+    """Test that every multiply kernel agrees with the naive triple loop."""
+    print("Testing Matmul Kernels")
+    print("=" * 40)
+
+    import random
+    from src.math import kernels
+
+    rng = random.Random(1)
+    # tiny, skinny, blocked (crossing block edges) and degenerate shapes; a
+    # small Strassen cutoff makes the odd shapes recurse through padding
+    shapes = [(2, 3, 2), (300, 20, 3), (70, 65, 130), (33, 17, 21), (1, 80, 80), (5, 0, 4)]
+    cutoff = kernels.STRASSEN_CUTOFF
+    kernels.STRASSEN_CUTOFF = 4
+    try:
+        for n, k, m in shapes:
+            a = Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(n * k)], n, k)
+            b = Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(k * m)], k, m)
+            expected = Matrix.multiply(a, b, kernel="naive")
+            for name in ("tiny", "skinny", "blocked", "strassen", "auto"):
+                result = Matrix.multiply(a, b, kernel=name)
+                assert result.get_rows() == n and result.get_cols() == m
+                for x, y in zip(result.data, expected.data):
+                    assert abs(x - y) < 1e-9, f"kernel {name} differs on {n}x{k}x{m}"
+            print(f"{n}x{k} @ {k}x{m}: dispatched to {kernels.select_kernel(n, k, m)}")
+    finally:
+        kernels.STRASSEN_CUTOFF = cutoff
+
+    assert kernels.select_kernel(2, 2, 2) == "tiny"
+    assert kernels.select_kernel(1000, 50, 1) == "skinny"
+    assert kernels.select_kernel(128, 128, 128) == "blocked"
+    assert kernels.select_kernel(512, 512, 512) == "strassen"
+    assert kernels.select_kernel(512, 64, 512) == "blocked"
+
+    try:
+        Matrix.multiply(Matrix(2, 2), Matrix(2, 2), kernel="fastest")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Kernel tests passed")
+    print()
+
+
+def test_parallel_matmul():
+    """Test that the process-pool multiply matches the serial kernel."""
+    print("Testing Parallel Matmul")
+    print("=" * 40)
+
+    import random
+    from src.math import parallel
+
+    rng = random.Random(2)
+    a = Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(37 * 20)], 37, 20)
+    b = Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(20 * 11)], 20, 11)
+    expected = Matrix.multiply(a, b, workers=1)
+
+    saved_threshold = parallel.PARALLEL_THRESHOLD
+    parallel.PARALLEL_THRESHOLD = 0
+    try:
+        result = Matrix.multiply(a, b, workers=3)
+        assert list(result.data) == list(expected.data)
+
+        # The global default is used when workers isn't passed
+        parallel.set_num_workers(2)
+        assert parallel.get_num_workers() == 2
+        result = Matrix.multiply(a, b)
+        assert list(result.data) == list(expected.data)
+    finally:
+        parallel.set_num_workers(1)
+        parallel.PARALLEL_THRESHOLD = saved_threshold
+        parallel.shutdown()
+
+    # Row partitioning covers every row exactly once
+    blocks = parallel.row_blocks(10, 3)
+    assert [len(r) for r in blocks] == [4, 3, 3]
+    assert parallel.row_blocks(2, 8) == [range(0, 1), range(1, 2)]
+
+    try:
+        parallel.set_num_workers(0)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Parallel matmul tests passed")
+    print()
+
+
+def test_matrix_inplace_and_out():
+    """Test in-place operators and out= destinations."""
+    print("Testing In-place and out= Operations")
+    print("=" * 40)
+
+    from src.math import matrix as matrix_module
+
+    m1 = Matrix.from_rows([[1, 2], [3, 4]])
+    m2 = Matrix.from_rows([[10, 20], [30, 40]])
+    storage = m1.data
+
+    m1 += m2
+    assert m1.to_rows() == [[11, 22], [33, 44]]
+    m1 -= m2
+    assert m1.to_rows() == [[1, 2], [3, 4]]
+    m1 *= 2
+    assert m1.to_rows() == [[2, 4], [6, 8]]
+    assert m1.add_(m2, alpha=0.5) is m1
+    assert m1.to_rows() == [[7, 14], [21, 28]]
+    assert m1.scale_(0.5) is m1
+    assert m1.to_rows() == [[3.5, 7], [10.5, 14]]
+    assert m1.data is storage  # never reallocated
+
+    try:
+        m1 += Matrix(3, 2)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    # out= writes into the given buffer, including aliasing an input
+    out = Matrix(2, 2)
+    assert Matrix.add(m2, m2, out=out) is out
+    assert out.to_rows() == [[20, 40], [60, 80]]
+    Matrix.add(out, m2, subtract=True, out=out)
+    assert out.to_rows() == [[10, 20], [30, 40]]
+    Matrix.scalar_multiply(m2, -1, out=out)
+    assert out.to_rows() == [[-10, -20], [-30, -40]]
+    Matrix.multiply(Matrix.from_rows([[1, 0], [0, 3]]), m2, out=out)
+    assert out.to_rows() == [[10, 20], [90, 120]]
+
+    rect = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    out_t = Matrix(3, 2)
+    Matrix.transpose(rect, out=out_t)
+    assert out_t.to_rows() == [[1, 4], [2, 5], [3, 6]]
+
+    for bad in (lambda: Matrix.add(m2, m2, out=Matrix(3, 3)),
+                lambda: Matrix.transpose(rect, out=Matrix(2, 3)),
+                lambda: Matrix.multiply(m2, m2, out=m2)):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    # Chunked updates cover matrices larger than one chunk
+    size = matrix_module.CHUNK + 10
+    big = Matrix.full(1, size, 1.0)
+    big.add_(Matrix.full(1, size, 2.0), alpha=3.0)
+    assert all(v == 7.0 for v in big.data)
+
+    print("✓ In-place tests passed")
+    print()
+
+
+def test_matrix_views():
+    """Test that transpose, slicing, row and col share storage."""
+    print("Testing Matrix Views")
+    print("=" * 40)
+
+    m = Matrix.from_rows([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]])
+
+    # transpose is a view: no copy, writes show up in the original
+    t = Matrix.transpose(m)
+    assert t.data is m.data
+    assert t.get_rows() == 3 and t.get_cols() == 4
+    assert t.to_rows() == [[1, 4, 7, 10], [2, 5, 8, 11], [3, 6, 9, 12]]
+    t.set_val_at(0, 1, 40)
+    assert m.get_val_at(1, 0) == 40
+    assert not t.is_contiguous()
+    assert Matrix.transpose(t).to_rows() == m.to_rows()
+
+    # block, row and column views
+    block = m[1:3, 0:2]
+    assert block.data is m.data
+    assert block.to_rows() == [[40, 5], [7, 8]]
+    assert m.row(2).to_rows() == [[7, 8, 9]]
+    assert m.col(1).to_rows() == [[2], [5], [8], [11]]
+    assert m[::2, ::2].to_rows() == [[1, 3], [7, 9]]
+    assert m[-1, -1] == 12
+    assert m[2].to_rows() == [[7, 8, 9]]
+
+    # a run of whole rows stays contiguous
+    batch = m[1:3]
+    assert batch.is_contiguous()
+
+    # writes through views and slice assignment
+    block.scale_(10)
+    assert m.to_rows()[1:3] == [[400, 50, 6], [70, 80, 9]]
+    m[0, :] = 0
+    assert m.row(0).to_rows() == [[0, 0, 0]]
+    m[0:2, 2] = Matrix.from_rows([[-1], [-2]])
+    assert m.col(2).to_rows() == [[-1], [-2], [9], [12]]
+    m[3, 0] = 99
+    assert m.get_val_at(3, 0) == 99
+
+    # copy() detaches storage and is contiguous
+    c = t.copy()
+    assert c.data is not m.data and c.is_contiguous()
+    c.set_val_at(0, 0, 123)
+    assert m.get_val_at(0, 0) == 0
+
+    # operations accept views
+    mt = Matrix.transpose(m)
+    assert Matrix.multiply(m.row(2), mt.col(2)).to_rows() == [[70 * 70 + 80 * 80 + 9 * 9]]
+    sym = Matrix.add(m[0:3, :], Matrix.transpose(m[0:3, :].copy()).T)
+    assert sym.to_rows() == Matrix.scalar_multiply(m[0:3, :], 2).to_rows()
+
+    # in-place update of a matrix by its own transpose reads the original values
+    sq = Matrix.from_rows([[1, 2], [3, 4]])
+    sq.add_(sq.T)
+    assert sq.to_rows() == [[2, 5], [5, 8]]
+
+    # transpose into out copies
+    out = Matrix(3, 4)
+    Matrix.transpose(m, out=out)
+    assert out.data is not m.data
+    assert out.to_rows() == Matrix.transpose(m).to_rows()
+
+    for bad in (lambda: m[4, 0], lambda: m[0, 3]):
+        try:
+            bad()
+            assert False, "Should have raised IndexError"
+        except IndexError:
+            pass
+    try:
+        m[::-1, :]
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    print("✓ View tests passed")
+    print()
+
+
+def test_batched_activation_functions():
+    """Test activation functions applied to whole matrices and vectors."""
+    print("Testing Batched Activation Functions")
+    print("=" * 40)
+
+    import math
+
+    m = Matrix.from_rows([[-2.0, 0.0, 3.0], [1000.0, -1000.0, 0.5]])
+
+    relu = ActivationFunctions.relu(m)
+    assert relu.to_rows() == [[0.0, 0.0, 3.0], [1000.0, 0.0, 0.5]]
+    assert m.get_val_at(0, 0) == -2.0  # input untouched
+
+    # Matches the scalar versions, and large negative inputs don't overflow
+    sig = ActivationFunctions.sigmoid(m)
+    tanh = ActivationFunctions.tanh(m)
+    for i in range(2):
+        for j in range(3):
+            x = m.get_val_at(i, j)
+            assert abs(sig.get_val_at(i, j) - ActivationFunctions.sigmoid(x)) < 1e-15
+            assert abs(tanh.get_val_at(i, j) - math.tanh(x)) < 1e-15
+    assert sig.get_val_at(1, 1) == 0.0 or sig.get_val_at(1, 1) < 1e-300
+    assert ActivationFunctions.sigmoid(-1000.0) < 1e-300
+
+    # In place on a view only touches the view
+    ActivationFunctions.relu(m.row(0), inplace=True)
+    assert m.to_rows() == [[0.0, 0.0, 3.0], [1000.0, -1000.0, 0.5]]
+
+    # Vectors
+    v = Vector(3)
+    v.set(0, -1)
+    v.set(2, 2)
+    rv = ActivationFunctions.relu(v)
+    assert [rv.get(i) for i in range(3)] == [0.0, 0.0, 2.0]
+    assert ActivationFunctions.tanh(v, inplace=True) is v
+    assert abs(v.get(2) - math.tanh(2)) < 1e-15
+
+    # Softmax rows sum to 1, are stable for large inputs, and log_softmax agrees
+    logits = Matrix.from_rows([[1.0, 2.0, 3.0], [1000.0, 1000.0, 1000.0]])
+    probs = ActivationFunctions.softmax(logits)
+    log_probs = ActivationFunctions.log_softmax(logits)
+    for i in range(2):
+        row = probs.to_rows()[i]
+        assert abs(sum(row) - 1.0) < 1e-12
+        for j in range(3):
+            assert abs(math.log(probs.get_val_at(i, j)) - log_probs.get_val_at(i, j)) < 1e-12
+    assert abs(probs.get_val_at(1, 0) - 1 / 3) < 1e-12
+    expected = [math.exp(k) / (math.exp(1) + math.exp(2) + math.exp(3)) for k in (1, 2, 3)]
+    for j in range(3):
+        assert abs(probs.get_val_at(0, j) - expected[j]) < 1e-12
+
+    sv = ActivationFunctions.softmax(rv)
+    assert abs(sum(sv.get(i) for i in range(3)) - 1.0) < 1e-12
+
+    print("✓ Batched activation tests passed")
+    print()
+
+
+def test_binary_format():
+    """Test saving, memory-mapped loading, appending and row-range reads."""
+    print("Testing Binary Format")
+    print("=" * 40)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "m.bin")
+        m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+        m.save(path)
+        assert os.path.getsize(path) == 24 + 6 * 8
+
+        mapped = Matrix.load(path)
+        assert isinstance(mapped.data, memoryview)
+        assert mapped.to_rows() == m.to_rows()
+        assert Matrix.load(path, mmap=False).to_rows() == m.to_rows()
+
+        # Copy-on-write: writes change the matrix, not the file
+        mapped.set_val_at(0, 0, 99.0)
+        assert Matrix.load(path).get_val_at(0, 0) == 1.0
+        assert Matrix.multiply(mapped, Matrix.load(path).T).get_val_at(0, 0) == 99 + 4 + 9
+
+        # Views are written in row-major order
+        m.T.save(path)
+        assert Matrix.load(path).to_rows() == [[1, 4], [2, 5], [3, 6]]
+
+        assert Matrix.append_rows(path, Matrix.from_rows([[7, 8], [9, 10]])) == 5
+        assert Matrix.append_rows(path, Matrix.from_rows([[11, 12]])) == 6
+        assert Matrix.read_rows(path, 2, 5).to_rows() == [[3, 6], [7, 8], [9, 10]]
+        assert Matrix.read_rows(path, 6, 6).rows == 0
+        assert Matrix.load(path).get_rows() == 6
+
+        new_path = os.path.join(tmp, "new.bin")
+        assert Matrix.append_rows(new_path, Matrix.from_rows([[1.5]])) == 1
+        assert Matrix.load(new_path, mmap=False).to_rows() == [[1.5]]
+        Matrix(0, 4).save(new_path)
+        assert Matrix.load(new_path).get_cols() == 4
+
+        bad_path = os.path.join(tmp, "bad.bin")
+        with open(bad_path, "wb") as fh:
+            fh.write(b"not a matrix file at all")
+        truncated_path = os.path.join(tmp, "truncated.bin")
+        with open(path, "rb") as src, open(truncated_path, "wb") as dst:
+            dst.write(src.read(24 + 8))
+        errors = [
+            (ValueError, lambda: Matrix.append_rows(path, Matrix(1, 3))),
+            (IndexError, lambda: Matrix.read_rows(path, 4, 7)),
+            (IndexError, lambda: Matrix.read_rows(path, 3, 2)),
+            (ValueError, lambda: Matrix.load(bad_path)),
+            (ValueError, lambda: Matrix.load(truncated_path)),
+        ]
+        for error, bad in errors:
+            try:
+                bad()
+                assert False, f"Should have raised {error.__name__}"
+            except error:
+                pass
+
+    print("✓ Binary format tests passed")
+    print()
+
+
+def test_csv_ingestion():
+    """Test from_csv and iter_csv_batches, including worker processes."""
+    print("Testing CSV Ingestion")
+    print("=" * 40)
+    from src.math import csv_format, parallel
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        with open(path, "w", newline="") as fh:
+            fh.write("x,y,label\n")
+            for i in range(50):
+                fh.write(f"{i},{i * 0.5},{i % 3}\r\n" if i % 7 else f"{i},{i * 0.5},{i % 3}\n\n")
+        expected = [[float(i), i * 0.5, float(i % 3)] for i in range(50)]
+
+        m = Matrix.from_csv(path, header=True)
+        assert (m.get_rows(), m.get_cols()) == (50, 3)
+        assert m.to_rows() == expected
+        assert Matrix.from_csv(path, header=True, columns=["label", 0]).to_rows() == \
+            [[row[2], row[0]] for row in expected]
+        assert Matrix.from_csv(path, header=True, columns=[-1]).to_rows() == [[row[2]] for row in expected]
+
+        # Small parse blocks exercise the block boundaries; workers keep order
+        original = csv_format.CHUNK_BYTES
+        csv_format.CHUNK_BYTES = 64
+        try:
+            batches = list(Matrix.iter_csv_batches(path, 16, header=True))
+            assert [b.get_rows() for b in batches] == [16, 16, 16, 2]
+            assert [row for b in batches for row in b.to_rows()] == expected
+            assert Matrix.from_csv(path, header=True, workers=2).to_rows() == expected
+        finally:
+            csv_format.CHUNK_BYTES = original
+            parallel.shutdown()
+
+        with open(path, "w") as fh:
+            fh.write('1;"2.5"\n3;4\n')
+        assert Matrix.from_csv(path, delimiter=";").to_rows() == [[1, 2.5], [3, 4]]
+
+        # A header with no data rows still gives the header's width
+        with open(path, "w") as fh:
+            fh.write("a,b,label\n")
+        empty = Matrix.from_csv(path, header=True)
+        assert (empty.get_rows(), empty.get_cols()) == (0, 3)
+        assert Matrix.from_csv(path, header=True, columns=["label"]).get_cols() == 1
+        assert list(Matrix.iter_csv_batches(path, 4, header=True)) == []
+
+        with open(path, "w") as fh:
+            fh.write("1,2\n3,4\n5\n")
+        errors = [(ValueError, lambda: Matrix.from_csv(path)),
+                  (ValueError, lambda: Matrix.from_csv(path, columns=["a"])),
+                  (IndexError, lambda: Matrix.from_csv(path, columns=[2])),
+                  (ValueError, lambda: next(Matrix.iter_csv_batches(path, 0)))]
+        for error, bad in errors:
+            try:
+                bad()
+                assert False, f"Should have raised {error.__name__}"
+            except error as e:
+                if bad is errors[0][1]:
+                    assert "Line 3" in str(e), e
+
+        with open(path, "w") as fh:
+            fh.write("1,2\n3,oops\n")
+        try:
+            Matrix.from_csv(path)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Line 2" in str(e) and "oops" in str(e)
+
+        open(path, "w").close()
+        assert Matrix.from_csv(path).get_rows() == 0
+
+    print("✓ CSV ingestion tests passed")
+    print()
+
+
+def test_sparse_matrix():
+    """Test SparseMatrix construction, conversions and products against dense results."""
+    print("Testing Sparse Matrix")
+    print("=" * 40)
+
+    dense = Matrix.from_rows([[0, 2, 0, 0], [0, 0, 0, 0], [1, 0, 0, 3]])
+    s = SparseMatrix.from_coo(3, 4, [2, 0, 2, 2], [3, 1, 0, 3], [1.0, 2.0, 1.0, 2.0])
+    assert s.nnz == 3 and list(s.indptr) == [0, 1, 1, 3] and list(s.indices) == [1, 0, 3]
+    assert s.to_dense().to_rows() == dense.to_rows()
+    assert SparseMatrix.from_dense(dense).to_dense().to_rows() == dense.to_rows()
+    assert SparseMatrix.from_dense(dense, tol=1.5).nnz == 2
+    assert SparseMatrix.from_dense(dense, tol=1).nnz == 2
+    assert SparseMatrix.from_dense(dense, tol=2).to_dense().to_rows() == [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 3]]
+    assert SparseMatrix.from_dense(dense.T).to_dense().to_rows() == dense.T.to_rows()
+    assert s.get_val_at(2, 3) == 3.0 and s.get_val_at(1, 2) == 0.0
+    assert abs(s.density() - 0.25) < 1e-12
+    assert list(s.items()) == [(0, 1, 2.0), (2, 0, 1.0), (2, 3, 3.0)]
+
+    # Transpose / CSC
+    assert s.T.to_dense().to_rows() == dense.T.to_rows()
+    assert s.T.T is s
+    indptr, rows, values = s.csc()
+    assert list(indptr) == [0, 1, 2, 2, 3] and list(rows) == [2, 0, 2]
+
+    b = Matrix.from_rows([[1, 2], [3, 4], [5, 6], [7, 8]])
+    assert SparseMatrix.multiply(s, b).to_rows() == Matrix.multiply(dense, b).to_rows()
+    c = Matrix.from_rows([[1, -1], [2, 0], [0.5, 4]])
+    assert SparseMatrix.transpose_multiply(s, c).to_rows() == Matrix.multiply(dense.T, c).to_rows()
+    out = Matrix.full(3, 2, 9.0)
+    assert SparseMatrix.multiply(s, b, out=out) is out
+    assert out.to_rows() == Matrix.multiply(dense, b).to_rows()
+    narrow = Matrix(3, 2, "float32")
+    assert SparseMatrix.multiply(s, b.astype("float32"), out=narrow) is narrow
+    assert narrow.dtype == "float32" and narrow.to_rows() == out.to_rows()
+
+    # Element-wise
+    other = SparseMatrix.from_dense(Matrix.from_rows([[0, 1, 0, 0], [5, 0, 0, 0], [0, 0, 0, -3]]))
+    total = SparseMatrix.add(s, other)
+    assert isinstance(total, SparseMatrix)
+    assert total.to_dense().to_rows() == [[0, 3, 0, 0], [5, 0, 0, 0], [1, 0, 0, 0]]
+    assert SparseMatrix.add(s, other, subtract=True).to_dense().to_rows() == \
+        [[0, 1, 0, 0], [-5, 0, 0, 0], [1, 0, 0, 6]]
+    view = Matrix.from_rows([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]).T
+    assert SparseMatrix.add(s, view).to_rows() == Matrix.add(dense, view).to_rows()
+    assert SparseMatrix.add(s, view, subtract=True).to_rows() == \
+        Matrix.add(dense, view, subtract=True).to_rows()
+    assert SparseMatrix.hadamard(s, other).to_dense().to_rows() == \
+        [[0, 2, 0, 0], [0, 0, 0, 0], [0, 0, 0, -9]]
+    assert SparseMatrix.hadamard(s, Matrix.full(3, 4, 2.0)).to_dense().to_rows() == \
+        Matrix.scalar_multiply(dense, 2.0).to_rows()
+    assert SparseMatrix.scalar_multiply(s, -1.0).to_dense().to_rows() == \
+        Matrix.scalar_multiply(dense, -1.0).to_rows()
+    assert SparseMatrix.apply(s, lambda vs: [v * v for v in vs]).get_val_at(2, 3) == 9.0
+    assert s.get_val_at(2, 3) == 3.0
+
+    errors = [(ValueError, lambda: SparseMatrix.multiply(s, Matrix(3, 2))),
+              (ValueError, lambda: SparseMatrix.add(s, Matrix(4, 3))),
+              (ValueError, lambda: SparseMatrix.from_coo(2, 2, [0], [0, 1], [1.0])),
+              (IndexError, lambda: SparseMatrix.from_coo(2, 2, [2], [0], [1.0])),
+              (ValueError, lambda: SparseMatrix(2, 2, [0, 2, 1], [0], [1.0])),
+              (IndexError, lambda: s.get_val_at(3, 0))]
+    for error, bad in errors:
+        try:
+            bad()
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+
+    print("✓ Sparse matrix tests passed")
+    print()
+
+
+def test_lazy_expressions():
+    """Test lazy evaluation, fusion, transpose folding and buffer reuse."""
+    print("Testing Lazy Expressions")
+    print("=" * 40)
+
+    X = Matrix.from_rows([[1, -2], [3, 4], [-5, 6]])
+    W = Matrix.from_rows([[1, 0, -1], [2, 1, 0]])
+    b = Matrix.from_rows([[0.5, -10, 1]])
+
+    expected = Matrix.multiply(X, W)
+    for i in range(3):
+        expected.row(i).add_(b)
+    expected = ActivationFunctions.relu(Matrix.scalar_multiply(expected, 2.0))
+
+    layer = ((lazy(X) @ W + b) * 2.0).relu()
+    assert layer.plan() == ["matmul", "fused[add, scale, relu]"]
+    assert layer.to_rows() == expected.to_rows()
+
+    # Leaves are read at eval time, on every eval
+    Y = X.copy()
+    pending = (lazy(Y) * 3.0).tanh()
+    Y.set_val_at(0, 0, 0.0)
+    assert pending.get_val_at(0, 0) == 0.0
+    Y.set_val_at(0, 0, 1.0)
+    assert pending.eval() is not pending.eval()
+    assert abs(pending.get_val_at(0, 0) - math.tanh(3.0)) < 1e-15
+
+    # A bias row broadcasts on either side
+    H = Matrix.multiply(X, W)
+    assert (b + lazy(X) @ W).to_rows() == (lazy(X) @ W + b).to_rows()
+    assert (b - lazy(X) @ W).to_rows() == [[bj - hj for bj, hj in zip(b.to_rows()[0], row)] for row in H.to_rows()]
+    assert (lazy(b) * 2.0 + H).plan() == ["fused[scale, add]"]
+
+    # Folding: double transposes and nested scales
+    assert (lazy(X).T.T * 2.0 * 0.5).plan() == []
+    assert (lazy(X).T.T * 2.0 * 0.5).eval() is X
+    h = lazy(X) @ W
+    assert (h.T.T - h).plan() == ["matmul", "fused[sub]"]
+    assert all(v == 0.0 for v in (h.T.T - h).eval().flat())
+    t = (h.T * 2.0).T
+    assert t.plan() == ["matmul", "transpose", "fused[scale]", "transpose"]
+    assert t.to_rows() == Matrix.scalar_multiply(Matrix.multiply(X, W), 2.0).to_rows()
+
+    # A shared intermediate is computed once and read by both consumers
+    shared = (lazy(X) @ W).tanh()
+    both = (shared + shared.sigmoid()) - shared
+    assert both.plan() == ["matmul", "fused[tanh]", "fused[sigmoid, add, sub]"]
+    ref = ActivationFunctions.sigmoid(ActivationFunctions.tanh(Matrix.multiply(X, W)))
+    assert all(abs(a - c) < 1e-12 for a, c in zip(both.eval().flat(), ref.flat()))
+
+    # Transposed intermediates stay valid while later steps reuse buffers
+    p = lazy(X) @ W
+    q = (p.T @ p + (lazy(W).T @ W)).relu()
+    r = Matrix.add(Matrix.multiply(Matrix.multiply(X, W).T, Matrix.multiply(X, W)),
+                   Matrix.multiply(W.T, W))
+    assert q.to_rows() == ActivationFunctions.relu(r).to_rows()
+
+    out = Matrix(3, 3)
+    assert layer.eval(out=out) is out and out.to_rows() == expected.to_rows()
+    view_out = Matrix(3, 3)
+    layer.T.eval(out=view_out)
+    assert view_out.to_rows() == expected.T.to_rows()
+
+    for error, bad in ((ValueError, lambda: lazy(X) @ X),
+                       (ValueError, lambda: lazy(X) + W),
+                       (ValueError, lambda: lazy(b) + lazy(W).T),
+                       (ValueError, lambda: layer.eval(out=Matrix(2, 2))),
+                       (TypeError, lambda: lazy([[1.0]]))):
+        try:
+            bad()
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+
+    print("✓ Lazy expression tests passed")
+    print()
+
+
+def test_operators_and_broadcasting():
+    """Test Matrix/Vector operators, broadcasting and comparison masks."""
+    print("Testing Operators and Broadcasting")
+    print("=" * 40)
+
+    X = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    row = Matrix.from_rows([[10, 20, 30]])
+    col = Matrix.from_rows([[1], [2]])
+
+    assert (X + X).to_rows() == Matrix.add(X, X).to_rows()
+    assert (X + row).to_rows() == [[11, 22, 33], [14, 25, 36]]
+    assert (row - X).to_rows() == [[9, 18, 27], [6, 15, 24]]
+    assert (X * col).to_rows() == [[1, 2, 3], [8, 10, 12]]
+    assert (col * row).to_rows() == [[10, 20, 30], [20, 40, 60]]
+    assert (X / 2).to_rows() == [[0.5, 1, 1.5], [2, 2.5, 3]]
+    assert (12 / X).get_val_at(1, 2) == 2.0
+    assert (1 - X).to_rows() == [[0, -1, -2], [-3, -4, -5]]
+    assert (-X).to_rows() == Matrix.scalar_multiply(X, -1).to_rows()
+    assert (X + Matrix.full(1, 1, 1)).to_rows() == (X + 1).to_rows()
+    # Views broadcast like any other operand
+    assert (X.T + col.T.T.T).to_rows() == [[2, 6], [3, 7], [4, 8]]
+    assert (X @ X.T).to_rows() == Matrix.multiply(X, X.T).to_rows()
+
+    # Comparisons give 1.0/0.0 masks; matrices stay hashable
+    assert (X > 3).to_rows() == [[0, 0, 0], [1, 1, 1]]
+    assert (X == X.copy()).to_rows() == [[1, 1, 1], [1, 1, 1]]
+    assert (X <= row / 10).to_rows() == [[1, 1, 1], [0, 0, 0]]
+    assert (2 < X).to_rows() == (X > 2).to_rows()
+    assert {X: "x"}[X] == "x"
+
+    # Vectors act as rows next to a matrix
+    v = Vector(3)
+    for i, value in enumerate((1, 0, -1)):
+        v.set(i, value)
+    assert (X + v).to_rows() == [[2, 2, 2], [5, 5, 5]]
+    assert (v - X).to_rows() == [[0, -2, -4], [-3, -5, -7]]
+    assert (X @ v).vector.tolist() == [-2, -2]
+    ones = Vector(2)
+    ones.set(0, 1)
+    ones.set(1, 1)
+    assert (ones @ X).vector.tolist() == [5, 7, 9]
+    assert (v * 2 + v).vector.tolist() == [3, 0, -3]
+    assert (1 / (v + 2)).vector.tolist() == [1 / 3, 0.5, 1]
+    assert (v >= 0).vector.tolist() == [1, 1, 0]
+    assert v @ v == 2.0
+
+    # In place, including broadcasts and operands aliasing the target
+    Y = X.copy()
+    Y += row
+    Y /= 2
+    Y *= col
+    assert Y.to_rows() == [[5.5, 11, 16.5], [14, 25, 36]]
+    Z = X.copy()
+    Z -= Z[:, 0]
+    assert Z.to_rows() == [[0, 1, 2], [0, 1, 2]]
+    S = Matrix.from_rows([[1, 2], [3, 4]])
+    S += S.T
+    assert S.to_rows() == [[2, 5], [5, 8]]
+    out = Matrix(2, 3)
+    assert Matrix.elementwise(X, row, operator.sub, out=out) is out
+    assert out.to_rows() == (X - row).to_rows()
+
+    for error, bad in ((ValueError, lambda: X + Matrix(3, 3)),
+                       (ValueError, lambda: X @ X),
+                       (ValueError, lambda: row.__iadd__(X)),
+                       (ValueError, lambda: bool(X > 0)),
+                       (ValueError, lambda: v + ones),
+                       (TypeError, lambda: X + "1"),
+                       (TypeError, lambda: Matrix.elementwise(1.0, 2.0, operator.add))):
+        try:
+            bad()
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+
+    print("✓ Operator tests passed")
+    print()
+
+
+def test_vector_batch():
+    """Test batched dots, cached norms, cosine similarity and top-k."""
+    print("Testing Vector Batch")
+    print("=" * 40)
+
+    def vec(*values):
+        v = Vector(len(values))
+        for i, value in enumerate(values):
+            v.set(i, value)
+        return v
+
+    batch = VectorBatch.from_vectors([vec(1, 0), vec(0, 2), vec(1, 1), vec(0, 0)])
+    assert len(batch) == 4 and batch.dim == 2
+    assert batch.dots(vec(2, 1)).tolist() == [2, 2, 3, 0]
+    assert batch.norms().tolist() == [1, 2, 2 ** 0.5, 0]
+    cosine = batch.cosine_similarity(vec(3, 0))
+    assert cosine.tolist() == [1, 0, 3 / (2 ** 0.5 * 3), 0]
+    assert all(s == 0.0 for s in batch.cosine_similarity(vec(0, 0)))
+
+    # Best first, ties to the lower index, k may exceed the batch
+    assert [i for i, _ in batch.top_k(vec(1, 0), 2)] == [0, 2]
+    assert batch.top_k(vec(1, 1), 10, metric="dot") == [(1, 2.0), (2, 2.0), (0, 1.0), (3, 0.0)]
+    assert batch.top_k(vec(1, 1), 0) == []
+
+    # Writes invalidate only the norms they touch
+    norms = batch.norms()
+    batch.set(3, vec(3, 4))
+    assert batch.norms() is norms and norms[3] == 5.0
+    batch.append(vec(-6, 8))
+    assert len(batch) == 5 and batch.norms()[4] == 10.0
+    assert batch.get(4).vector.tolist() == [-6, 8]
+    batch.as_matrix().set_val_at(0, 0, 2.0)
+    batch.invalidate([0])
+    assert batch.norms()[0] == 2.0
+
+    # A contiguous matrix is shared, not copied
+    m = Matrix.from_rows([[1, 2], [3, 4]])
+    shared = VectorBatch.from_matrix(m)
+    m.set_val_at(1, 1, 0.0)
+    assert shared.get(1).vector.tolist() == [3, 0]
+    assert VectorBatch.from_matrix(m.T).get(0).vector.tolist() == [1, 3]
+    # get copies even when the batch wraps a memoryview (an offset view here)
+    row = VectorBatch.from_matrix(m[1:, :]).get(0)
+    row.set(0, 7.0)
+    assert m.get_val_at(1, 0) == 3.0 and row.dtype == "float64"
+    assert Vector.apply_scalar(row, 2.0).vector.tolist() == [14, 0]
+
+    # Written vectors are converted to the dtype of the storage
+    mixed = VectorBatch.from_vectors([vec(1, 2), Vector(2, "float32")])
+    assert mixed.data.typecode == 'd' and mixed.get(0).vector.tolist() == [1, 2]
+    narrow = VectorBatch.from_matrix(Matrix.full(2, 2, 1.0, "float32"))
+    narrow.set(0, vec(0.5, 2))
+    narrow.append(vec(3, 4))
+    assert narrow.data.typecode == 'f' and narrow.get(0).dtype == "float32"
+    assert narrow.norms().tolist() == [17 ** 0.5 / 2, 2 ** 0.5, 5.0]
+
+    # Vector helpers: projection uses onto·onto directly
+    assert Vector.project(vec(0, 2), vec(3, 5)).vector.tolist() == [0, 5]
+
+    for error, bad in ((IndexError, lambda: batch.get(5)),
+                       (ValueError, lambda: batch.dots(vec(1, 2, 3))),
+                       (ValueError, lambda: batch.append(vec(1))),
+                       (ValueError, lambda: batch.top_k(vec(1, 0), -1)),
+                       (ValueError, lambda: batch.top_k(vec(1, 0), 1, metric="l1")),
+                       (ValueError, lambda: Vector.project(vec(0, 0), vec(1, 1)))):
+        try:
+            bad()
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+
+    print("✓ Vector batch tests passed")
+    print()
+
+
+def test_linalg():
+    """Test LU, Cholesky and QR solvers and factorization caching."""
+    print("Testing Linear Algebra")
+    print("=" * 40)
+
+    import random
+    from src.math import linalg
+
+    rng = random.Random(3)
+
+    def rand(n, m):
+        return Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(n * m)], n, m)
+
+    def close(a, b, tol=1e-9):
+        return all(abs(x - y) < tol for x, y in zip(a.flat(), b.flat()))
+
+    def eye(n):
+        identity = Matrix(n, n)
+        for i in range(n):
+            identity.set_val_at(i, i, 1.0)
+        return identity
+
+    # Sizes crossing the LU panel width exercise the blocked trailing update
+    for n in (1, 5, linalg.BLOCK + 7):
+        A = rand(n, n)
+        f = linalg.lu(A)
+        P = Matrix(n, n)
+        for i, p in enumerate(f.perm):
+            P.set_val_at(i, p, 1.0)
+        assert close(P @ A, f.L @ f.U)
+        assert close(A @ linalg.inverse(A), eye(n))
+        b = rand(n, 3)
+        assert close(A @ linalg.solve(A, b), b)
+
+        S = A @ A.T + eye(n) * n
+        c = linalg.cholesky(S)
+        assert close(c.L @ c.L.T, S)
+        assert close(S @ linalg.solve(S, b, method="cholesky"), b)
+        assert abs(c.det() - linalg.det(S)) < 1e-9 * abs(c.det())
+
+        q = linalg.qr(A)
+        assert close(q.Q @ q.R, A)
+        assert close(q.Q.T @ q.Q, eye(n))
+
+    assert abs(linalg.det(Matrix.from_rows([[1, 2], [3, 4]])) + 2.0) < 1e-12
+    assert linalg.det(Matrix.from_rows([[1, 2], [2, 4]])) == 0.0
+
+    # Least squares recovers exact weights; Vector right-hand sides stay Vectors
+    X = rand(40, 3)
+    w = Matrix.from_rows([[1.0], [2.0], [-3.0]])
+    assert close(linalg.lstsq(X, X @ w), w)
+    rhs = Vector(3)
+    rhs.set(0, 2.0)
+    x = linalg.solve(Matrix.from_rows([[2, 0, 0], [0, 1, 0], [0, 0, 4]]), rhs)
+    assert isinstance(x, Vector) and x.vector.tolist() == [1.0, 0.0, 0.0]
+
+    # Factorizations are reused until the matrix changes
+    A = rand(6, 6)
+    first = linalg.lu(A)
+    assert linalg.lu(A) is first
+    A.set_val_at(0, 0, 10.0)
+    second = linalg.lu(A)
+    assert second is not first
+    assert close(A @ second.solve(eye(6)), eye(6))
+    assert linalg.lu(A, cache=False) is not second
+    A.set_val_at(5, 5, A.get_val_at(5, 5) * (1 + 2 ** -52))  # last bit only
+    assert linalg.lu(A) is not second
+
+    for error, bad in ((ValueError, lambda: linalg.lu(rand(2, 3))),
+                       (ValueError, lambda: linalg.solve(Matrix.from_rows([[1, 2], [2, 4]]), rand(2, 1))),
+                       (ValueError, lambda: linalg.cholesky(Matrix.from_rows([[1, 2], [2, 1]]))),
+                       (ValueError, lambda: linalg.lstsq(rand(2, 3), rand(2, 1))),
+                       (ValueError, lambda: linalg.lstsq(Matrix.from_rows([[1, 1], [1, 1], [2, 2]]), rand(3, 1))),
+                       (ValueError, lambda: linalg.solve(A, rand(5, 1))),
+                       (ValueError, lambda: linalg.solve(A, rand(6, 1), method="svd")),
+                       (TypeError, lambda: linalg.Factorization()),
+                       (TypeError, lambda: linalg.solve(A, [1.0] * 6))):
+        try:
+            bad()
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+
+    print("✓ Linear algebra tests passed")
+    print()
+
+
+def test_float32_storage():
+    """Test that float32 matrices and vectors keep their dtype through every op."""
+    print("Testing Float32 Storage")
+    print("=" * 40)
+
+    a = Matrix.from_rows([[1.5, -2.0, 3.0], [0.1, 0.2, 0.3]], dtype="float32")
+    b = Matrix.full(3, 2, 0.5, dtype="float32")
+    assert a.dtype == "float32" and a.data.typecode == 'f' and Matrix(2, 2).dtype == "float64"
+    assert a.data.itemsize * 2 == Matrix(2, 3).data.itemsize
+    # Values are rounded to float32 when stored
+    assert a.get_val_at(1, 0) != 0.1 and abs(a.get_val_at(1, 0) - 0.1) < 1e-7
+
+    results = [a + a, a - 1.0, 2.0 * a, a / a, -a, a == a, a > 0, a + a.row(0), a.T, a.T.copy(),
+               a[:, 1:], Matrix.multiply(a, b), a @ b, Matrix.transpose(a, out=Matrix(3, 2, "float32")),
+               Matrix.scalar_multiply(a.T, 2.0), Matrix.apply(a, lambda xs: xs),
+               ActivationFunctions.relu(a), ActivationFunctions.softmax(a), (lazy(a) * 2 + lazy(a)).eval(), (lazy(a) @ lazy(b)).eval(),
+               Matrix.zeros(1, 1, "float32").fill_(2.0)]
+    assert all(r.dtype == "float32" for r in results)
+    assert (a @ b).to_rows() == Matrix.multiply(a.astype("float64"), b.astype("float64")).astype("float32").to_rows()
+    assert (a + a.T.T).to_rows() == [[2 * v for v in row] for row in a.to_rows()]
+
+    # Mixing with float64 promotes; out= keeps the dtype of out
+    assert (a + Matrix(2, 3)).dtype == "float64" and Matrix.multiply(a, Matrix(3, 1)).dtype == "float64"
+    out = Matrix(2, 2, "float32")
+    Matrix.multiply(a.astype("float64"), b, out=out)
+    assert out.dtype == "float32" and out.get_val_at(0, 0) == 1.25
+    wide = a.astype("float64")
+    wide += a
+    assert wide.dtype == "float64" and wide.get_val_at(0, 2) == 6.0
+
+    # Buffers of either typecode are wrapped without copying
+    from array import array
+    buf = array('f', [1.0, 2.0, 3.0, 4.0])
+    m = Matrix.from_buffer(buf, 2, 2)
+    m.set_val_at(0, 0, 9.0)
+    assert m.dtype == "float32" and buf[0] == 9.0
+    assert Matrix.from_buffer(buf, 2, 2, dtype="float64").dtype == "float64"
+    assert Matrix.from_buffer([1, 2], 1, 2, dtype="float32").dtype == "float32"
+
+    # Files hold float64 values
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "m.bin")
+        a.save(path)
+        loaded = Matrix.load(path, mmap=False)
+        assert loaded.dtype == "float64" and loaded.to_rows() == a.to_rows()
+
+    v = Vector(3, dtype="float32")
+    v.set(0, 0.1)
+    assert v.dtype == "float32" and v.get(0) != 0.1
+    assert all(r.dtype == "float32" for r in (v + 1, v * v, -v, Vector.apply_scalar(v, 2.0),
+                                            ActivationFunctions.tanh(v), a.row(0) @ Vector(3, "float32")))
+    assert (v + Vector(3)).dtype == "float64" and v.astype("float64").get(0) == v.get(0)
+
+    from src.random.sampler import Sampler
+    assert Sampler(0).normal_(Vector(4, "float32")).dtype == "float32"
+
+    for bad in (lambda: Matrix(2, 2, "int8"), lambda: Matrix.full(1, 1, 0.0, "float16"),
+                lambda: a.astype("half"), lambda: Vector(2, "float16")):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    print("✓ Float32 storage tests passed")
+    print()
+
+
+def test_int8_quantization():
+    """Test per-column int8 quantization and the integer-accumulating multiply."""
+    print("Testing Int8 Quantization")
+    print("=" * 40)
+
+    import random
+    from src.math import QuantizedMatrix
+    from src.math.quantize import QMAX
+
+    rng = random.Random(5)
+    W = Matrix.from_buffer([rng.gauss(0, 1) for _ in range(32 * 8)], 32, 8)
+    W.set_val_at(3, 5, 0.0)
+    for i in range(W.rows):
+        W.set_val_at(i, 7, 0.0)  # an all-zero output column
+    q = QuantizedMatrix.quantize(W)
+    assert q.values.typecode == 'b' and max(map(abs, q.values)) == QMAX
+    assert q.scales[7] == 0.0 and q.values[7 * 32:].tolist() == [0] * 32
+
+    # Round-trip error is at most half a quantization step per column
+    d = q.dequantize()
+    for j in range(W.cols):
+        step = q.scales[j]
+        assert all(abs(d.get_val_at(i, j) - W.get_val_at(i, j)) <= step / 2 + 1e-12 for i in range(W.rows))
+    assert q.dequantize("float32").dtype == "float32"
+    # A strided view quantizes like its copy
+    assert QuantizedMatrix.quantize(W.T.T).values == q.values
+
+    # 8 bytes per float64 weight against 1 plus a scale per column
+    assert q.nbytes == 32 * 8 + 8 * 8
+    assert 32 * 8 * 8 / q.nbytes > 6
+
+    x = Matrix.from_buffer([rng.uniform(-1, 1) for _ in range(5 * 32)], 5, 32)
+    x.set_val_at(2, 0, 0.0)
+    for j in range(32):
+        x.set_val_at(4, j, 0.0)
+    exact = x @ W
+    result = x @ q
+    assert result.dtype == "float64" and result.rows == 5 and result.cols == 8
+    top = max(map(abs, exact.flat()))
+    assert all(abs(r - e) < 0.02 * top for r, e in zip(result.flat(), exact.flat()))
+    assert result.row(4).to_rows() == [[0.0] * 8]
+
+    # Outputs are integer dot products scaled once
+    row = x.to_rows()[0]
+    sx = max(map(abs, row)) / QMAX
+    dot = sum(round(v * (QMAX / max(map(abs, row)))) * w for v, w in zip(row, q.values[:32]))
+    assert result.get_val_at(0, 0) == dot * (sx * q.scales[0])
+
+    out = Matrix(5, 8, "float32")
+    assert QuantizedMatrix.multiply(x.astype("float32"), q, out=out) is out
+    assert all(abs(r - e) < 1e-5 * top for r, e in zip(out.flat(), result.flat()))
+
+    for bad in (lambda: QuantizedMatrix.multiply(W, q),
+                lambda: QuantizedMatrix.multiply(x, q, out=Matrix(5, 7)),
+                lambda: QuantizedMatrix(2, 2, [0, 1, 2], [1.0, 1.0]),
+                lambda: QuantizedMatrix(1, 1, [128], [1.0])):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    print("✓ Int8 quantization tests passed")
+    print()
+
+
 def run_all_tests():
     """Run all tests and report results."""
     try:
@@ -341,6 +1346,51 @@ def run_all_tests():
         
         test_matrix_scalar_multiply()
         print("✓ Matrix scalar multiply tests passed")
+
+        test_matrix_constructors()
+        print("✓ Matrix constructor tests passed")
+
+        test_matmul_kernels()
+        print("✓ Matmul kernel tests passed")
+
+        test_parallel_matmul()
+        print("✓ Parallel matmul tests passed")
+
+        test_matrix_inplace_and_out()
+        print("✓ In-place and out= tests passed")
+
+        test_matrix_views()
+        print("✓ Matrix view tests passed")
+
+        test_batched_activation_functions()
+        print("✓ Batched activation tests passed")
+
+        test_binary_format()
+        print("✓ Binary format tests passed")
+
+        test_csv_ingestion()
+        print("✓ CSV ingestion tests passed")
+
+        test_sparse_matrix()
+        print("✓ Sparse matrix tests passed")
+
+        test_lazy_expressions()
+        print("✓ Lazy expression tests passed")
+
+        test_operators_and_broadcasting()
+        print("✓ Operator tests passed")
+
+        test_vector_batch()
+        print("✓ Vector batch tests passed")
+
+        test_linalg()
+        print("✓ Linear algebra tests passed")
+
+        test_float32_storage()
+        print("✓ Float32 storage tests passed")
+
+        test_int8_quantization()
+        print("✓ Int8 quantization tests passed")
         
         print("\n" + "="*50)
         print("ALL TESTS PASSED! 🎉")
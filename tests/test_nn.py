@@ -0,0 +1,175 @@
+"""Tests for nn module."""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.math.activation_functions import ActivationFunctions
+from src.math.matrix import Matrix
+from src.nn import CrossEntropyLoss, Dense, MSELoss, ReLU, Sequential, Sigmoid, Tanh
+from src.random import Sampler
+
+
+def close(a, b, tol=1e-6):
+    return all(abs(x - y) <= tol * max(1.0, abs(y))
+               for row_a, row_b in zip(a.to_rows(), b.to_rows()) for x, y in zip(row_a, row_b))
+
+
+def numeric_grad(f, values, h=1e-6):
+    """Central differences of f() with respect to every entry of a flat buffer."""
+    grads = []
+    for i in range(len(values)):
+        saved = values[i]
+        values[i] = saved + h
+        up = f()
+        values[i] = saved - h
+        down = f()
+        values[i] = saved
+        grads.append((up - down) / (2 * h))
+    return grads
+
+
+def test_dense_forward():
+    """Test the fused forward pass against the separate primitives."""
+    print("Testing Dense Forward")
+    print("=" * 40)
+
+    sampler = Sampler(seed=0)
+    x = sampler.normal_(Matrix(5, 3))
+    for activation in (None, "relu", "sigmoid", "tanh"):
+        layer = Dense(3, 4, activation=activation, seed=1)
+        sampler.normal_(layer.bias)
+        expected = Matrix.multiply(x, layer.weight) + layer.bias
+        if activation is not None:
+            expected = getattr(ActivationFunctions, activation)(expected)
+        out = layer(x)
+        assert close(out, expected)
+        # The output buffer is reused for the same batch size
+        assert layer(x) is out
+        assert layer(x[:2, :]) is not out
+
+    # A transposed view works as input (copy the first result: the output
+    # buffer is overwritten by the second call)
+    layer = Dense(3, 2, seed=0)
+    assert close(layer(x.T.copy().T).copy(), layer(x.copy()))
+
+    try:
+        Dense(4, 2)(x)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    for bad in (lambda: Dense(0, 2), lambda: Dense(2, 2, activation="gelu"),
+                lambda: Dense(2, 2, init="lecun")):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    try:
+        Dense(3, 2).backward(Matrix(1, 2))
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError:
+        pass
+    print("✓ Dense forward tests passed")
+    print()
+
+
+def test_gradients():
+    """Test backward against finite differences of the loss."""
+    print("Testing Layer Gradients")
+    print("=" * 40)
+
+    sampler = Sampler(seed=2)
+    x = sampler.normal_(Matrix(4, 3))
+    y = sampler.normal_(Matrix(4, 2))
+    cases = ((Sequential(Dense(3, 5, seed=3), Tanh(), Dense(5, 2, seed=4)), MSELoss(), y),
+             (Sequential(Dense(3, 5, activation="sigmoid", seed=5), Dense(5, 2, seed=6)), MSELoss(), y),
+             (Sequential(Dense(3, 4, seed=7), Dense(4, 2, seed=8), Sigmoid()), MSELoss(), y),
+             (Sequential(Dense(3, 5, activation="relu", seed=9), Dense(5, 2, seed=10)), CrossEntropyLoss(),
+              Matrix.from_rows([[1, 0], [0, 1], [0.5, 0.5], [0, 1]])))
+    for model, loss, target in cases:
+        sampler.normal_(model.parameters)
+
+        def objective():
+            return loss(model(x), target)
+        objective()
+        input_grad = model.backward(loss.backward(), need_input_grad=True).copy()
+        expected = numeric_grad(objective, model.parameters.data)
+        assert all(abs(g - e) < 1e-5 for g, e in zip(model.gradients.flat(), expected))
+        expected = numeric_grad(objective, x.data)
+        assert all(abs(g - e) < 1e-5 for g, e in zip(input_grad.flat(), expected))
+
+    # Without need_input_grad the first layer skips dLoss/dInput
+    model = cases[0][0]
+    loss = MSELoss()
+    loss(model(x), y)
+    assert model.backward(loss.backward()) is None
+    print("✓ Gradient tests passed")
+    print()
+
+
+def test_sequential_parameters():
+    """Test the contiguous parameter block and activation fusion."""
+    print("Testing Sequential Parameters")
+    print("=" * 40)
+
+    first, second = Dense(3, 4, seed=0), Dense(4, 2, seed=1)
+    weight = first.weight.copy()
+    model = Sequential(first, ReLU(), second)
+    assert first.activation is None and len(model._steps) == 2
+    assert model.num_parameters() == model.parameters.cols == 3 * 4 + 4 + 4 * 2 + 2
+    # Layer parameters are views into the block, initialized from the layers
+    assert first.weight.data is model.parameters.data and close(first.weight, weight)
+    assert second.bias_grad.data is model.gradients.data
+    model.parameters.fill_(0.5)
+    assert first.weight.get_val_at(2, 3) == second.bias.get_val_at(0, 1) == 0.5
+
+    # Fusion leaves the layers unchanged, so they can be reused in another model
+    x = Matrix.from_rows([[0.5, -1.0, 2.0], [1.0, 0.0, -0.5]])
+    for act in (ReLU(), Sigmoid(), Tanh()):
+        dense = Dense(3, 2, seed=0)
+        expected = act(dense(x).copy()).copy()
+        assert close(Sequential(dense, act)(x), expected)
+        assert close(Sequential(dense, act)(x), expected) and dense.activation is None
+
+    # Initialization depends only on the Dense arguments
+    assert close(Dense(3, 4, init="he", seed=0).weight, Dense(3, 4, activation="relu", seed=0).weight)
+    assert close(Sequential(Dense(3, 4, seed=0), ReLU()).parameters,
+                 Sequential(Dense(3, 4, seed=0)).parameters)
+
+    # A standalone activation layer still runs on its own
+    model = Sequential(ReLU(), Dense(2, 1, seed=0))
+    out = model(Matrix.from_rows([[-1.0, 2.0]]))
+    assert out.rows == 1 and len(model._steps) == 2
+
+    # Nested sequentials share the outer block
+    inner = Sequential(Dense(2, 3, seed=0))
+    outer = Sequential(inner, Dense(3, 1, seed=1))
+    assert inner.parameters.data is outer.parameters.data and inner.parameters.cols == 9
+
+    # Training on a linear target drives the loss down with one update per step
+    sampler = Sampler(seed=3)
+    x = sampler.normal_(Matrix(32, 2))
+    y = Matrix.multiply(x, Matrix.from_rows([[2.0], [-1.0]]))
+    model = Sequential(Dense(2, 8, activation="tanh", seed=4), Dense(8, 1, seed=5))
+    loss = MSELoss()
+    start = loss(model(x), y)
+    for _ in range(200):
+        loss(model(x), y)
+        model.backward(loss.backward())
+        model.parameters.add_(model.gradients, -0.05)
+    assert loss(model(x), y) < start / 10
+    print("✓ Sequential parameter tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_dense_forward()
+    test_gradients()
+    test_sequential_parameters()
+    print("ALL NN TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,157 @@
+"""Tests for optim module."""
+
+import sys
+import os
+import math
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.math.matrix import CHUNK, Matrix
+from src.nn import Dense, MSELoss, Sequential
+from src.optim import SGD, Adam, AdamW, RMSProp
+from src.random import Sampler
+
+
+def reference_step(name, p, g, state, t, lr, **opts):
+    """Element-by-element version of each update rule (state is a dict of lists)."""
+    for i in range(len(p)):
+        gi = g[i]
+        wd = opts.get("weight_decay", 0.0)
+        if name == "sgd":
+            gi += wd * p[i]
+            mu = opts.get("momentum", 0.0)
+            if mu:
+                state["v"][i] = mu * state["v"][i] + gi
+                gi = gi + mu * state["v"][i] if opts.get("nesterov") else state["v"][i]
+            p[i] -= lr * gi
+        elif name in ("adam", "adamw"):
+            b1, b2 = 0.9, 0.999
+            if name == "adamw":
+                p[i] -= lr * wd * p[i]
+            else:
+                gi += wd * p[i]
+            state["m"][i] = b1 * state["m"][i] + (1 - b1) * gi
+            state["v"][i] = b2 * state["v"][i] + (1 - b2) * gi * gi
+            m_hat = state["m"][i] / (1 - b1 ** t)
+            v_hat = state["v"][i] / (1 - b2 ** t)
+            p[i] -= lr * m_hat / (math.sqrt(v_hat) + 1e-8)
+        else:
+            gi += wd * p[i]
+            state["v"][i] = 0.99 * state["v"][i] + 0.01 * gi * gi
+            p[i] -= lr * gi / (math.sqrt(state["v"][i]) + 1e-8)
+
+
+def test_update_rules():
+    """Test every optimizer against the element-wise reference."""
+    print("Testing Update Rules")
+    print("=" * 40)
+
+    sampler = Sampler(seed=0)
+    n = CHUNK + 37  # crosses a chunk boundary
+    cases = (("sgd", SGD, {}), ("sgd", SGD, {"momentum": 0.9}),
+             ("sgd", SGD, {"momentum": 0.9, "nesterov": True, "weight_decay": 0.1}),
+             ("adam", Adam, {}), ("adam", Adam, {"weight_decay": 0.1}),
+             ("adamw", AdamW, {"weight_decay": 0.1}), ("rmsprop", RMSProp, {"weight_decay": 0.1}))
+    for name, cls, opts in cases:
+        params = sampler.normal_(Matrix(1, n))
+        grads = Matrix(1, n)
+        optimizer = cls(params, grads, lr=0.05, **opts)
+        expected = list(params.flat())
+        state = {"v": [0.0] * n, "m": [0.0] * n}
+        for t in range(1, 4):
+            sampler.normal_(grads)
+            reference_step(name, expected, list(grads.flat()), state, t, 0.05, **opts)
+            assert optimizer.step() is None
+        assert all(abs(a - b) < 1e-9 for a, b in zip(params.flat(), expected)), (name, opts)
+
+    # Parameters may be a contiguous view part-way into a larger buffer
+    block = Matrix.full(3, 4, 1.0)
+    grads = Matrix.full(2, 4, 0.5)
+    SGD(block[1:, :], grads, lr=0.1).step()
+    assert block.to_rows() == [[1.0] * 4] + [[0.95] * 4] * 2
+
+    # float32 parameters keep float32 state and match the float64 update closely
+    for name, cls, opts in cases:
+        wide = sampler.normal_(Matrix(1, 50))
+        grads = sampler.normal_(Matrix(1, 50))
+        params = wide.astype("float32")
+        optimizer = cls(params, grads.astype("float32"), lr=0.05, **opts)
+        reference = cls(wide, grads, lr=0.05, **opts)
+        for _ in range(3):
+            optimizer.step()
+            reference.step()
+        assert params.dtype == "float32"
+        assert all(a.typecode == 'f' for a in vars(optimizer).values() if hasattr(a, "typecode"))
+        assert all(abs(a - b) < 1e-5 for a, b in zip(params.flat(), wide.flat())), (name, opts)
+    print("✓ Update rule tests passed")
+    print()
+
+
+def test_clipping():
+    """Test gradient clipping by global norm."""
+    print("Testing Gradient Clipping")
+    print("=" * 40)
+
+    params = Matrix(1, 2)
+    grads = Matrix.from_rows([[3.0, 4.0]])
+    optimizer = SGD(params, grads, lr=1.0, max_grad_norm=1.0)
+    assert optimizer.grad_norm() == 5.0
+    assert optimizer.step() == 5.0
+    assert all(abs(a - b) < 1e-6 for a, b in zip(params.flat(), [-0.6, -0.8]))
+    # The gradients themselves are left untouched
+    assert grads.to_rows() == [[3.0, 4.0]]
+
+    # Below the threshold nothing is scaled
+    params.fill_(0.0)
+    optimizer.max_grad_norm = 10.0
+    assert optimizer.step() == 5.0 and params.to_rows() == [[-3.0, -4.0]]
+
+    optimizer.zero_grad()
+    assert grads.to_rows() == [[0.0, 0.0]] and optimizer.grad_norm() == 0.0
+    print("✓ Clipping tests passed")
+    print()
+
+
+def test_training_and_errors():
+    """Test optimizers driving an nn model, and argument validation."""
+    print("Testing Training And Errors")
+    print("=" * 40)
+
+    sampler = Sampler(seed=1)
+    x = sampler.normal_(Matrix(64, 3))
+    y = Matrix.multiply(x, Matrix.from_rows([[1.0], [-2.0], [0.5]]))
+    for cls, lr in ((SGD, 0.05), (Adam, 0.01), (AdamW, 0.01), (RMSProp, 0.005)):
+        model = Sequential(Dense(3, 8, activation="tanh", seed=2), Dense(8, 1, seed=3))
+        optimizer = cls(model.parameters, model.gradients, lr=lr, max_grad_norm=5.0)
+        loss = MSELoss()
+        start = loss(model(x), y)
+        for _ in range(150):
+            loss(model(x), y)
+            model.backward(loss.backward())
+            optimizer.step()
+        assert loss(model(x), y) < start / 5, cls.__name__
+
+    params = Matrix(2, 3)
+    for bad in (lambda: SGD(params, Matrix(3, 2)), lambda: SGD(params.T, params.T.copy()),
+                lambda: SGD(params, Matrix(2, 3), lr=-1.0), lambda: SGD(params, Matrix(2, 3), nesterov=True),
+                lambda: Adam(params, Matrix(2, 3), betas=(0.9, 1.0)),
+                lambda: RMSProp(params, Matrix(2, 3), alpha=1.5),
+                lambda: AdamW(params, Matrix(2, 3), max_grad_norm=-1.0)):
+        try:
+            bad()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    print("✓ Training and error tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_update_rules()
+    test_clipping()
+    test_training_and_errors()
+    print("ALL OPTIM TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,197 @@
+"""Tests for profiler module."""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.autograd import ComputationGraph, Tensor, Value
+from src.loss import Loss
+from src.math.activation_functions import ActivationFunctions
+from src.math.matrix import Matrix
+from src.nn import Dense, MSELoss, ReLU, Sequential
+from src.optim import SGD
+from src.profiler import Profiler, register
+
+
+def test_op_stats():
+    """Test counts, elements, nesting and restoration of the originals."""
+    print("Testing Op Statistics")
+    print("=" * 40)
+
+    originals = {name: Matrix.__dict__[name] for name in ("multiply", "add", "add_")}
+    a, b = Matrix.full(4, 3, 1.0), Matrix.full(3, 5, 2.0)
+    with Profiler() as prof:
+        assert Matrix.__dict__["multiply"] is not originals["multiply"]
+        for _ in range(3):
+            product = Matrix.multiply(a, b)
+        Loss.mse_loss(product, product)
+        ActivationFunctions.relu(product - 1.0)
+        ActivationFunctions.relu(-1.0)
+    for name, original in originals.items():
+        assert Matrix.__dict__[name] is original
+    stats = prof.stats
+    assert stats["Matrix.multiply"].calls == 3
+    assert stats["Matrix.multiply"].elements == 3 * 4 * 3 * 5
+    assert stats["Loss.mse_loss"].elements == 20
+    assert stats["ActivationFunctions.relu"].calls == 2
+    assert stats["Matrix.elementwise"].calls == 1  # through the - operator
+    for op in stats.values():
+        assert 0.0 <= op.self_seconds <= op.total_seconds
+
+    # Outside the block nothing is recorded
+    Matrix.multiply(a, b)
+    assert stats["Matrix.multiply"].calls == 3
+
+    # Nested profiled calls: a Dense forward contains a multiply
+    layer = Dense(3, 2, seed=0)
+    with prof:
+        layer(a)
+        with prof:  # re-entering the same profiler nests
+            layer(a)
+        assert prof.enabled
+    assert not prof.enabled
+    dense = stats["Dense.forward"]
+    assert dense.calls == 2 and dense.self_seconds < dense.total_seconds
+    assert stats["Matrix.multiply"].calls == 5
+
+    try:
+        with prof:
+            with Profiler():
+                pass
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError:
+        pass
+    assert Matrix.__dict__["multiply"] is originals["multiply"]
+
+    # Exceptions are still timed and propagate
+    with prof:
+        try:
+            Matrix.multiply(a, a)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    assert stats["Matrix.multiply"].calls == 6
+
+    # Used as a decorator, statistics accumulate across calls
+    prof = Profiler()
+
+    @prof
+    def step():
+        return Matrix.add(a, a)
+    step()
+    step()
+    assert prof.stats["Matrix.add"].calls == 2 and not prof.enabled
+    print("✓ Op statistics tests passed")
+    print()
+
+
+def test_autograd_and_training():
+    """Test per-node autograd spans and the nn/optim hot paths."""
+    print("Testing Autograd And Training Profiles")
+    print("=" * 40)
+
+    x = Value(2.0)
+    loss = (x * x + 1).tanh()
+    graph = ComputationGraph(loss)
+    with Profiler() as prof:
+        graph.backward()
+        w = Tensor(Matrix.full(3, 2, 0.5), requires_grad=True)
+        (Tensor(Matrix.full(4, 3, 1.0)) @ w).relu().backward()
+    assert abs(x.grad - 4.0 * (1 - loss.data ** 2)) < 1e-12
+    assert w.grad is not None
+    stats = prof.stats
+    assert stats["ComputationGraph.backward"].calls == 1
+    assert stats["Value.*.backward"].calls == 1 and stats["Value.tanh.backward"].calls == 1
+    assert stats["Tensor.backward"].calls == 1
+    assert stats["Tensor.matmul.backward"].calls == 1 and stats["Tensor.relu.backward"].elements == 8
+
+    model = Sequential(Dense(3, 4, seed=0), ReLU(), Dense(4, 1, seed=1))
+    optimizer = SGD(model.parameters, model.gradients, lr=0.1)
+    mse = MSELoss()
+    with Profiler(memory=True) as prof:
+        mse(model(Matrix.full(8, 3, 1.0)), Matrix.full(8, 1, 0.0))
+        model.backward(mse.backward())
+        optimizer.step()
+    assert prof.stats["Optimizer.step"].elements == model.num_parameters()
+    # The first Dense runs fused with the ReLU after it
+    assert prof.stats["Dense.backward"].calls == prof.stats["_FusedDense.backward"].calls == 1
+    assert prof.stats["Dense.forward"].bytes > 0 and prof.stats["_FusedDense.forward"].bytes > 0
+    print("✓ Autograd and training profile tests passed")
+    print()
+
+
+def test_reports():
+    """Test the table, JSON report and Chrome trace output."""
+    print("Testing Profile Reports")
+    print("=" * 40)
+
+    a = Matrix.full(8, 8, 1.0)
+    with Profiler(memory=True) as prof:
+        for _ in range(4):
+            Matrix.multiply(a, a)
+        Matrix.add(a, a)
+    report = prof.report()
+    assert report["memory"] is True
+    assert [op["name"] for op in report["ops"]][0] in ("Matrix.multiply", "Matrix.add")
+    selfs = [op["self_seconds"] for op in report["ops"]]
+    assert selfs == sorted(selfs, reverse=True)
+    assert all(op["elements_per_sec"] > 0 for op in report["ops"])
+    table = prof.table()
+    assert "Matrix.multiply" in table and "KiB" in table
+    assert len(prof.table(limit=1).splitlines()) == 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile.json")
+        prof.save_json(path)
+        with open(path) as fh:
+            assert json.load(fh)["ops"] == report["ops"]
+        path = os.path.join(tmp, "trace.json")
+        prof.save_chrome_trace(path)
+        with open(path) as fh:
+            events = json.load(fh)["traceEvents"]
+    assert len(events) == 5
+    assert all(e["ph"] == "X" and e["dur"] >= 0 and e["ts"] >= 0 for e in events)
+    assert events[0]["args"]["elements"] == 512 and "bytes" in events[0]["args"]
+
+    # Events stop at max_events; statistics keep counting
+    with Profiler(max_events=2) as prof:
+        for _ in range(4):
+            Matrix.add(a, a)
+    assert len(prof.events) == 2 and prof.stats["Matrix.add"].calls == 4
+    prof.reset()
+    assert not prof.stats and not prof.events
+
+    # User functions can be registered as hot paths
+    class Model:
+        def predict(self, x):
+            return Matrix.multiply(x, x)
+    register(Model, "predict")
+    try:
+        with Profiler() as prof:
+            Model().predict(a)
+        assert prof.stats["Model.predict"].calls == 1
+        assert "predict" in Model.__dict__ and Model.predict.__name__ == "predict"
+    finally:
+        from src.profiler import HOT_PATHS
+        HOT_PATHS.pop()
+    try:
+        register(Model, "missing")
+        assert False, "Should have raised AttributeError"
+    except AttributeError:
+        pass
+    print("✓ Report tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_op_stats()
+    test_autograd_and_training()
+    test_reports()
+    print("ALL PROFILER TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,125 @@
+"""Tests for random module."""
+
+import sys
+import os
+import math
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.math.matrix import Matrix
+from src.math.vector import Vector
+from src.random import Sampler
+
+
+def mean_std(values):
+    values = list(values)
+    mean = math.fsum(values) / len(values)
+    return mean, math.sqrt(math.fsum((v - mean) ** 2 for v in values) / len(values))
+
+
+def test_reproducible_streams():
+    """Test seeding, spawned streams and shuffling."""
+    print("Testing Reproducible Streams")
+    print("=" * 40)
+
+    a = Sampler(seed=7).uniform_(Matrix(5, 5)).to_rows()
+    b = Sampler(seed=7).uniform_(Matrix(5, 5)).to_rows()
+    c = Sampler(seed=8).uniform_(Matrix(5, 5)).to_rows()
+    assert a == b and a != c
+
+    # Children depend only on (seed, key), not on the parent's position
+    root = Sampler(seed=7)
+    first = root.spawn(3).normal_values(10)
+    root.random_values(100)
+    assert root.spawn(3).normal_values(10) == first
+    streams = [s.random_values(10) for s in Sampler(seed=7).streams(4)]
+    assert len({tuple(s) for s in streams}) == 4
+    assert [s.seed for s in Sampler(seed=7).streams(4)] == [s.seed for s in root.streams(4)]
+
+    # Unseeded samplers record the seed they drew
+    s = Sampler()
+    assert Sampler(s.seed).random_values(5) == s.random_values(5)
+
+    perm = Sampler(seed=1).permutation(50)
+    assert sorted(perm) == list(range(50)) and perm != list(range(50))
+    assert Sampler(seed=1).shuffle(list(range(50))) == perm
+    print("✓ Reproducible stream tests passed")
+    print()
+
+
+def test_distributions():
+    """Test bulk fills of matrices, views and vectors."""
+    print("Testing Distributions")
+    print("=" * 40)
+    sampler = Sampler(seed=0)
+
+    u = sampler.uniform_(Matrix(100, 100), -2.0, 3.0).flat()
+    assert min(u) >= -2.0 and max(u) < 3.0
+    assert abs(mean_std(u)[0] - 0.5) < 0.05
+
+    mean, std = mean_std(sampler.normal_(Matrix(200, 100), 1.0, 2.0).flat())
+    assert abs(mean - 1.0) < 0.05 and abs(std - 2.0) < 0.05
+    assert len(sampler.normal_values(7)) == 7
+
+    mask = sampler.bernoulli_(Matrix(100, 100), 0.8, scale=1.25).flat()
+    assert set(mask) == {0.0, 1.25}
+    assert abs(list(mask).count(1.25) / 10000 - 0.8) < 0.02
+    try:
+        sampler.bernoulli_(Matrix(2, 2), 1.5)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    # Filling a strided view leaves the rest of the storage alone
+    m = Matrix.full(4, 6, 9.0)
+    sampler.uniform_(m[:, 1:3].T)
+    for row in m.to_rows():
+        assert row[0] == 9.0 and row[3:] == [9.0] * 3
+        assert all(0.0 <= v < 1.0 for v in row[1:3])
+
+    v = sampler.normal_(Vector(11))
+    assert v.size() == 11 and len(set(v.vector)) == 11
+    try:
+        sampler.uniform_([0.0, 0.0])
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    print("✓ Distribution tests passed")
+    print()
+
+
+def test_weight_init():
+    """Test Xavier and He initialization scales."""
+    print("Testing Weight Initialization")
+    print("=" * 40)
+    sampler = Sampler(seed=0)
+
+    w = sampler.xavier_uniform_(Matrix(300, 100))
+    limit = math.sqrt(6.0 / 400)
+    assert max(abs(v) for v in w.flat()) <= limit
+    assert abs(mean_std(w.flat())[1] - limit / math.sqrt(3)) < 0.005
+
+    _, std = mean_std(sampler.xavier_normal_(Matrix(300, 100)).flat())
+    assert abs(std - math.sqrt(2.0 / 400)) < 0.005
+    _, std = mean_std(sampler.he_normal_(Matrix(200, 150)).flat())
+    assert abs(std - math.sqrt(2.0 / 200)) < 0.005
+    w = sampler.he_uniform_(Matrix(200, 150))
+    assert max(abs(v) for v in w.flat()) <= math.sqrt(6.0 / 200)
+    try:
+        sampler.he_normal_(Vector(3))
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    print("✓ Weight initialization tests passed")
+    print()
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    test_reproducible_streams()
+    test_distributions()
+    test_weight_init()
+    print("ALL RANDOM TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    run_all_tests()